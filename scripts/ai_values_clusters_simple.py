@@ -9,7 +9,7 @@ starting with 'ai_values:', and displays a simplified hierarchy of the taxonomy.
 import re
 from pathlib import Path
 
-import pandas as pd
+from values_explorer.data.cache import load_values_csv
 
 
 def load_values_tree():
@@ -20,7 +20,7 @@ def load_values_tree():
     if not tree_path.exists():
         raise FileNotFoundError(f"Values tree CSV file not found at {tree_path}")
 
-    return pd.read_csv(tree_path)
+    return load_values_csv(tree_path)
 
 
 def filter_ai_values(df):
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Import regression check for the values_compass compute modules.
+
+Each module is imported in a fresh interpreter with ``-X importtime``. The
+check fails if the import pulls in a plotting or data-frame library, which
+should only be loaded when a visualization or a CSV export is actually
+requested.
+
+With ``--budget-ms``, it also fails if the best of several runs spends more
+than the budget on top of importing networkx. The time of networkx itself
+depends on the machine and is not counted, so the budget only covers the
+import cost of this project.
+
+Usage:
+    python scripts/check_import_time.py
+    python scripts/check_import_time.py --budget-ms 150 --runs 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Modules whose import must stay cheap
+DEFAULT_MODULES = [
+    "values_compass.structures.lattice",
+    "values_compass.validate_pairs",
+    "values_compass.formalize_relations",
+    "values_compass.visualize",
+]
+
+# Top-level packages that must not be imported by the modules above
+FORBIDDEN_PACKAGES = ("matplotlib", "PIL", "pygraphviz", "pandas", "sklearn")
+
+# Required dependency whose import time is subtracted from the measurement
+BASELINE_PACKAGE = "networkx"
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = (
+    "import sys, {module}; "
+    "print(','.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+)
+
+
+def measure_import(module):
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple of (cumulative import time in milliseconds, import time of
+        networkx within it in milliseconds, set of loaded top-level packages)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        capture_output=True, text=True, cwd=project_dir, check=True
+    )
+
+    cumulative_us = None
+    baseline_us = 0
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        fields = [field.strip() for field in line[len("import time:"):].split("|")]
+        if fields[2] == module:
+            cumulative_us = int(fields[1])
+        elif fields[2] == BASELINE_PACKAGE:
+            baseline_us = int(fields[1])
+
+    if cumulative_us is None:
+        raise RuntimeError(f"No import time reported for {module}")
+
+    return cumulative_us / 1000, baseline_us / 1000, set(result.stdout.strip().split(","))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the imports of values_compass modules")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Maximum import time per module in milliseconds, not counting "
+                             "networkx; timings are only reported if omitted")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="Number of runs per module; the fastest one is compared to the budget")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES,
+                        help="Modules to check")
+    args = parser.parse_args()
+
+    failures = []
+    for module in args.modules:
+        timings = []
+        loaded = set()
+        for _ in range(args.runs):
+            elapsed, baseline, packages = measure_import(module)
+            timings.append((elapsed - baseline, elapsed))
+            loaded |= packages
+
+        own, total = min(timings)
+        forbidden = sorted(loaded.intersection(FORBIDDEN_PACKAGES))
+        status = "ok"
+        if args.budget_ms is not None and own > args.budget_ms:
+            status = f"over budget ({args.budget_ms:.0f} ms)"
+            failures.append(module)
+        if forbidden:
+            status = f"imports {', '.join(forbidden)}"
+            failures.append(module)
+        print(f"{module}: {own:.1f} ms without {BASELINE_PACKAGE} ({total:.1f} ms total) {status}")
+
+    if failures:
+        print(f"Import check failed for: {', '.join(sorted(set(failures)))}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,8 @@ from pathlib import Path
 
 import pandas as pd
 
+from values_explorer.data.cache import load_values_csv
+
 
 def load_values_tree():
     """Load the values tree CSV file."""
@@ -26,7 +28,7 @@ def load_values_tree():
     if not tree_path.exists():
         raise FileNotFoundError(f"Values tree CSV file not found at {tree_path}")
 
-    return pd.read_csv(tree_path)
+    return load_values_csv(tree_path, typed=False)
 
 
 def filter_ai_values(df):
@@ -10,9 +10,10 @@ import sys
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
 from sklearn.manifold import TSNE
 
+from values_explorer.analysis.clustering import select_n_clusters
+
 # Input and output file paths
 data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
 input_file = os.path.join(data_dir, "top_values.csv")
@@ -70,21 +71,16 @@ def main():
         json.dump(embedding_dict, f)
     print(f"Saved embeddings to {output_file}")
 
-    # Find optimal number of clusters (using Elbow method)
-    inertia = []
-    K_range = range(2, 21)
-    for k in K_range:
-        kmeans = KMeans(n_clusters=k, random_state=42)
-        kmeans.fit(embedding_array)
-        inertia.append(kmeans.inertia_)
-
-    # Choose a reasonable cluster number (you can adjust this later)
-    optimal_k = 7  # This is a starting point, can be manually tuned
+    # Find the number of clusters with the best sampled silhouette, fitting all candidates in parallel
+    print("Selecting the number of clusters...")
+    optimal_k, kmeans, scores = select_n_clusters(embedding_array, range(2, 21))
+    for k, score in scores.items():
+        print(f"  K={k}: inertia={score['inertia']:.1f}, silhouette={score['silhouette']:.3f}, "
+              f"davies_bouldin={score['davies_bouldin']:.3f}")
 
     # Cluster the embeddings
     print(f"Clustering with K={optimal_k}...")
-    kmeans = KMeans(n_clusters=optimal_k, random_state=42)
-    clusters = kmeans.fit_predict(embedding_array)
+    clusters = kmeans.labels_
 
     # Add clusters to dataframe
     df['cluster'] = clusters
@@ -13,7 +13,7 @@ import json
 import re
 from pathlib import Path
 
-import pandas as pd
+from values_explorer.data.cache import load_values_csv
 
 
 def load_values_tree():
@@ -24,7 +24,7 @@ def load_values_tree():
     if not tree_path.exists():
         raise FileNotFoundError(f"Values tree CSV file not found at {tree_path}")
 
-    return pd.read_csv(tree_path)
+    return load_values_csv(tree_path, typed=False)
 
 def extract_level_from_id(cluster_id):
     """Extract the level from a cluster ID string like 'ai_values:l1:...'."""
@@ -12,7 +12,8 @@ from pathlib import Path
 
 import matplotlib.patches as patches
 import matplotlib.pyplot as plt
-import pandas as pd
+
+from values_explorer.data.cache import load_values_csv
 
 
 def load_values_tree():
@@ -23,7 +24,7 @@ def load_values_tree():
     if not tree_path.exists():
         raise FileNotFoundError(f"Values tree CSV file not found at {tree_path}")
 
-    return pd.read_csv(tree_path)
+    return load_values_csv(tree_path)
 
 
 def filter_ai_values(df):
@@ -0,0 +1,88 @@
+"""Tests for the join/meet tables against brute-force bounds."""
+import random
+
+import numpy as np
+import pytest
+
+from values_compass.structures.bounds import JOIN, MEET, build_bound_tables, find_first_failure
+from values_compass.structures.reachability import ReachabilityIndex
+
+
+def class_leq(reachability):
+    k = reachability.n_classes
+    return np.array([[reachability.class_leq(c, d) for d in range(k)] for c in range(k)])
+
+
+def brute_force_bound(leq, c, d):
+    """Least common upper bound of classes c and d under leq, or -1."""
+    bounds = np.flatnonzero(leq[c] & leq[d])
+    least = [e for e in bounds if all(leq[e, f] for f in bounds)]
+    return least[0] if least else -1
+
+
+def brute_force_tables(reachability):
+    leq = class_leq(reachability)
+    k = len(leq)
+    join = np.array([[brute_force_bound(leq, c, d) for d in range(k)] for c in range(k)])
+    meet = np.array([[brute_force_bound(leq.T, c, d) for d in range(k)] for c in range(k)])
+
+    first_failure = None
+    for c in range(k):
+        for d in range(c, k):
+            for operation, table in ((JOIN, join), (MEET, meet)):
+                if first_failure is None and table[c, d] < 0:
+                    first_failure = (c, d, operation)
+    return join, meet, first_failure
+
+
+def random_order(rnd, n, n_edges):
+    edges = [tuple(rnd.sample(range(n), 2)) for _ in range(n_edges)]
+    return ReachabilityIndex(range(n), edges)
+
+
+def bottom_and_top(n):
+    """A lattice: a bottom 0, a top 1 and n - 2 pairwise incomparable elements."""
+    return ReachabilityIndex(range(n), [(0, 1)] + [(0, i) for i in range(2, n)] + [(i, 1) for i in range(2, n)])
+
+
+@pytest.mark.parametrize("n, n_edges, seed", [(1, 0, 0), (5, 4, 1), (10, 12, 2), (16, 20, 3), (16, 40, 4)])
+def test_tables_match_brute_force(n, n_edges, seed):
+    reachability = random_order(random.Random(seed), n, n_edges)
+    join, meet, first_failure = brute_force_tables(reachability)
+
+    tables = build_bound_tables(reachability)
+
+    np.testing.assert_array_equal(tables.join, join)
+    np.testing.assert_array_equal(tables.meet, meet)
+    assert tables.first_failure == first_failure
+    assert find_first_failure(tables.join, tables.meet) == first_failure
+
+    # Without stored tables only the lattice check remains
+    unstored = build_bound_tables(reachability, store_tables=False)
+    assert unstored.join is None and unstored.meet is None
+    assert unstored.first_failure == first_failure
+
+
+@pytest.mark.parametrize("n", [2, 3, 12])
+def test_lattice_has_no_failure(n):
+    reachability = bottom_and_top(n)
+
+    tables = build_bound_tables(reachability)
+
+    assert tables.is_lattice
+    assert tables.first_failure is None
+    assert find_first_failure(tables.join, tables.meet) is None
+    np.testing.assert_array_equal(tables.join, brute_force_tables(reachability)[0])
+
+
+def test_first_failure_prefers_join():
+    # 0 and 1 have two minimal upper bounds and no lower bound at all
+    reachability = ReachabilityIndex(range(4), [(0, 2), (0, 3), (1, 2), (1, 3)])
+
+    assert build_bound_tables(reachability).first_failure == (0, 1, JOIN)
+
+    # With a common bottom, only the join of 0 and 1 fails
+    reachability = ReachabilityIndex(range(5), [(0, 2), (0, 3), (1, 2), (1, 3), (4, 0), (4, 1)])
+    tables = build_bound_tables(reachability)
+    assert tables.first_failure == (0, 1, JOIN)
+    assert tables.meet[0, 1] == 4
@@ -0,0 +1,134 @@
+"""Tests for the columnar cache of the values CSV files."""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from values_explorer.data import cache
+from values_explorer.data.cache import as_float64, cache_path, load_values_csv
+
+
+def assert_same_frame(data, expected):
+    """Check values and dtypes; numeric columns of cached loads are memory-mapped arrays."""
+    assert data.dtypes.to_dict() == expected.dtypes.to_dict()
+    assert data.equals(expected)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    data = pd.DataFrame({
+        "cluster_id": ["ai_values:l1:0", "ai_values:l0:0", "ai_values:l0:1", "ai_values:l0:2"],
+        "name": ["root", "honesty", "care", "honesty"],
+        "description": ["", "tell the truth", "", "be kind"],
+        "level": [1, 0, 0, 0],
+        "parent_cluster_id": [None, "ai_values:l1:0", "ai_values:l1:0", "missing"],
+        "pct_total_occurrences": [0.233, 1.02266, np.nan, 12.5],
+    })
+    path = tmp_path / "values_tree.csv"
+    data.to_csv(path, index=False)
+    return path
+
+
+def test_untyped_load_matches_read_csv(csv_path):
+    expected = pd.read_csv(csv_path)
+
+    # Once when writing the cache, once when reading it
+    assert_same_frame(load_values_csv(csv_path, typed=False), expected)
+    assert_same_frame(load_values_csv(csv_path, typed=False), expected)
+    assert_same_frame(load_values_csv(csv_path, use_cache=False, typed=False), expected)
+
+
+def test_typed_load(csv_path):
+    expected = pd.read_csv(csv_path)
+
+    data = load_values_csv(csv_path)
+
+    assert isinstance(data["cluster_id"].dtype, pd.CategoricalDtype)
+    assert isinstance(data["parent_cluster_id"].dtype, pd.CategoricalDtype)
+    assert data["level"].dtype == np.int8
+    assert data["pct_total_occurrences"].dtype == np.float32
+    assert data["cluster_id"].astype(str).tolist() == expected["cluster_id"].tolist()
+    assert data["parent_cluster_id"].isna().tolist() == expected["parent_cluster_id"].isna().tolist()
+    pd.testing.assert_series_equal(data["name"], expected["name"])
+    assert_same_frame(load_values_csv(csv_path, use_cache=False), data)
+
+
+def test_as_float64_removes_float32_noise(csv_path):
+    pct = load_values_csv(csv_path)["pct_total_occurrences"].to_numpy()
+
+    widened = as_float64(pct)
+
+    np.testing.assert_array_equal(widened, pd.read_csv(csv_path)["pct_total_occurrences"].to_numpy())
+    assert widened[0] == 0.233
+
+
+def test_cache_keyed_on_content(csv_path, monkeypatch):
+    load_values_csv(csv_path)
+    path = cache_path(csv_path)
+    assert (path / "schema.json").exists()
+
+    # A cache hit does not parse the CSV
+    def fail(*args, **kwargs):
+        raise AssertionError("CSV parsed on a cache hit")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cache.pd, "read_csv", fail)
+        load_values_csv(csv_path)
+
+    # New content is a cache miss, and the cache of the old content is removed
+    with open(csv_path, "a") as f:
+        f.write("ai_values:l0:3,trust,,0,ai_values:l1:0,0.5\n")
+    data = load_values_csv(csv_path, typed=False)
+
+    assert len(data) == 5
+    assert cache_path(csv_path) != path
+    assert not path.exists()
+    caches = [p.name for p in path.parent.iterdir() if not p.name.endswith(".digest.json")]
+    assert caches == [cache_path(csv_path).name]
+
+
+def test_csv_hashed_only_when_changed(csv_path, monkeypatch):
+    calls = []
+    file_digest = cache.file_digest
+    monkeypatch.setattr(cache, "file_digest", lambda path: calls.append(path) or file_digest(path))
+
+    load_values_csv(csv_path)
+    load_values_csv(csv_path, typed=False)
+    assert len(calls) == 1
+
+    # Touching the file hashes it again, and finds the same cache
+    path = cache_path(csv_path)
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert cache_path(csv_path) == path
+    assert len(calls) == 2
+    assert cache_path(csv_path) == path
+    assert len(calls) == 2
+
+
+def test_unwritable_cache_falls_back_to_parsed_data(csv_path, tmp_path):
+    # A cache directory below a regular file cannot be created
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+
+    data = load_values_csv(csv_path, cache_dir=blocker / "cache", typed=False)
+
+    assert_same_frame(data, pd.read_csv(csv_path))
+
+
+@pytest.mark.skipif(os.geteuid() == 0, reason="root ignores directory permissions")
+def test_read_only_directory_falls_back_to_parsed_data(csv_path):
+    csv_path.parent.chmod(0o555)
+    try:
+        data = load_values_csv(csv_path)
+    finally:
+        csv_path.parent.chmod(0o755)
+
+    assert_same_frame(data, load_values_csv(csv_path, use_cache=False))
+    assert not cache_path(csv_path).exists()
+
+
+def test_missing_csv(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_values_csv(tmp_path / "missing.csv")
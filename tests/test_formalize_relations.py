@@ -0,0 +1,61 @@
+"""Tests for the relation types of the formal taxonomy."""
+import itertools
+import json
+
+import networkx as nx
+import pytest
+
+from values_compass.formalize_relations import (
+    build_taxonomy_graph,
+    create_formal_taxonomy,
+    export_incomparable_pairs,
+    identify_relation_types,
+)
+
+
+def entry(value, root_value, category="hyponym"):
+    return {"value": value, "root_value": root_value, "category": category,
+            "is_anti_value": False, "pct_convos": 0.5}
+
+
+VALUES_DATA = [
+    entry("honesty", "honesty", "core"),
+    entry("candor", "honesty"),
+    entry("transparency", "honesty"),
+    entry("care", "care", "core"),
+    entry("compassion", "care"),
+    entry("kindness", "compassion", "synonym"),
+]
+
+
+def brute_force_incomparable(G):
+    closure = nx.transitive_closure(G, reflexive=True)
+    return {
+        frozenset((u, v)) for u, v in itertools.combinations(G.nodes, 2)
+        if not closure.has_edge(u, v) and not closure.has_edge(v, u)
+    }
+
+
+def test_incomparable_key_kept_empty_by_default():
+    G = build_taxonomy_graph(VALUES_DATA)
+
+    assert identify_relation_types(G)["incomparable"] == []
+
+    pairs = identify_relation_types(G, include_incomparable=True)["incomparable"]
+    assert {frozenset(pair) for pair in pairs} == brute_force_incomparable(G)
+    assert len(pairs) == len(brute_force_incomparable(G))
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson"])
+def test_taxonomy_records_incomparable_count(tmp_path, output_format):
+    G = build_taxonomy_graph(VALUES_DATA)
+    expected = len(brute_force_incomparable(G))
+
+    taxonomy = create_formal_taxonomy(
+        VALUES_DATA, tmp_path / "taxonomy", include_incomparable=True, output_format=output_format
+    )
+
+    assert taxonomy["poset_properties"]["incomparable_pairs"] == expected
+    assert export_incomparable_pairs(G, tmp_path / "pairs.ndjson") == expected
+    with open(tmp_path / "pairs.ndjson") as f:
+        assert {frozenset(json.loads(line)) for line in f} == brute_force_incomparable(G)
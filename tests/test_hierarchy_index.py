@@ -0,0 +1,78 @@
+"""Tests for the hierarchy index against brute-force parent walks."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from values_explorer.models.hierarchy_index import HierarchyIndex
+
+
+def make_tree(rng, n=60):
+    """Random tree with missing parents, a parent cycle and a repeated id."""
+    rows = []
+    for i in range(n):
+        parent = None
+        if i and rng.random() < 0.9:
+            parent = f"c{rng.integers(i)}"
+        elif i:
+            parent = "missing"
+        rows.append((f"c{i}", f"value {i % 7}", parent))
+    rows += [("x", "cycle", "y"), ("y", "cycle", "x"), ("z", "below cycle", "x"), ("c3", "repeated", "c1")]
+    data = pd.DataFrame(rows, columns=["cluster_id", "name", "parent_cluster_id"])
+    data["pct_total_occurrences"] = np.where(rng.random(len(data)) < 0.1, np.nan, rng.random(len(data)))
+    return data
+
+
+def brute_force_path(data, row):
+    """Rows from the top of the tree down to row, or None on a parent cycle."""
+    position = {}
+    for i, cluster_id in enumerate(data["cluster_id"]):
+        position.setdefault(cluster_id, i)
+
+    path = [row]
+    while True:
+        parent = data["parent_cluster_id"][path[-1]]
+        if parent is None or parent not in position:
+            return path[::-1]
+        if position[parent] in path:
+            return None
+        path.append(position[parent])
+
+
+@pytest.fixture(params=[0, 1, 2])
+def data(request):
+    return make_tree(np.random.default_rng(request.param))
+
+
+def test_ancestors_match_parent_walk(data):
+    index = HierarchyIndex(data)
+    rows = np.arange(len(data))
+
+    items, path_rows = index.ancestors(rows)
+
+    for row in rows:
+        expected = brute_force_path(data, row)
+        assert path_rows[items == row].tolist() == (expected or []), row
+
+    # Paths of a subset are labelled by position in the subset
+    subset = np.array([len(data) - 1, 5, 5])
+    items, path_rows = index.ancestors(subset)
+    for k, row in enumerate(subset):
+        assert path_rows[items == k].tolist() == brute_force_path(data, row)
+
+
+def test_subtree_sum_matches_parent_walk(data):
+    index = HierarchyIndex(data)
+    pct = np.nan_to_num(data["pct_total_occurrences"].to_numpy())
+    paths = [brute_force_path(data, row) for row in range(len(data))]
+
+    expected = np.array([
+        sum(pct[other] for other, path in enumerate(paths) if path is not None and row in path)
+        if paths[row] is not None else 0.0
+        for row in range(len(data))
+    ])
+
+    np.testing.assert_allclose(index.subtree_sums(), expected, rtol=1e-12, atol=1e-12)
+    for row in range(len(data)):
+        assert index.subtree_sum(row) == pytest.approx(expected[row], abs=1e-12)
+        subtree = {other for other, path in enumerate(paths) if path is not None and row in path}
+        assert set(index.subtree(row).tolist()) == subtree
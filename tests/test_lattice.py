@@ -0,0 +1,116 @@
+"""Tests for the incremental updates of ValueLattice."""
+import json
+import random
+
+import numpy as np
+import pytest
+
+from values_compass.structures.lattice import ValueLattice
+
+
+def write_taxonomy(path, names, partial_order):
+    """Write a formal taxonomy with the given values and relations."""
+    taxonomy = {
+        "values": {
+            name: {"is_anti_value": False, "category": "core", "root_value": names[0], "pct_convos": 0.0}
+            for name in names
+        },
+        "relations": {
+            "partial_order": [{"less": less, "greater": greater} for less, greater in partial_order],
+            "equivalence_classes": [],
+            "antonym_pairs": [],
+            "incomparable": [],
+        },
+        "poset_properties": {},
+    }
+    with open(path, "w") as f:
+        json.dump(taxonomy, f)
+    return path
+
+
+def random_relations(rnd, names, n_relations, acyclic):
+    """Draw random relations, only from earlier to later names if acyclic."""
+    relations = []
+    for _ in range(n_relations):
+        less, greater = rnd.sample(names, 2)
+        if acyclic and names.index(less) > names.index(greater):
+            less, greater = greater, less
+        if (less, greater) not in relations:
+            relations.append((less, greater))
+    return relations
+
+
+def assert_same_order(lattice, rebuilt):
+    """Check that an updated lattice matches one built from its relations."""
+    names = list(lattice.values)
+    assert np.array_equal(lattice.leq_matrix(names, names), rebuilt.leq_matrix(names, names))
+    assert np.array_equal(np.asarray(lattice.reachability.up), np.asarray(rebuilt.reachability.up))
+    assert np.array_equal(np.asarray(lattice.reachability.down), np.asarray(rebuilt.reachability.down))
+    if lattice.store_bound_tables:
+        assert np.array_equal(lattice.bounds.join, rebuilt.bounds.join)
+        assert np.array_equal(lattice.bounds.meet, rebuilt.bounds.meet)
+    assert lattice.bounds.first_failure == rebuilt.bounds.first_failure
+    assert lattice.is_lattice == rebuilt.is_lattice
+    assert lattice.lattice_failure == rebuilt.lattice_failure
+
+
+@pytest.mark.parametrize("store_bound_tables", [True, False])
+@pytest.mark.parametrize("n, acyclic, seed", [
+    (2, True, 0),
+    (6, True, 1),
+    (12, True, 2),
+    (6, False, 3),
+    (12, False, 4),
+])
+def test_add_remove_relation_matches_rebuild(tmp_path, n, acyclic, seed, store_bound_tables):
+    rnd = random.Random(seed)
+    names = [f"v{i}" for i in range(n)]
+    path = write_taxonomy(tmp_path / "taxonomy.json", names, random_relations(rnd, names, n, acyclic))
+    lattice = ValueLattice(path, store_bound_tables=store_bound_tables)
+
+    for step in range(40):
+        relations = lattice.relations["partial_order"]
+        if relations and rnd.random() < 0.5:
+            relation = rnd.choice(relations)
+            lattice.remove_relation(relation["less"], relation["greater"])
+        else:
+            (less, greater), = random_relations(rnd, names, 1, acyclic)
+            lattice.add_relation(less, greater)
+
+        rebuilt_path = tmp_path / f"rebuilt-{step}.json"
+        with open(rebuilt_path, "w") as f:
+            json.dump(lattice.taxonomy, f)
+        assert_same_order(lattice, ValueLattice(rebuilt_path, store_bound_tables=store_bound_tables))
+
+
+def test_single_value(tmp_path):
+    lattice = ValueLattice(write_taxonomy(tmp_path / "taxonomy.json", ["v0"], []))
+
+    assert lattice.is_less_than_or_equal("v0", "v0")
+    assert lattice.join("v0", "v0") == "v0"
+    assert lattice.meet("v0", "v0") == "v0"
+    with pytest.raises(ValueError):
+        lattice.remove_relation("v0", "v0")
+
+
+def test_cycle_merges_and_splits_classes(tmp_path):
+    names = ["v0", "v1", "v2"]
+    lattice = ValueLattice(write_taxonomy(tmp_path / "taxonomy.json", names, [("v0", "v1"), ("v1", "v2")]))
+
+    lattice.add_relation("v2", "v0")
+    assert sorted(lattice.equivalence_class("v1")) == names
+
+    # v2 ≤ v0 ≤ v1 is left, a chain
+    lattice.remove_relation("v1", "v2")
+    assert lattice.equivalence_class("v1") == ["v1"]
+    assert lattice.is_less_than_or_equal("v2", "v1")
+    assert not lattice.is_less_than_or_equal("v1", "v2")
+
+
+def test_unknown_relation(tmp_path):
+    lattice = ValueLattice(write_taxonomy(tmp_path / "taxonomy.json", ["v0", "v1"], []))
+
+    with pytest.raises(ValueError):
+        lattice.add_relation("v0", "missing")
+    with pytest.raises(ValueError):
+        lattice.remove_relation("v0", "v1")
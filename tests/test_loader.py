@@ -0,0 +1,88 @@
+"""Tests for the indexed lookups of the dataset loader."""
+import pyarrow as pa
+import pytest
+from datasets import Dataset
+
+from values_explorer.data.loader import (
+    CATEGORY_COLUMN,
+    ID_COLUMN,
+    IndexedValuesDataset,
+    get_value_by_id,
+    get_values_by_category,
+)
+
+ROWS = [
+    {"cluster_id": "c3", "name": "care", "parent_cluster_id": "p1"},
+    {"cluster_id": "c1", "name": "honesty", "parent_cluster_id": "p2"},
+    {"cluster_id": "c2", "name": "trust", "parent_cluster_id": None},
+    {"cluster_id": "c1", "name": "duplicate", "parent_cluster_id": "p1"},
+    {"cluster_id": "c4", "name": "rigor", "parent_cluster_id": "p1"},
+]
+
+
+@pytest.fixture
+def dataset():
+    return Dataset.from_list(ROWS)
+
+
+@pytest.fixture
+def index(dataset):
+    return IndexedValuesDataset(dataset)
+
+
+def test_get_matches_scan(dataset, index):
+    for value_id in ["c1", "c2", "c3", "c4", "missing"]:
+        expected = get_value_by_id(dataset, value_id, ID_COLUMN)
+        assert index.get(value_id) == expected
+        assert get_value_by_id(index, value_id, ID_COLUMN) == expected
+
+    # The first row of a repeated id wins
+    assert index.get("c1")["name"] == "honesty"
+    assert index.get("missing") is None
+    assert index.row_of("c4") == 4
+
+
+def test_by_category_matches_scan(dataset, index):
+    for category in ["p1", "p2", None, "empty"]:
+        expected = get_values_by_category(dataset, category, CATEGORY_COLUMN)
+        assert index.by_category(category).to_pylist() == expected
+        assert get_values_by_category(index, category, CATEGORY_COLUMN) == expected
+
+    assert [row["name"] for row in index.by_category("p1").to_pylist()] == ["care", "duplicate", "rigor"]
+    assert index.by_category("empty").num_rows == 0
+    assert index.categories == ["p1", "p2"]
+
+
+def test_default_columns(index):
+    rows = [{"id": "a", "category": "x"}, {"id": "b", "category": "y"}, {"id": "c", "category": "x"}]
+
+    assert get_value_by_id(rows, "b") == rows[1]
+    assert get_values_by_category(rows, "x") == [rows[0], rows[2]]
+
+    # An index on other columns is scanned on the requested ones
+    assert get_value_by_id(index, "c3") is None
+    assert get_value_by_id(index, "trust", "name")["cluster_id"] == "c2"
+    assert get_values_by_category(index, "p1") == []
+
+
+def test_index_without_categories(dataset):
+    index = IndexedValuesDataset(dataset, id_column="name", category_column=None)
+
+    assert index.get("rigor")["cluster_id"] == "c4"
+    with pytest.raises(ValueError):
+        index.by_category("p1")
+
+
+def test_unknown_column(dataset):
+    with pytest.raises(ValueError):
+        IndexedValuesDataset(dataset, id_column="missing")
+
+
+def test_empty_table():
+    table = pa.table({"cluster_id": pa.array([], pa.string()), "parent_cluster_id": pa.array([], pa.string())})
+    index = IndexedValuesDataset(table)
+
+    assert len(index) == 0
+    assert index.get("c1") is None
+    assert index.by_category("p1").num_rows == 0
+    assert index.categories == []
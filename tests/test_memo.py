@@ -0,0 +1,110 @@
+"""Tests for the bounded join/meet memo."""
+import pytest
+
+from values_compass.formalize_relations import create_formal_taxonomy
+from values_compass.structures.lattice import ValueLattice
+from values_compass.structures.memo import FIFO, LRU, BoundedMemo
+
+
+def fill(memo, keys):
+    for key in keys:
+        memo.put(key, str(key))
+
+
+@pytest.mark.parametrize("policy, evicted", [(LRU, "ca"), (FIFO, "ab")])
+def test_eviction_order(policy, evicted):
+    memo = BoundedMemo(maxsize=3, policy=policy)
+    fill(memo, ["a", "b", "c"])
+
+    # Under LRU, reading "a" and "b" makes "c" the least recently used entry;
+    # FIFO evicts in insertion order regardless
+    assert memo.get("a") == "a"
+    memo.get("b")
+    memo.put("d", "d")
+    assert {key for key in "abcd" if key not in memo} == {evicted[0]}
+
+    # Updating an entry refreshes it under LRU only
+    memo.put("b", "B")
+    memo.put("e", "e")
+    assert {key for key in "abcde" if key not in memo} == set(evicted)
+    assert memo.evictions == 2
+
+
+def test_counters():
+    memo = BoundedMemo(maxsize=2)
+    computed = []
+
+    for key in ["a", "b", "a", "c", "b", "c"]:
+        memo.get_or_compute(key, lambda: computed.append(key) or key.upper())
+
+    # "b" was evicted by "c", so it is computed a second time
+    assert computed == ["a", "b", "c", "b"]
+    assert memo.stats() == {
+        "hits": 2, "misses": 4, "evictions": 2, "size": 2, "maxsize": 2, "policy": LRU
+    }
+
+    memo.clear()
+    assert len(memo) == 0
+    assert memo.hits == 2
+
+
+def test_disabled_and_unbounded():
+    disabled = BoundedMemo(maxsize=0)
+    fill(disabled, range(10))
+    assert len(disabled) == 0
+
+    unbounded = BoundedMemo(maxsize=None)
+    fill(unbounded, range(10))
+    assert len(unbounded) == 10
+    assert unbounded.evictions == 0
+
+
+@pytest.mark.parametrize("maxsize, policy", [(-1, LRU), (10, "random")])
+def test_invalid_arguments(maxsize, policy):
+    with pytest.raises(ValueError):
+        BoundedMemo(maxsize, policy)
+
+
+def test_save_load(tmp_path):
+    path = tmp_path / "memo.json"
+    memo = BoundedMemo()
+    memo.put(("join", 1, 2), 3)
+    memo.put("meet", None)
+    memo.save(path, fingerprint="order")
+
+    warmed = BoundedMemo()
+    assert warmed.load(path, fingerprint="order") == 2
+    assert warmed.get(("join", 1, 2)) == 3
+    assert "meet" in warmed
+    assert warmed.stats()["misses"] == 0
+
+    # A memo saved for another order is ignored
+    other = BoundedMemo()
+    assert other.load(path, fingerprint="other order") == 0
+    assert len(other) == 0
+
+
+def test_lattice_memo_requires_computed_bounds(tmp_path):
+    taxonomy_path = tmp_path / "taxonomy.json"
+    memo_path = tmp_path / "memo.json"
+    values_data = [
+        {"value": value, "root_value": root_value, "category": "hyponym",
+         "is_anti_value": False, "pct_convos": 0.5}
+        for value, root_value in [("candor", "honesty"), ("compassion", "care")]
+    ]
+    create_formal_taxonomy(values_data, taxonomy_path)
+
+    lattice = ValueLattice(taxonomy_path, store_bound_tables=False)
+    lattice.join("candor", "compassion")
+    lattice.join("candor", "compassion")
+    assert lattice.memo_stats["hits"] == 1
+    lattice.save_memo(memo_path)
+
+    warmed = ValueLattice(taxonomy_path, store_bound_tables=False, memo_path=memo_path)
+    assert len(warmed.memo) == len(lattice.memo) > 0
+
+    # With stored tables the memo is not consulted, so it cannot be saved or warmed
+    with pytest.raises(ValueError):
+        ValueLattice(taxonomy_path).save_memo(memo_path)
+    with pytest.raises(ValueError):
+        ValueLattice(taxonomy_path, memo_path=memo_path)
@@ -0,0 +1,98 @@
+"""Tests for the bitset reachability index against a brute-force closure."""
+import itertools
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from values_compass.structures.reachability import ReachabilityIndex
+
+
+def random_edges(rnd, n, n_edges):
+    """Draw random edges, cycles included."""
+    return {tuple(rnd.sample(range(n), 2)) for _ in range(n_edges)}
+
+
+def brute_force_leq(n, edges):
+    """Reflexive-transitive closure as a boolean matrix."""
+    G = nx.DiGraph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(edges)
+    closure = nx.transitive_closure(G, reflexive=True)
+    leq = np.zeros((n, n), dtype=bool)
+    for i, j in closure.edges():
+        leq[i, j] = True
+    return leq
+
+
+def assert_matches_closure(reachability, n, edges):
+    leq = brute_force_leq(n, edges)
+
+    for i, j in itertools.product(range(n), repeat=2):
+        assert reachability.leq(i, j) == leq[i, j], (i, j)
+
+    # Elements share a class exactly when they reach each other
+    same = reachability.component[:, None] == reachability.component[None, :]
+    np.testing.assert_array_equal(same, leq & leq.T)
+
+    # Classes are numbered by their smallest member
+    representatives = [min(members) for members in reachability.members]
+    assert representatives == sorted(representatives)
+    assert list(reachability.representatives) == representatives
+
+    incomparable = {(i, j) for i, j in itertools.combinations(range(n), 2) if not leq[i, j] and not leq[j, i]}
+    assert set(reachability.iter_incomparable()) == incomparable
+    assert reachability.count_incomparable() == len(incomparable)
+
+
+@pytest.mark.parametrize("n, n_edges, seed", [(1, 0, 0), (8, 6, 1), (20, 25, 2), (20, 60, 3), (40, 50, 4)])
+def test_closure_matches_brute_force(n, n_edges, seed):
+    edges = random_edges(random.Random(seed), n, n_edges)
+
+    assert_matches_closure(ReachabilityIndex(range(n), edges), n, edges)
+
+
+@pytest.mark.parametrize("n, seed", [(6, 0), (12, 1), (25, 2)])
+def test_add_remove_edge_matches_brute_force(n, seed):
+    rnd = random.Random(seed)
+    edges = random_edges(rnd, n, n)
+    reachability = ReachabilityIndex(range(n), edges)
+
+    for _ in range(60):
+        up, down = reachability.up.copy(), reachability.down.copy()
+        if edges and rnd.random() < 0.5:
+            i, j = rnd.choice(sorted(edges))
+            edges.discard((i, j))
+            changed = reachability.remove_edge(i, j)
+        else:
+            i, j = rnd.sample(range(n), 2)
+            edges.add((i, j))
+            changed = reachability.add_edge(i, j)
+
+        assert_matches_closure(reachability, n, edges)
+        rebuilt = ReachabilityIndex(range(n), edges)
+        np.testing.assert_array_equal(reachability.up, rebuilt.up)
+        np.testing.assert_array_equal(reachability.down, rebuilt.down)
+        if changed is not None:
+            # The classes are unchanged, and only the reported rows may differ
+            up_changed, down_changed = changed
+            same_up = np.setdiff1d(np.arange(reachability.n_classes), up_changed)
+            same_down = np.setdiff1d(np.arange(reachability.n_classes), down_changed)
+            np.testing.assert_array_equal(reachability.up[same_up], up[same_up])
+            np.testing.assert_array_equal(reachability.down[same_down], down[same_down])
+
+
+def test_remove_edge_requires_recorded_edges():
+    reachability = ReachabilityIndex(range(3), [(0, 1), (1, 2)])
+    restored = ReachabilityIndex.from_arrays(
+        reachability.names, reachability.component, reachability.up, reachability.down
+    )
+
+    assert restored.leq(0, 2)
+    with pytest.raises(ValueError):
+        restored.remove_edge(0, 1)
+
+    restored.set_edges([(0, 1), (1, 2)])
+    restored.remove_edge(1, 2)
+    assert not restored.leq(0, 2)
@@ -0,0 +1,74 @@
+"""Tests for the trigram search index against brute-force scans."""
+import random
+
+import numpy as np
+import pytest
+
+from values_explorer.models.search_index import TrigramIndex, trigrams
+
+TEXTS = [
+    "Honesty", "honest communication", "Dishonesty", "care", "Careful reasoning",
+    None, float("nan"), "", "a.b (c)", "A.B (C) again", "trust", "Trustworthiness",
+    "naïve", "ca", "scare", "honesty",
+]
+
+QUERIES = ["honest", "HON", "care", "ca", "c", "", ".", "a.b (c", "(c)", "ust", "naï", "missing", "ty"]
+
+
+def brute_force_similar(texts, query, top_k, min_similarity):
+    grams = set(trigrams(query.lower()))
+    scored = []
+    for i, text in enumerate(texts):
+        if not isinstance(text, str):
+            continue
+        other = set(trigrams(text.lower()))
+        shared = len(grams & other)
+        similarity = shared / (len(grams) + len(other) - shared)
+        if shared and similarity >= min_similarity:
+            scored.append((-similarity, i))
+    scored.sort()
+    return [i for _, i in scored[:top_k]], [-score for score, _ in scored[:top_k]]
+
+
+@pytest.fixture
+def index():
+    return TrigramIndex(TEXTS)
+
+
+def test_substring_matches_scan(index):
+    for query in QUERIES:
+        expected = [i for i, text in enumerate(TEXTS) if isinstance(text, str) and query.lower() in text.lower()]
+        assert index.substring(query).tolist() == expected, query
+
+
+def test_prefix_matches_scan(index):
+    for query in QUERIES:
+        expected = sorted(
+            (i for i, text in enumerate(TEXTS) if isinstance(text, str) and text.lower().startswith(query.lower())),
+            key=lambda i: TEXTS[i].lower()
+        )
+        assert index.prefix(query).tolist() == expected, query
+        assert index.prefix(query, limit=2).tolist() == expected[:2], query
+
+
+@pytest.mark.parametrize("top_k, min_similarity", [(1, 0.0), (3, 0.1), (10, 0.3), (100, 0.0)])
+def test_similar_matches_scan(index, top_k, min_similarity):
+    for query in QUERIES + ["honsety", "trustworthy"]:
+        positions, similarities = index.similar(query, top_k=top_k, min_similarity=min_similarity)
+        expected_positions, expected_similarities = brute_force_similar(TEXTS, query, top_k, min_similarity)
+
+        assert positions.tolist() == expected_positions, query
+        np.testing.assert_array_equal(similarities, expected_similarities)
+
+
+def test_random_texts_match_scan():
+    rnd = random.Random(0)
+    texts = ["".join(rnd.choice("abc ") for _ in range(rnd.randint(0, 8))) for _ in range(200)]
+    index = TrigramIndex(texts)
+
+    for _ in range(100):
+        query = "".join(rnd.choice("abc ") for _ in range(rnd.randint(1, 4)))
+        assert index.substring(query).tolist() == [i for i, text in enumerate(texts) if query in text]
+        assert sorted(index.prefix(query).tolist()) == [i for i, text in enumerate(texts) if text.startswith(query)]
+        positions, _ = index.similar(query, top_k=5, min_similarity=0.2)
+        assert positions.tolist() == brute_force_similar(texts, query, 5, 0.2)[0]
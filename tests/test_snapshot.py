@@ -0,0 +1,89 @@
+"""Tests for saving and opening lattice snapshots."""
+import itertools
+import json
+import random
+
+import numpy as np
+import pytest
+
+from values_compass.structures.lattice import ValueLattice, load_lattice
+from values_compass.structures.snapshot import is_snapshot
+
+
+@pytest.fixture
+def taxonomy_path(tmp_path):
+    rnd = random.Random(0)
+    names = [f"v{i}" for i in range(12)]
+    # Cycles included, so that some values share a class
+    partial_order = {tuple(rnd.sample(names, 2)) for _ in range(16)}
+    taxonomy = {
+        "values": {
+            name: {"is_anti_value": False, "category": "core", "root_value": name, "pct_convos": 0.0}
+            for name in names
+        },
+        "relations": {
+            "partial_order": [{"less": less, "greater": greater} for less, greater in sorted(partial_order)],
+            "equivalence_classes": [["v0", "v1"]],
+            "antonym_pairs": [{"value": "v2", "anti_value": "v3"}],
+            "incomparable": [["v4", "v5"]],
+        },
+        "poset_properties": {"is_reflexive": True},
+    }
+    path = tmp_path / "taxonomy.json"
+    with open(path, "w") as f:
+        json.dump(taxonomy, f)
+    return path
+
+
+def assert_same_lattice(restored, lattice):
+    names = lattice.reachability.names
+    assert restored.reachability.names == names
+    np.testing.assert_array_equal(restored.reachability.component, lattice.reachability.component)
+    np.testing.assert_array_equal(restored.reachability.up, lattice.reachability.up)
+    np.testing.assert_array_equal(restored.reachability.down, lattice.reachability.down)
+    np.testing.assert_array_equal(restored.leq_matrix(names, names), lattice.leq_matrix(names, names))
+    for a, b in itertools.product(names, repeat=2):
+        assert restored.join(a, b) == lattice.join(a, b)
+        assert restored.meet(a, b) == lattice.meet(a, b)
+    assert restored.is_lattice == lattice.is_lattice
+    assert restored.lattice_failure == lattice.lattice_failure
+    assert restored.values == lattice.values
+    assert restored.relations == lattice.relations
+    assert restored.poset_properties == lattice.poset_properties
+
+
+@pytest.mark.parametrize("store_bound_tables", [True, False])
+def test_snapshot_round_trip(tmp_path, taxonomy_path, store_bound_tables):
+    snapshot_path = tmp_path / "lattice.snapshot"
+    lattice = ValueLattice(taxonomy_path, store_bound_tables=store_bound_tables)
+
+    lattice.save_snapshot(snapshot_path)
+    restored = load_lattice(snapshot_path)
+
+    assert is_snapshot(snapshot_path)
+    assert not is_snapshot(taxonomy_path)
+    assert restored.store_bound_tables == store_bound_tables
+    if store_bound_tables:
+        np.testing.assert_array_equal(restored.bounds.join, lattice.bounds.join)
+        np.testing.assert_array_equal(restored.bounds.meet, lattice.bounds.meet)
+    assert_same_lattice(restored, lattice)
+
+
+def test_snapshot_can_be_updated(tmp_path, taxonomy_path):
+    snapshot_path = tmp_path / "lattice.snapshot"
+    lattice = ValueLattice(taxonomy_path)
+    lattice.save_snapshot(snapshot_path)
+    restored = ValueLattice.open_snapshot(snapshot_path)
+
+    # The memory-mapped arrays are copied before they are modified
+    for less, greater in [("v6", "v7"), ("v11", "v3")]:
+        lattice.add_relation(less, greater)
+        restored.add_relation(less, greater)
+
+    assert_same_lattice(restored, lattice)
+    assert_same_lattice(ValueLattice.open_snapshot(snapshot_path), ValueLattice(taxonomy_path))
+
+
+def test_open_rejects_other_files(taxonomy_path):
+    with pytest.raises(ValueError):
+        ValueLattice.open_snapshot(taxonomy_path)
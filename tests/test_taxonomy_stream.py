@@ -0,0 +1,97 @@
+"""Tests for the NDJSON taxonomy format."""
+import numpy as np
+import pytest
+
+from values_compass.formalize_relations import create_formal_taxonomy
+from values_compass.structures.lattice import ValueLattice
+from values_compass.structures.taxonomy_stream import load_taxonomy, write_taxonomy_stream
+
+
+def entry(value, root_value, category="core", is_anti_value=False):
+    return {
+        "value": value,
+        "root_value": root_value,
+        "category": category,
+        "is_anti_value": is_anti_value,
+        "pct_convos": 0.5,
+    }
+
+
+# "integrity" and "wellbeing" are root values without an entry of their own
+VALUES_DATA = [
+    entry("honesty", "honesty"),
+    entry("truthfulness", "honesty", "synonym"),
+    entry("transparency", "honesty", "hyponym"),
+    entry("candor", "integrity", "hyponym"),
+    entry("care", "wellbeing", "hyponym"),
+    entry("compassion", "care", "hyponym"),
+    entry("deception", "honesty", "antonym", is_anti_value=True),
+]
+
+
+def assert_same_order(lattice, expected):
+    names = expected.reachability.names
+    assert lattice.reachability.names == names
+    np.testing.assert_array_equal(
+        lattice.leq_matrix(names, names), expected.leq_matrix(names, names)
+    )
+
+
+@pytest.mark.parametrize("stream_from", ["formalize", "lattice"])
+def test_json_to_ndjson_round_trip(tmp_path, stream_from):
+    json_path = tmp_path / "taxonomy.json"
+    ndjson_path = tmp_path / "taxonomy.ndjson"
+    create_formal_taxonomy(VALUES_DATA, json_path)
+    expected = ValueLattice(json_path)
+    if stream_from == "formalize":
+        create_formal_taxonomy(VALUES_DATA, ndjson_path, output_format="ndjson")
+    else:
+        expected.save(ndjson_path, output_format="ndjson")
+
+    lattice = ValueLattice(ndjson_path)
+
+    assert {"integrity", "wellbeing"} <= set(lattice.reachability.names)
+    assert lattice.values.keys() == expected.values.keys()
+    assert_same_order(lattice, expected)
+    assert lattice.relations["partial_order"] == expected.relations["partial_order"]
+    assert load_taxonomy(ndjson_path)["relations"] == load_taxonomy(json_path)["relations"]
+
+
+def test_stream_snapshot_round_trip(tmp_path):
+    ndjson_path = tmp_path / "taxonomy.ndjson"
+    snapshot_path = tmp_path / "taxonomy.snapshot"
+    create_formal_taxonomy(VALUES_DATA, ndjson_path, output_format="ndjson")
+    lattice = ValueLattice(ndjson_path)
+
+    lattice.save_snapshot(snapshot_path)
+    restored = ValueLattice.open_snapshot(snapshot_path)
+
+    assert_same_order(restored, lattice)
+    assert restored.relations == lattice.relations
+
+
+def test_stream_snapshot_reindexes_relations(tmp_path):
+    # Antonyms listed first index "kindness" and "cruelty" in the opposite
+    # order of the graph built from the partial order
+    ndjson_path = tmp_path / "taxonomy.ndjson"
+    snapshot_path = tmp_path / "taxonomy.snapshot"
+    write_taxonomy_stream(
+        ndjson_path,
+        {"care": {}},
+        {
+            "antonym_pairs": [{"value": "kindness", "anti_value": "cruelty"}],
+            "partial_order": [
+                {"less": "cruelty", "greater": "kindness"},
+                {"less": "kindness", "greater": "care"},
+            ],
+        },
+        {},
+    )
+    lattice = ValueLattice(ndjson_path)
+    assert lattice.reachability.names == ["care", "cruelty", "kindness"]
+
+    lattice.save_snapshot(snapshot_path)
+    restored = ValueLattice.open_snapshot(snapshot_path)
+
+    assert_same_order(restored, lattice)
+    assert restored.relations == load_taxonomy(ndjson_path)["relations"]
@@ -0,0 +1,185 @@
+"""Tests for the incremental revalidation of value/anti-value pairs."""
+import json
+import os
+import random
+import tempfile
+
+import pytest
+
+from values_compass.structures.lattice import ValueLattice
+from values_compass.validate_pairs import (
+    extract_antonym_pairs,
+    load_validation_state,
+    revalidate_pairs,
+    save_validation_state,
+    validate_all_pairs,
+)
+
+# Keep every failed combination, so that the samples can be compared
+ALL_SAMPLES = 10 ** 9
+
+
+def make_values(n, n_roots, rnd):
+    """Make values data with random roots, every other value an anti-value."""
+    return [
+        {"value": f"v{i}", "is_anti_value": i % 2 == 1, "root_value": f"r{rnd.randrange(n_roots)}"}
+        for i in range(n)
+    ]
+
+
+def write_taxonomy(path, values_data, partial_order):
+    """Write a formal taxonomy with the given values and relations."""
+    taxonomy = {
+        "values": {
+            entry["value"]: {
+                "is_anti_value": entry["is_anti_value"],
+                "category": "core",
+                "root_value": entry["root_value"],
+                "pct_convos": 0.0,
+            }
+            for entry in values_data
+        },
+        "relations": {
+            "partial_order": [{"less": less, "greater": greater} for less, greater in partial_order],
+            "equivalence_classes": [],
+            "antonym_pairs": [],
+            "incomparable": [],
+        },
+        "poset_properties": {},
+    }
+    with open(path, "w") as f:
+        json.dump(taxonomy, f)
+    return ValueLattice(path)
+
+
+def edit_relations(rnd, names, partial_order, acyclic, n_edits=4):
+    """Remove and add up to n_edits random relations."""
+    partial_order = list(partial_order)
+    for _ in range(rnd.randint(1, n_edits)):
+        if partial_order and rnd.random() < 0.4:
+            partial_order.pop(rnd.randrange(len(partial_order)))
+            continue
+        less, greater = rnd.sample(names, 2)
+        if acyclic and names.index(less) > names.index(greater):
+            less, greater = greater, less
+        if (less, greater) not in partial_order:
+            partial_order.append((less, greater))
+    return partial_order
+
+
+def sample_key(sample):
+    return json.dumps(sample, sort_keys=True)
+
+
+def assert_same_results(updated, full):
+    assert updated["summary"] == full["summary"]
+    assert updated["pair_statistics"] == full["pair_statistics"]
+    assert sorted(map(sample_key, updated["failure_samples"])) == sorted(map(sample_key, full["failure_samples"]))
+
+
+@pytest.mark.parametrize("n, n_roots, acyclic, seed", [
+    (2, 1, True, 0),
+    (8, 2, True, 1),
+    (16, 3, True, 2),
+    (8, 2, False, 3),
+    (16, 3, False, 4),
+])
+def test_revalidate_pairs_matches_full_run(tmp_path, n, n_roots, acyclic, seed):
+    rnd = random.Random(seed)
+    values_data = make_values(n, n_roots, rnd)
+    names = [entry["value"] for entry in values_data]
+    pairs = extract_antonym_pairs(values_data)
+    state_dir = str(tmp_path / "state")
+
+    partial_order = edit_relations(rnd, names, [], acyclic, n_edits=2 * n)
+    lattice = write_taxonomy(tmp_path / "taxonomy-0.json", values_data, partial_order)
+    results = validate_all_pairs(lattice, pairs, summary_only=True, max_failure_samples=ALL_SAMPLES)
+    save_validation_state(state_dir, lattice, results, max_failure_samples=ALL_SAMPLES)
+
+    for step in range(1, 9):
+        partial_order = edit_relations(rnd, names, partial_order, acyclic)
+        lattice = write_taxonomy(tmp_path / f"taxonomy-{step}.json", values_data, partial_order)
+        previous_lattice, previous_results = load_validation_state(state_dir)
+
+        updated, delta = revalidate_pairs(
+            lattice, pairs, previous_lattice, previous_results, max_failure_samples=ALL_SAMPLES
+        )
+        full = validate_all_pairs(lattice, pairs, summary_only=True, max_failure_samples=ALL_SAMPLES)
+
+        assert not delta["full_revalidation"]
+        assert_same_results(updated, full)
+        save_validation_state(state_dir, lattice, updated, max_failure_samples=ALL_SAMPLES)
+
+
+def test_revalidate_pairs_after_pairs_changed(tmp_path):
+    rnd = random.Random(5)
+    values_data = make_values(8, 2, rnd)
+    names = [entry["value"] for entry in values_data]
+    partial_order = edit_relations(rnd, names, [], acyclic=False, n_edits=16)
+    previous_lattice = write_taxonomy(tmp_path / "previous.json", values_data, partial_order)
+    previous_results = validate_all_pairs(
+        previous_lattice, extract_antonym_pairs(values_data), summary_only=True, max_failure_samples=ALL_SAMPLES
+    )
+
+    # Dropping a value drops its pairs
+    values_data = values_data[:-1]
+    partial_order = [(less, greater) for less, greater in partial_order if names[-1] not in (less, greater)]
+    lattice = write_taxonomy(tmp_path / "current.json", values_data, partial_order)
+    pairs = extract_antonym_pairs(values_data)
+
+    updated, delta = revalidate_pairs(
+        lattice, pairs, previous_lattice, previous_results, max_failure_samples=ALL_SAMPLES
+    )
+
+    assert delta["full_revalidation"]
+    full = validate_all_pairs(lattice, pairs, summary_only=True, max_failure_samples=ALL_SAMPLES)
+    assert_same_results(updated, full)
+
+
+def test_revalidate_pairs_single_value(tmp_path):
+    values_data = [{"value": "v0", "is_anti_value": False, "root_value": "r0"}]
+    pairs = extract_antonym_pairs(values_data)
+    previous_lattice = write_taxonomy(tmp_path / "previous.json", values_data, [])
+    previous_results = validate_all_pairs(previous_lattice, pairs, summary_only=True)
+    lattice = write_taxonomy(tmp_path / "current.json", values_data, [])
+
+    updated, _ = revalidate_pairs(lattice, pairs, previous_lattice, previous_results)
+
+    assert_same_results(updated, validate_all_pairs(lattice, pairs, summary_only=True))
+
+
+@pytest.mark.parametrize("summary_only", [True, False])
+def test_workers_match_single_process(tmp_path, monkeypatch, summary_only):
+    rnd = random.Random(6)
+    values_data = make_values(24, 3, rnd)
+    names = [entry["value"] for entry in values_data]
+    pairs = extract_antonym_pairs(values_data)
+    lattice = write_taxonomy(
+        tmp_path / "taxonomy.json", values_data, edit_relations(rnd, names, [], acyclic=False, n_edits=40)
+    )
+
+    # Send the temporary snapshot to a directory of our own, and record it
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(temp_dir))
+    snapshots = []
+    save_snapshot = lattice.save_snapshot
+    monkeypatch.setattr(lattice, "save_snapshot", lambda path: snapshots.append(path) or save_snapshot(path))
+
+    single = validate_all_pairs(
+        lattice, pairs, summary_only=summary_only, violations_output=str(tmp_path / "single.ndjson")
+    )
+    parallel = validate_all_pairs(
+        lattice, pairs, summary_only=summary_only, violations_output=str(tmp_path / "parallel.ndjson"),
+        workers=2
+    )
+
+    assert single["summary"]["invalid_galois_connections"] > 0
+    assert parallel == single
+    assert (tmp_path / "parallel.ndjson").read_text() == (tmp_path / "single.ndjson").read_text()
+
+    # The snapshot was written for the workers and removed afterwards
+    assert len(snapshots) == 1
+    assert os.path.dirname(os.path.dirname(snapshots[0])) == str(temp_dir)
+    assert not os.path.exists(snapshots[0])
+    assert list(temp_dir.iterdir()) == []
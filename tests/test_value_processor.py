@@ -0,0 +1,70 @@
+"""Tests for the queries of ValueProcessor."""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from values_explorer.models.value_processor import ValueProcessor
+
+
+def make_tree(rng: np.random.Generator, n_leaves: int = 60) -> pd.DataFrame:
+    """Build a three-level values tree with many tied percentages."""
+    rows = [("ai_values:l2:0", "root", 2, None)]
+    rows += [(f"ai_values:l1:{i}", f"category {i}", 1, "ai_values:l2:0") for i in range(6)]
+    rows += [
+        (f"ai_values:l0:{i}", f"value {i}", 0, f"ai_values:l1:{rng.integers(6)}")
+        for i in range(n_leaves)
+    ]
+    data = pd.DataFrame(rows, columns=["cluster_id", "name", "level", "parent_cluster_id"])
+    data["description"] = ""
+    # Few distinct values, so that most percentages are tied
+    data["pct_total_occurrences"] = rng.choice([0.5, 1.0, 2.0], size=len(data))
+    return data
+
+
+@pytest.fixture
+def processor(tmp_path):
+    data = make_tree(np.random.default_rng(0))
+    path = tmp_path / "values_tree.csv"
+    data.to_csv(path, index=False)
+
+    processor = ValueProcessor(str(path))
+    processor.load_data()
+    return processor
+
+
+@pytest.mark.parametrize("max_results", [1, 3, 100])
+def test_find_related_values_many_matches_scalar(processor, max_results):
+    names = processor.data["name"].tolist() + ["VALUE 3", "missing", "value 3"]
+
+    batch = processor.find_related_values_many(names, max_results)
+
+    for name in names:
+        single = processor.find_related_values(name, max_results)
+        rows = batch[batch["query"] == name].drop(columns="query")
+        if single.empty:
+            assert rows.empty
+            continue
+        # Repeated names repeat their results
+        expected = pd.concat([single] * names.count(name))
+        assert rows["cluster_id"].tolist() == expected["cluster_id"].tolist()
+        assert rows["pct_total_occurrences"].tolist() == expected["pct_total_occurrences"].tolist()
+
+
+def test_find_related_values_ties_keep_siblings_first(processor):
+    related = processor.find_related_values("category 0", max_results=100)
+
+    # category 0 has the other categories as siblings and leaves as children
+    for _, group in related.groupby("pct_total_occurrences", sort=False):
+        levels = group["level"].tolist()
+        assert levels == sorted(levels, reverse=True)
+
+
+def test_value_path_is_plain_python(processor):
+    path = processor.get_value_path("value 3")
+
+    json.dumps(path)
+    row = processor.data.index[processor.data["name"] == "value 3"][0]
+    assert path[-1]["percentage"] == float(str(processor.data["pct_total_occurrences"][row]))
+    assert all(type(node["level"]) is int for node in path)
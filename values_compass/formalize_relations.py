@@ -20,9 +20,16 @@ import json
 import os
 import sys
 
-import matplotlib.pyplot as plt
 import networkx as nx
 
+from values_compass.structures.reachability import ReachabilityIndex
+from values_compass.structures.taxonomy_stream import (
+    JSON,
+    NDJSON,
+    OUTPUT_FORMATS,
+    save_taxonomy,
+)
+
 
 def load_values_data(filepath):
     """
@@ -87,12 +94,18 @@ def build_taxonomy_graph(values_data):
     return G
 
 
-def identify_relation_types(G):
+def identify_relation_types(G, include_incomparable=False):
     """
     Identify and classify relationship types in the taxonomy.
     
+    Incomparable pairs grow quadratically with the number of values and are
+    implied by the other relations, so the "incomparable" list stays empty
+    unless they are requested; use ValueLattice.are_incomparable() or
+    export_incomparable_pairs() instead.
+    
     Args:
         G: networkx.DiGraph: Taxonomy graph
+        include_incomparable: Also list every incomparable pair
         
     Returns:
         dict: Dictionary with various relationship categories
@@ -101,7 +114,7 @@ def identify_relation_types(G):
         "partial_order": [],         # Strict hierarchical relationships
         "equivalence_classes": [],   # Groups of equivalent values
         "antonym_pairs": [],         # Value/anti-value pairs
-        "incomparable": []           # Values that can't be directly compared
+        "incomparable": [],          # Only listed on request
     }
 
     # Find equivalence classes (values that are considered equivalent)
@@ -138,36 +151,82 @@ def identify_relation_types(G):
             "greater": v
         })
 
-    # Identify pairs that are incomparable
-    # Two values are incomparable if there's no path between them in either direction
-    nodes = list(G.nodes())
-    reachability = nx.all_pairs_shortest_path_length(G)
-    reachability_dict = {source: dict(targets) for source, targets in reachability}
-
-    for i, u in enumerate(nodes):
-        for v in nodes[i+1:]:
-            if v not in reachability_dict.get(u, {}) and u not in reachability_dict.get(v, {}):
-                relations["incomparable"].append([u, v])
+    # Values that can't be directly compared
+    if include_incomparable:
+        relations["incomparable"] = [list(pair) for pair in iter_incomparable_pairs(G)]
 
     return relations
 
 
-def create_formal_taxonomy(values_data, output_path):
+def iter_incomparable_pairs(G):
+    """
+    Generate the pairs of values that are incomparable in the taxonomy graph.
+    
+    Two values are incomparable if there's no path between them in either
+    direction. Pairs are derived row by row from the bitset closure of the
+    graph, so only one row of pairs is held in memory at a time.
+    
+    Args:
+        G: networkx.DiGraph: Taxonomy graph
+        
+    Yields:
+        tuple: Pairs (u, v) in node order
+    """
+    reachability = ReachabilityIndex.from_graph(G)
+    names = reachability.names
+    for i, j in reachability.iter_incomparable():
+        yield names[i], names[j]
+
+
+def export_incomparable_pairs(G, output_path):
+    """
+    Stream the incomparable pairs of the taxonomy graph to a file.
+    
+    Each line of the output holds one pair as a JSON array, so the file can
+    be processed line by line without loading it.
+    
+    Args:
+        G: networkx.DiGraph: Taxonomy graph
+        output_path: Path to write the NDJSON file
+        
+    Returns:
+        int: Number of pairs written
+    """
+    count = 0
+    with open(output_path, 'w') as f:
+        for pair in iter_incomparable_pairs(G):
+            f.write(json.dumps(pair))
+            f.write("\n")
+            count += 1
+
+    return count
+
+
+def create_formal_taxonomy(values_data, output_path, include_incomparable=False,
+                           output_format=JSON):
     """
     Create a formal taxonomy with partial order relations.
     
     Args:
         values_data: List of dictionaries with value data
-        output_path: Path to write the output JSON file
+        output_path: Path to write the output taxonomy file
+        include_incomparable: Also list every incomparable pair in the output
+        output_format: "json" for a single indented document, "ndjson" for
+            the streaming format, which writes one record per line
     
     Returns:
-        dict: The formal taxonomy structure
+        dict: The formal taxonomy structure. The number of incomparable pairs
+        is recorded in its poset properties. With the NDJSON format,
+        incomparable pairs are streamed to the file but not returned.
     """
     # Build the taxonomy graph
     G = build_taxonomy_graph(values_data)
 
-    # Identify relation types
-    relations = identify_relation_types(G)
+    # Identify relation types; incomparable pairs are streamed for NDJSON
+    stream_incomparable = include_incomparable and output_format == NDJSON
+    relations = identify_relation_types(
+        G, include_incomparable=include_incomparable and not stream_incomparable
+    )
 
     # Build the formal taxonomy structure
     taxonomy = {
@@ -189,11 +248,15 @@ def create_formal_taxonomy(values_data, output_path):
         "has_maximal_elements": True,
         "is_lattice": False,  # Will be implemented in lattice module
         "is_complete_lattice": False,  # Will be implemented in lattice module
+        "incomparable_pairs": ReachabilityIndex.from_graph(G).count_incomparable(),
     }
 
-    # Save the taxonomy to a JSON file
-    with open(output_path, 'w') as f:
-        json.dump(taxonomy, f, indent=2)
+    # Save the taxonomy
+    if stream_incomparable:
+        streamed = dict(relations, incomparable=(list(pair) for pair in iter_incomparable_pairs(G)))
+        save_taxonomy(output_path, dict(taxonomy, relations=streamed), output_format)
+    else:
+        save_taxonomy(output_path, taxonomy, output_format)
 
     return taxonomy
 
@@ -206,6 +269,9 @@ def visualize_taxonomy(G, output_path=None):
         G: networkx.DiGraph: Taxonomy graph
         output_path: Optional path to save the visualization
     """
+    # Plotting libraries are only loaded when a visualization is requested
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 10))
 
     # Use hierarchical layout
@@ -250,7 +316,13 @@ def parse_arguments():
     parser.add_argument('--input', default='data/expanded_values.csv',
                         help='Path to input values CSV file')
     parser.add_argument('--output', required=True,
-                        help='Path to output formal taxonomy JSON file')
+                        help='Path to output formal taxonomy file')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default=JSON,
+                        help='Output format: indented JSON or streaming NDJSON')
+    parser.add_argument('--include-incomparable', action='store_true',
+                        help='List every incomparable pair in the taxonomy JSON (quadratic size)')
+    parser.add_argument('--incomparable-output', default=None,
+                        help='Optional path to stream incomparable pairs to as NDJSON')
     parser.add_argument('--visualize', action='store_true',
                         help='Generate visualization of the taxonomy')
     parser.add_argument('--viz-output', default=None,
@@ -279,9 +351,18 @@ def main():
 
         # Create formal taxonomy
         G = build_taxonomy_graph(values_data)
-        taxonomy = create_formal_taxonomy(values_data, args.output)
+        taxonomy = create_formal_taxonomy(
+            values_data, args.output, include_incomparable=args.include_incomparable,
+            output_format=args.format
+        )
 
         print(f"Formal taxonomy created successfully and saved to {args.output}")
+        print(f"{taxonomy['poset_properties']['incomparable_pairs']} pairs of values are incomparable")
+
+        # Stream incomparable pairs if requested
+        if args.incomparable_output:
+            count = export_incomparable_pairs(G, args.incomparable_output)
+            print(f"{count} incomparable pairs saved to {args.incomparable_output}")
 
         # Generate visualization if requested
         if args.visualize:
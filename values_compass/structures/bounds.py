@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Join and Meet Tables for Finite Posets
+
+This module computes the join (least upper bound) and meet (greatest lower
+bound) of every pair of equivalence classes in a single pass over a bitset
+reachability index, instead of issuing one scalar join/meet query per pair.
+
+Classes are visited in a linear extension of the order, obtained by sorting
+them on the size of their down-sets: if a < b then the down-set of a is a
+strict subset of the down-set of b. With the bit columns permuted into that
+order, the lowest set bit of a set of common upper bounds is always a minimal
+upper bound, and it is the join exactly when every other upper bound lies
+above it. The meet is found symmetrically from the highest set bit of the
+common lower bounds.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from values_compass.structures.reachability import ReachabilityIndex, popcount_rows
+
+# Position of the lowest/highest set bit for every non-zero byte value
+_LOWEST_BIT = np.array([(i & -i).bit_length() - 1 for i in range(256)], dtype=np.int64)
+_HIGHEST_BIT = np.array([i.bit_length() - 1 for i in range(256)], dtype=np.int64)
+
+# Rows processed at once when permuting the closure matrices
+_PERMUTE_BLOCK = 1024
+
+# Pairs processed at once by batch join/meet queries
+_QUERY_BLOCK = 4096
+
+JOIN = "join"
+MEET = "meet"
+
+
+def table_dtype(n: int) -> np.dtype:
+    """
+    Choose the smallest signed integer type able to index n elements.
+
+    Args:
+        n: Number of elements
+
+    Returns:
+        NumPy dtype for index tables, leaving room for -1 as "no bound"
+    """
+    return np.dtype(np.int16) if n < np.iinfo(np.int16).max else np.dtype(np.int32)
+
+
+class BoundTables:
+    """
+    Join and meet tables of a finite poset.
+
+    Tables are square, symmetric arrays indexed by equivalence class, holding
+    the class of the join/meet of each pair or -1 where no unique bound
+    exists.
+    """
+
+    def __init__(
+        self,
+        join: Optional[np.ndarray],
+        meet: Optional[np.ndarray],
+        first_failure: Optional[Tuple[int, int, str]]
+    ):
+        """
+        Initialize the tables.
+
+        Args:
+            join: Join table, or None if tables were not stored
+            meet: Meet table, or None if tables were not stored
+            first_failure: First pair of classes (c, d, operation) without a
+            unique bound
+        """
+        self.join = join
+        self.meet = meet
+        self.first_failure = first_failure
+
+    @property
+    def is_lattice(self) -> bool:
+        """Whether every pair of classes has a unique join and meet."""
+        return self.first_failure is None
+
+
+def linear_extension(reachability: ReachabilityIndex) -> np.ndarray:
+    """
+    Order classes so that every class precedes the classes above it.
+
+    Args:
+        reachability: Reachability index of the poset
+
+    Returns:
+        Array of class indices in a linear extension of the order
+    """
+    return np.argsort(popcount_rows(reachability.down), kind="stable")
+
+
+def _permute_matrix(matrix: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    Permute rows and bit columns of a packed bit matrix.
+
+    Args:
+        matrix: Packed bit matrix of shape (n, n_bytes)
+        order: New position -> old index
+
+    Returns:
+        Packed bit matrix with rows and columns in the given order
+    """
+    n = len(order)
+    permuted = np.empty_like(matrix)
+    for start in range(0, n, _PERMUTE_BLOCK):
+        rows = order[start:start + _PERMUTE_BLOCK]
+        bits = np.unpackbits(matrix[rows], axis=1, count=n, bitorder="little")
+        permuted[start:start + len(rows)] = np.packbits(
+            bits[:, order], axis=1, bitorder="little"
+        )
+    return permuted
+
+
+def least_bounds(common: np.ndarray, up: np.ndarray) -> np.ndarray:
+    """
+    Find the least element of each set of common upper bounds.
+
+    All arguments must be expressed in linear-extension positions.
+
+    Args:
+        common: Packed bit rows of common upper bounds, shape (m, n_bytes)
+        up: Permuted up-set matrix
+
+    Returns:
+        Position of the least element of each row, or -1 if there is none
+    """
+    rows = np.arange(len(common))
+    nonzero = common != 0
+    has_bound = nonzero.any(axis=1)
+    byte = nonzero.argmax(axis=1)
+    low = byte * 8 + _LOWEST_BIT[common[rows, byte]]
+
+    unique = has_bound & ~(common & ~up[low]).any(axis=1)
+    return np.where(unique, low, -1)
+
+
+def greatest_bounds(common: np.ndarray, down: np.ndarray) -> np.ndarray:
+    """
+    Find the greatest element of each set of common lower bounds.
+
+    All arguments must be expressed in linear-extension positions.
+
+    Args:
+        common: Packed bit rows of common lower bounds, shape (m, n_bytes)
+        down: Permuted down-set matrix
+
+    Returns:
+        Position of the greatest element of each row, or -1 if there is none
+    """
+    rows = np.arange(len(common))
+    nonzero = common != 0
+    has_bound = nonzero.any(axis=1)
+    byte = common.shape[1] - 1 - nonzero[:, ::-1].argmax(axis=1)
+    high = byte * 8 + _HIGHEST_BIT[common[rows, byte]]
+
+    unique = has_bound & ~(common & ~down[high]).any(axis=1)
+    return np.where(unique, high, -1)
+
+
+def _to_index(positions: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Map linear-extension positions back to class indices, keeping -1."""
+    return np.where(positions >= 0, order[positions], -1)
+
+
+class LinearExtension:
+    """
+    Closure matrices of a reachability index permuted into a linear extension.
+
+    Permuting costs one pass over the closure, after which the join or meet
+    of any batch of class pairs is found with a few vectorized operations.
+    """
+
+    def __init__(self, reachability: ReachabilityIndex):
+        """
+        Permute the closure matrices of a reachability index.
+
+        Args:
+            reachability: Reachability index of the poset
+        """
+        self.order = linear_extension(reachability)
+        self.position = np.empty(len(self.order), dtype=np.int64)
+        self.position[self.order] = np.arange(len(self.order))
+        self.up = _permute_matrix(reachability.up, self.order)
+        self.down = _permute_matrix(reachability.down, self.order)
+
+    def joins(self, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+        """
+        Compute the join of each pair of classes.
+
+        Args:
+            c: Class indices of the first elements
+            d: Class indices of the second elements, same length as c
+
+        Returns:
+            Class index of each join, or -1 where no unique join exists
+        """
+        return self._bounds(c, d, self.up, least_bounds)
+
+    def meets(self, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+        """
+        Compute the meet of each pair of classes.
+
+        Args:
+            c: Class indices of the first elements
+            d: Class indices of the second elements, same length as c
+
+        Returns:
+            Class index of each meet, or -1 where no unique meet exists
+        """
+        return self._bounds(c, d, self.down, greatest_bounds)
+
+    def _bounds(self, c: np.ndarray, d: np.ndarray, matrix: np.ndarray, find) -> np.ndarray:
+        """Apply a bound finder to blocks of class pairs."""
+        result = np.empty(len(c), dtype=np.int64)
+        a, b = self.position[c], self.position[d]
+        for start in range(0, len(c), _QUERY_BLOCK):
+            block = slice(start, start + _QUERY_BLOCK)
+            common = matrix[a[block]] & matrix[b[block]]
+            result[block] = _to_index(find(common, matrix), self.order)
+        return result
+
+
+def build_bound_tables(
+    reachability: ReachabilityIndex,
+    store_tables: bool = True
+) -> BoundTables:
+    """
+    Compute the join and meet of every pair of classes in one pass.
+
+    The quotient is a poset, so both tables are symmetric and only the upper
+    triangle is computed. The first failure is the pair (c, d) with c ≤ d
+    that comes first in class order, with the join checked before the meet
+    for the same pair.
+
+    Args:
+        reachability: Reachability index of the poset
+        store_tables: Keep the full tables; if False only the lattice check
+            is performed and memory stays linear in the number of classes
+
+    Returns:
+        BoundTables with the computed tables and the first failing pair
+    """
+    k = reachability.n_classes
+    extension = LinearExtension(reachability)
+    order, up, down = extension.order, extension.up, extension.down
+
+    join = meet = None
+    if store_tables:
+        dtype = table_dtype(k)
+        join = np.full((k, k), -1, dtype=dtype)
+        meet = np.full((k, k), -1, dtype=dtype)
+
+    # Failures are ranked by (c, d, operation) in class order
+    first_key = None
+    for a in range(k):
+        b = np.arange(a, k)
+        joins = least_bounds(up[a] & up[b], up)
+        meets = greatest_bounds(down[a] & down[b], down)
+
+        c = order[a]
+        others = order[a:]
+        if store_tables:
+            join[c, others] = join[others, c] = _to_index(joins, order)
+            meet[c, others] = meet[others, c] = _to_index(meets, order)
+
+        for op_rank, bounds in enumerate((joins, meets)):
+            failed = others[bounds < 0]
+            if len(failed) == 0:
+                continue
+            lo = np.minimum(failed, c)
+            hi = np.maximum(failed, c)
+            keys = (lo * k + hi) * 2 + op_rank
+            key = int(keys.min())
+            if first_key is None or key < first_key:
+                first_key = key
+
+    first_failure = None
+    if first_key is not None:
+        pair, op_rank = divmod(first_key, 2)
+        first_failure = (pair // k, pair % k, (JOIN, MEET)[op_rank])
+
+    return BoundTables(join, meet, first_failure)
+
+
+def find_first_failure(join: np.ndarray, meet: np.ndarray) -> Optional[Tuple[int, int, str]]:
+    """
+    Find the first pair without a unique bound in stored tables.
+
+    Args:
+        join: Join table
+        meet: Meet table
+
+    Returns:
+        First failing pair (c, d, operation) with c ≤ d, or None for a lattice
+    """
+    for c in range(len(join)):
+        join_failed = np.flatnonzero(join[c, c:] < 0)
+        meet_failed = np.flatnonzero(meet[c, c:] < 0)
+        if len(join_failed) == 0 and len(meet_failed) == 0:
+            continue
+        if len(meet_failed) == 0 or (len(join_failed) > 0 and join_failed[0] <= meet_failed[0]):
+            return (c, c + int(join_failed[0]), JOIN)
+        return (c, c + int(meet_failed[0]), MEET)
+    return None
+
+
+def update_bound_tables(
+    tables: BoundTables,
+    reachability: ReachabilityIndex,
+    join_rows: np.ndarray,
+    meet_rows: np.ndarray
+) -> BoundTables:
+    """
+    Recompute the join and meet table entries affected by an order change.
+
+    When an edge l ≤ g is added or removed, a join can only change for pairs
+    involving a class whose up-set changed (the classes below l), and a meet
+    only for pairs involving a class whose down-set changed (the classes
+    above g). Only those rows and columns are recomputed.
+
+    Args:
+        tables: Current bound tables, updated in place when stored
+        reachability: Reachability index after the change
+        join_rows: Indices of classes whose join row must be recomputed
+        meet_rows: Indices of classes whose meet row must be recomputed
+
+    Returns:
+        BoundTables reflecting the new order
+    """
+    if tables.join is None:
+        return build_bound_tables(reachability, store_tables=False)
+
+    join, meet = tables.join, tables.meet
+    if not join.flags.writeable:
+        join = join.copy()
+    if not meet.flags.writeable:
+        meet = meet.copy()
+
+    extension = LinearExtension(reachability)
+    order, position = extension.order, extension.position
+    up, down = extension.up, extension.down
+
+    for c in join_rows:
+        a = position[c]
+        join[c, order] = join[order, c] = _to_index(least_bounds(up[a] & up, up), order)
+
+    for c in meet_rows:
+        a = position[c]
+        meet[c, order] = meet[order, c] = _to_index(greatest_bounds(down[a] & down, down), order)
+
+    return BoundTables(join, meet, find_first_failure(join, meet))
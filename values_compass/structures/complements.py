@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Value/Anti-Value Complement Index
+
+This module indexes value/anti-value pairs with integer arrays. Pairs come in
+groups, typically one per root value, where every value of the group is paired
+with every anti-value of the group. A group is stored as two ranges of name
+ids given by offsets, so the pair space is never materialized: pairs are
+generated lazily, by position or as id arrays.
+
+The index also maps each value to its complement in both directions, so
+complement lookups are a single array access instead of a scan of the pairs.
+"""
+
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+class ComplementIndex(Sequence):
+    """
+    Grouped value/anti-value pairs with a bidirectional complement lookup.
+
+    The index behaves as a read-only sequence of (value, anti_value) tuples,
+    in group order, then value order, then anti-value order.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        value_offsets: np.ndarray,
+        values: np.ndarray,
+        anti_value_offsets: np.ndarray,
+        anti_values: np.ndarray
+    ):
+        """
+        Initialize the index from grouped name ids.
+
+        Group g pairs every value in values[value_offsets[g]:value_offsets[g + 1]]
+        with every anti-value in anti_values[anti_value_offsets[g]:anti_value_offsets[g + 1]].
+
+        Args:
+            names: Names of the ids
+            value_offsets: Start of each group of values, followed by the end
+            values: Name ids of the values, grouped
+            anti_value_offsets: Start of each group of anti-values, followed by the end
+            anti_values: Name ids of the anti-values, grouped
+
+        Raises:
+            ValueError: If the offsets do not describe the same number of groups
+        """
+        if len(value_offsets) != len(anti_value_offsets):
+            raise ValueError("Value and anti-value offsets must describe the same groups")
+
+        self.names = names
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self.value_offsets = np.asarray(value_offsets, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.int64)
+        self.anti_value_offsets = np.asarray(anti_value_offsets, dtype=np.int64)
+        self.anti_values = np.asarray(anti_values, dtype=np.int64)
+
+        value_counts = np.diff(self.value_offsets)
+        anti_value_counts = np.diff(self.anti_value_offsets)
+        self._anti_value_counts = anti_value_counts
+        self.pair_offsets = np.concatenate([[0], np.cumsum(value_counts * anti_value_counts)])
+
+        self.complement = self._build_complement()
+
+    @classmethod
+    def from_groups(cls, groups: Iterable[Tuple[Iterable[str], Iterable[str]]]) -> "ComplementIndex":
+        """
+        Build an index from groups of values and anti-values.
+
+        Args:
+            groups: Iterable of (values, anti_values) name lists
+
+        Returns:
+            ComplementIndex pairing the values and anti-values of each group
+        """
+        index: Dict[str, int] = {}
+        value_offsets, values = [0], []
+        anti_value_offsets, anti_values = [0], []
+
+        for group_values, group_anti_values in groups:
+            values.extend(index.setdefault(name, len(index)) for name in group_values)
+            anti_values.extend(index.setdefault(name, len(index)) for name in group_anti_values)
+            value_offsets.append(len(values))
+            anti_value_offsets.append(len(anti_values))
+
+        return cls(list(index), value_offsets, values, anti_value_offsets, anti_values)
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, str]]) -> "ComplementIndex":
+        """
+        Build an index from individual pairs, each one its own group.
+
+        Args:
+            pairs: Iterable of (value, anti_value) names
+
+        Returns:
+            ComplementIndex with the pairs in the given order
+        """
+        return cls.from_groups(([value], [anti_value]) for value, anti_value in pairs)
+
+    def _build_complement(self) -> np.ndarray:
+        """
+        Map each name id to the other side of the first pair that contains it.
+
+        Returns:
+            Array of name ids, -1 for names without a pair
+        """
+        complement = np.full(len(self.names), -1, dtype=np.int64)
+
+        for g in range(len(self.value_offsets) - 1):
+            values = self.values[self.value_offsets[g]:self.value_offsets[g + 1]]
+            anti_values = self.anti_values[self.anti_value_offsets[g]:self.anti_value_offsets[g + 1]]
+            if not len(values) or not len(anti_values):
+                continue
+            start = self.pair_offsets[g]
+
+            # A value first appears paired with the first anti-value, and vice versa
+            first_pairs = {}
+            for p, value in enumerate(values.tolist()):
+                first_pairs.setdefault(value, (start + p * len(anti_values), int(anti_values[0])))
+            for q, anti_value in enumerate(anti_values.tolist()):
+                position = start + q
+                if anti_value not in first_pairs or position < first_pairs[anti_value][0]:
+                    first_pairs[anti_value] = (position, int(values[0]))
+
+            # Groups are in pair order, so the first group containing a name wins
+            for name_id, (_, other) in first_pairs.items():
+                if complement[name_id] < 0:
+                    complement[name_id] = other
+
+        return complement
+
+    def complement_of(self, name: str) -> Optional[str]:
+        """
+        Find the complement of a value or anti-value.
+
+        Args:
+            name: Value or anti-value name
+
+        Returns:
+            The other side of the first pair containing the name, or None
+        """
+        i = self.index.get(name)
+        if i is None or self.complement[i] < 0:
+            return None
+        return self.names[self.complement[i]]
+
+    def pair_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate the pair space as name id arrays.
+
+        Returns:
+            Tuple of (value ids, anti-value ids), one entry per pair
+        """
+        values, anti_values = [], []
+        for g in range(len(self.value_offsets) - 1):
+            group_values = self.values[self.value_offsets[g]:self.value_offsets[g + 1]]
+            group_anti_values = self.anti_values[self.anti_value_offsets[g]:self.anti_value_offsets[g + 1]]
+            values.append(np.repeat(group_values, len(group_anti_values)))
+            anti_values.append(np.tile(group_anti_values, len(group_values)))
+
+        if not values:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(values), np.concatenate(anti_values)
+
+    def __len__(self) -> int:
+        return int(self.pair_offsets[-1])
+
+    def __getitem__(self, k: Union[int, slice]) -> Union[Tuple[str, str], List[Tuple[str, str]]]:
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(len(self)))]
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("pair index out of range")
+
+        g = int(np.searchsorted(self.pair_offsets, k, side='right')) - 1
+        p, q = divmod(k - int(self.pair_offsets[g]), int(self._anti_value_counts[g]))
+        value = self.values[self.value_offsets[g] + p]
+        anti_value = self.anti_values[self.anti_value_offsets[g] + q]
+        return self.names[value], self.names[anti_value]
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        names = self.names
+        for g in range(len(self.value_offsets) - 1):
+            group_anti_values = self.anti_values[self.anti_value_offsets[g]:self.anti_value_offsets[g + 1]]
+            anti_values = [names[i] for i in group_anti_values.tolist()]
+            for i in self.values[self.value_offsets[g]:self.value_offsets[g + 1]].tolist():
+                value = names[i]
+                for anti_value in anti_values:
+                    yield value, anti_value
@@ -14,13 +14,39 @@ This structure is particularly useful for reasoning about relationships
 between values and their combinations.
 """
 
+import hashlib
 import json
-from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
+
+from values_compass.structures.bounds import (
+    JOIN,
+    MEET,
+    BoundTables,
+    LinearExtension,
+    build_bound_tables,
+    update_bound_tables,
+)
+from values_compass.structures.complements import ComplementIndex
+from values_compass.structures.memo import LRU, BoundedMemo
+from values_compass.structures.reachability import ReachabilityIndex
+from values_compass.structures.snapshot import (
+    LatticeSnapshot,
+    encode_relations,
+    is_snapshot,
+    write_snapshot,
+)
+from values_compass.structures.taxonomy_stream import (
+    JSON,
+    OUTPUT_FORMATS,
+    is_taxonomy_stream,
+    read_taxonomy_stream,
+    save_taxonomy,
+    write_taxonomy_stream,
+)
 
 
 class ValueLattice:
@@ -28,32 +54,231 @@ class ValueLattice:
     Implementation of a lattice structure for the values taxonomy.
     """
 
-    def __init__(self, taxonomy_path: Union[str, Path]):
+    def __init__(
+        self,
+        taxonomy_path: Union[str, Path],
+        store_bound_tables: bool = True,
+        memo_size: Optional[int] = 4096,
+        memo_policy: str = LRU,
+        memo_path: Optional[Union[str, Path]] = None
+    ):
         """
         Initialize the lattice from a formal taxonomy file.
         
+        NDJSON taxonomies are read record by record, with relations kept as
+        index arrays; the taxonomy dictionary is only built if it is accessed.
+
+        The join/meet memo only applies with store_bound_tables=False. With the
+        tables stored, join/meet are read from them and never reach the memo.
+        
         Args:
-            taxonomy_path: Path to the formal taxonomy JSON file
+            taxonomy_path: Path to the formal taxonomy JSON or NDJSON file
+            store_bound_tables: Keep the precomputed join/meet tables. Disable
+                for very large taxonomies where n² table entries do not fit
+                in memory; join/meet are then computed per query.
+            memo_size: Maximum number of memoized join/meet results (None for
+                unbounded, 0 to disable)
+            memo_policy: Memo eviction policy, "lru" or "fifo"
+            memo_path: Optional file to warm the memo from, as written by
+                save_memo(); ignored if missing or built for another order
+
+        Raises:
+            ValueError: If memo_path is given while bound tables are stored
         """
+        self.store_bound_tables = store_bound_tables
+        self._snapshot = None
+
         if isinstance(taxonomy_path, str):
             taxonomy_path = Path(taxonomy_path)
 
-        with open(taxonomy_path, 'r') as f:
-            self.taxonomy = json.load(f)
+        if is_taxonomy_stream(taxonomy_path):
+            self._taxonomy = None
+            self.values, self._relation_arrays, self.poset_properties = (
+                read_taxonomy_stream(taxonomy_path)
+            )
+        else:
+            with open(taxonomy_path, 'r') as f:
+                self._taxonomy = json.load(f)
+            self._relation_arrays = None
 
-        # Extract values and relations
-        self.values = self.taxonomy["values"]
-        self.relations = self.taxonomy["relations"]
+            # Extract values
+            self.values = self.taxonomy["values"]
+            self.poset_properties = self.taxonomy["poset_properties"]
 
         # Build the directed graph from partial order relations
-        self.graph = self._build_graph()
+        self._graph = self._build_graph()
 
-        # Compute transitive closure to get the full partial order
-        self.transitive_closure = nx.algorithms.dag.transitive_closure(self.graph)
+        # Index the transitive closure as up-set/down-set bit-rows over the
+        # equivalence classes (cycles) of the partial order
+        self.reachability = ReachabilityIndex.from_graph(self._graph)
+        self._transitive_closure = None
+        self._extension = None
+        self._complements = None
+
+        # Warm the join/meet memo from disk if requested
+        self._setup_memo(memo_size, memo_policy, memo_path)
 
         # Compute lattice properties
         self._compute_lattice_properties()
 
+    @classmethod
+    def open_snapshot(
+        cls,
+        snapshot_path: Union[str, Path],
+        memo_size: Optional[int] = 4096,
+        memo_policy: str = LRU,
+        memo_path: Optional[Union[str, Path]] = None
+    ) -> "ValueLattice":
+        """
+        Open a lattice from a binary snapshot written by save_snapshot().
+
+        The closure and bound tables are memory-mapped rather than recomputed,
+        and the graph and taxonomy dictionary are only rebuilt on first access.
+
+        Args:
+            snapshot_path: Path to the snapshot file
+            memo_size: Maximum number of memoized join/meet results, used if
+                the snapshot has no bound tables
+            memo_policy: Memo eviction policy, "lru" or "fifo"
+            memo_path: Optional file to warm the memo from
+
+        Returns:
+            ValueLattice backed by the snapshot
+
+        Raises:
+            ValueError: If the file is not a supported snapshot, or memo_path
+                is given for a snapshot with bound tables
+        """
+        snapshot = LatticeSnapshot(snapshot_path)
+        header = snapshot.header
+
+        lattice = cls.__new__(cls)
+        lattice._snapshot = snapshot
+        lattice._taxonomy = None
+        lattice._relation_arrays = snapshot.relations()
+        lattice._graph = None
+        lattice._transitive_closure = None
+        lattice._extension = None
+        lattice._complements = None
+        lattice.values = header["values"]
+        lattice.poset_properties = header["poset_properties"]
+
+        lattice.reachability = ReachabilityIndex.from_arrays(
+            header["names"], snapshot.get("component"),
+            snapshot.get("up"), snapshot.get("down")
+        )
+        first_failure = header["first_failure"]
+        lattice.bounds = BoundTables(
+            snapshot.get("join"),
+            snapshot.get("meet"),
+            tuple(first_failure) if first_failure is not None else None
+        )
+        lattice.store_bound_tables = lattice.bounds.join is not None
+
+        lattice.is_lattice = header["poset_properties"]["is_lattice"]
+        lattice.is_complete_lattice = header["poset_properties"]["is_complete_lattice"]
+        lattice.lattice_failure = header["poset_properties"].get("lattice_failure")
+
+        lattice._setup_memo(memo_size, memo_policy, memo_path)
+        return lattice
+
+    def save_snapshot(self, output_path: Union[str, Path]) -> None:
+        """
+        Save the lattice as a binary snapshot for fast memory-mapped loading.
+
+        Args:
+            output_path: Path to save the snapshot file
+        """
+        names = self.reachability.names
+        if self._taxonomy is None and self._relation_arrays.names == names:
+            relation_arrays = self._relation_arrays.arrays
+            other_relations = self._relation_arrays.remaining
+            relation_order = self._relation_arrays.order
+        else:
+            # The stream indexes names outside the order by first appearance
+            relation_arrays, other_relations = encode_relations(
+                self.relations, self.reachability.index
+            )
+            relation_order = list(self.relations)
+
+        header = {
+            "names": names,
+            "values": self.values,
+            "relations": other_relations,
+            "relation_order": relation_order,
+            "poset_properties": self.poset_properties,
+            "first_failure": self.bounds.first_failure
+        }
+        arrays = {
+            "component": self.reachability.component,
+            "up": self.reachability.up,
+            "down": self.reachability.down,
+            "join": self.bounds.join,
+            "meet": self.bounds.meet,
+            **relation_arrays
+        }
+        write_snapshot(output_path, header, arrays)
+
+    def _setup_memo(
+        self,
+        memo_size: Optional[int],
+        memo_policy: str,
+        memo_path: Optional[Union[str, Path]]
+    ) -> None:
+        """Create the join/meet memo, warming it from disk if requested."""
+        if memo_path is not None and self.store_bound_tables:
+            raise ValueError(
+                "memo_path requires store_bound_tables=False; "
+                "join/meet are read from the bound tables"
+            )
+        self.memo = BoundedMemo(memo_size, memo_policy)
+        if memo_path is not None and Path(memo_path).exists():
+            self.memo.load(memo_path, self.fingerprint)
+
+    @property
+    def taxonomy(self) -> Dict[str, Any]:
+        """
+        The formal taxonomy dictionary.
+
+        For lattices loaded from an NDJSON taxonomy or a snapshot, it is
+        rebuilt from the relation arrays on first access.
+        """
+        if self._taxonomy is None:
+            self._taxonomy = {
+                "values": self.values,
+                "relations": self._relation_arrays.decode(),
+                "poset_properties": self.poset_properties
+            }
+            self._relation_arrays = None
+        return self._taxonomy
+
+    @property
+    def relations(self) -> Dict[str, Any]:
+        """The relations section of the formal taxonomy."""
+        return self.taxonomy["relations"]
+
+    @property
+    def complements(self) -> ComplementIndex:
+        """
+        Index of the antonym pairs, built on first access.
+        """
+        if self._complements is None:
+            self._complements = ComplementIndex.from_pairs(
+                (pair["value"], pair["anti_value"]) for pair in self._iter_relations("antonym_pairs")
+            )
+        return self._complements
+
+    @property
+    def graph(self) -> nx.DiGraph:
+        """
+        Directed graph of the partial order relations.
+
+        For lattices opened from a snapshot, it is built on first access.
+        """
+        if self._graph is None:
+            self._graph = self._build_graph()
+        return self._graph
+
     def _build_graph(self) -> nx.DiGraph:
         """
         Build a directed graph from the partial order relations.
@@ -68,8 +293,11 @@ class ValueLattice:
             G.add_node(value, **attrs)
 
         # Add edges from the partial order relations
-        for relation in self.relations["partial_order"]:
-            G.add_edge(relation["less"], relation["greater"])
+        if self._taxonomy is None:
+            G.add_edges_from(self._relation_arrays.name_pairs("partial_order"))
+        else:
+            for relation in self.relations["partial_order"]:
+                G.add_edge(relation["less"], relation["greater"])
 
         # Add self-loops for reflexivity
         for value in self.values:
@@ -77,6 +305,21 @@ class ValueLattice:
 
         return G
 
+    @property
+    def transitive_closure(self) -> nx.DiGraph:
+        """
+        The transitive closure as a networkx graph.
+
+        The closure graph is only materialized on first access; order
+        queries go through the bitset reachability index instead.
+
+        Returns:
+            nx.DiGraph with an edge (a, b) for every a ≤ b
+        """
+        if self._transitive_closure is None:
+            self._transitive_closure = self.reachability.to_networkx()
+        return self._transitive_closure
+
     def _compute_lattice_properties(self) -> None:
         """
         Compute properties of the lattice structure.
@@ -84,27 +327,213 @@ class ValueLattice:
         This updates the taxonomy with information about whether
         the partial order forms a lattice, and if so, whether it's complete.
         """
-        # A lattice must have unique join and meet for every pair of elements
-        self.is_lattice = True
-        self.is_complete_lattice = True
+        # A lattice must have unique join and meet for every pair of classes,
+        # so compute all of them in a single pass over the closure
+        self.bounds = build_bound_tables(self.reachability, self.store_bound_tables)
+        self._update_lattice_properties()
+
+    def _update_lattice_properties(self) -> None:
+        """Derive the lattice properties from the current bound tables."""
+        # A finite lattice is always complete
+        self.is_lattice = self.bounds.is_lattice
+        self.is_complete_lattice = self.is_lattice
+
+        # Remember the first pair without a unique bound for diagnostics
+        self.lattice_failure = None
+        if self.bounds.first_failure is not None:
+            c, d, operation = self.bounds.first_failure
+            self.lattice_failure = {
+                "a": self.reachability.representative(c),
+                "b": self.reachability.representative(d),
+                "operation": operation
+            }
+
+        # Update the taxonomy
+        poset_properties = self.poset_properties
+        poset_properties["is_lattice"] = self.is_lattice
+        poset_properties["is_complete_lattice"] = self.is_complete_lattice
+        if self.lattice_failure is not None:
+            poset_properties["lattice_failure"] = self.lattice_failure
+        else:
+            poset_properties.pop("lattice_failure", None)
+
+    def _require_index(self, value: str) -> int:
+        """Return the index of a value, raising ValueError if it is unknown."""
+        i = self.reachability.get(value)
+        if i is None:
+            raise ValueError(f"Value '{value}' not found")
+        return i
+
+    def _ensure_edges(self) -> None:
+        """Record the direct edges in the reachability index if missing."""
+        if self.reachability.successors is None:
+            self.reachability.set_edges(self.graph.edges())
+
+    def add_relation(self, less: str, greater: str) -> None:
+        """
+        Add the partial order relation less ≤ greater.
+        
+        The closure, the affected join/meet entries and the lattice properties
+        are updated incrementally instead of rebuilding the lattice.
+        
+        Args:
+            less: The more specific value
+            greater: The more general value
+            
+        Raises:
+            ValueError: If either value is not in the taxonomy
+        """
+        i, j = self._require_index(less), self._require_index(greater)
+        if self.graph.has_edge(less, greater):
+            return
 
-        # Check if join and meet exist for all pairs
-        all_values = list(self.values.keys())
-        for i, a in enumerate(all_values):
-            for b in all_values[i:]:
-                if not self.join(a, b) or not self.meet(a, b):
-                    self.is_lattice = False
-                    self.is_complete_lattice = False
-                    break
+        self._ensure_edges()
+        self.relations["partial_order"].append({"less": less, "greater": greater})
+        self.graph.add_edge(less, greater)
 
-            if not self.is_lattice:
-                break
+        self._update_order(self.reachability.add_edge(i, j))
 
-        # Update the taxonomy
-        self.taxonomy["poset_properties"]["is_lattice"] = self.is_lattice
-        self.taxonomy["poset_properties"]["is_complete_lattice"] = self.is_complete_lattice
+    def remove_relation(self, less: str, greater: str) -> None:
+        """
+        Remove the partial order relation less ≤ greater.
+        
+        Only the direct relation is removed; less may still be below greater
+        through other relations. The closure, the affected join/meet entries
+        and the lattice properties are updated incrementally.
+        
+        Args:
+            less: The more specific value
+            greater: The more general value
+            
+        Raises:
+            ValueError: If either value or the relation is not in the taxonomy
+        """
+        i, j = self._require_index(less), self._require_index(greater)
+        if less == greater or not self.graph.has_edge(less, greater):
+            raise ValueError(f"Relation '{less}' ≤ '{greater}' not found")
+
+        self._ensure_edges()
+        self.relations["partial_order"][:] = [
+            relation for relation in self.relations["partial_order"]
+            if not (relation["less"] == less and relation["greater"] == greater)
+        ]
+        self.graph.remove_edge(less, greater)
+
+        self._update_order(self.reachability.remove_edge(i, j))
+
+    def _update_order(self, changed: Optional[Tuple[np.ndarray, np.ndarray]]) -> None:
+        """
+        Refresh derived state after the closure changed.
+        
+        Args:
+            changed: Tuple of (classes whose up-set changed, classes whose
+                down-set changed), or None if the equivalence classes changed
+                and the bound tables must be rebuilt
+        """
+        self._transitive_closure = None
+        self._extension = None
+        self.memo.clear()
+        # Counting incomparable pairs is quadratic, so the count recorded by
+        # create_formal_taxonomy() is dropped rather than kept up to date
+        self.poset_properties.pop("incomparable_pairs", None)
+
+        if changed is None:
+            self._compute_lattice_properties()
+            return
+
+        up_changed, down_changed = changed
+        if len(up_changed) == 0 and len(down_changed) == 0:
+            return
+
+        self.bounds = update_bound_tables(
+            self.bounds, self.reachability, up_changed, down_changed
+        )
+        self._update_lattice_properties()
+
+    def _bound_name(self, c: int) -> Optional[str]:
+        """Map a bound table entry back to the representative value of its class."""
+        return self.reachability.representative(c) if c >= 0 else None
+
+    def equivalence_class(self, value: str) -> List[str]:
+        """
+        Get the values equivalent to a value under the partial order.
+
+        Values related in both directions (through a cycle of relations)
+        form one element of the quotient poset the lattice is built on.
+
+        Args:
+            value: The value to look up
+
+        Returns:
+            All values equivalent to value, including itself, in value order
+
+        Raises:
+            ValueError: If the value is not in the taxonomy
+        """
+        i = self._require_index(value)
+        return self.reachability.class_members(self.reachability.component[i])
+
+    def representative(self, value: str) -> str:
+        """
+        Get the value standing for the equivalence class of a value.
+
+        Joins and meets that are not one of their arguments are reported as
+        the representative of their class.
+
+        Args:
+            value: The value to look up
+
+        Returns:
+            The first value of the equivalence class, in value order
+
+        Raises:
+            ValueError: If the value is not in the taxonomy
+        """
+        i = self._require_index(value)
+        return self.reachability.representative(self.reachability.component[i])
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Identifier of the partial order, used to validate saved memo entries.
+
+        Returns:
+            Hex digest over the value names, their classes and the closure bit-rows
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(self.reachability.names).encode("utf-8"))
+        digest.update(np.asarray(self.reachability.component, dtype=np.int32).tobytes())
+        digest.update(self.reachability.up.tobytes())
+        return digest.hexdigest()
+
+    @property
+    def memo_stats(self) -> Dict[str, Any]:
+        """
+        Counters of the join/meet memo.
+
+        The counters stay at zero while bound tables are stored.
+
+        Returns:
+            Dictionary with hits, misses, evictions, size, maxsize and policy
+        """
+        return self.memo.stats()
+
+    def save_memo(self, output_path: Union[str, Path]) -> None:
+        """
+        Save the join/meet memo so a later lattice can be warmed from it.
+
+        Args:
+            output_path: Path to save the memo JSON file
+
+        Raises:
+            ValueError: If bound tables are stored, so the memo is not used
+        """
+        if self.store_bound_tables:
+            raise ValueError(
+                "The join/meet memo is only used with store_bound_tables=False"
+            )
+        self.memo.save(output_path, self.fingerprint)
 
-    @lru_cache(maxsize=1024)
     def join(self, a: str, b: str) -> Optional[str]:
         """
         Compute the join (least upper bound) of two values.
@@ -121,39 +550,48 @@ class ValueLattice:
         if a == b:
             return a
 
+        i, j = self.reachability.get(a), self.reachability.get(b)
+        if i is None or j is None:
+            return None
+
         # If a ≤ b, then join(a, b) = b
-        if self.is_less_than_or_equal(a, b):
+        if self.reachability.leq(i, j):
             return b
 
         # If b ≤ a, then join(a, b) = a
-        if self.is_less_than_or_equal(b, a):
+        if self.reachability.leq(j, i):
             return a
 
-        # Find common successors (upper bounds)
-        a_successors = set(self.transitive_closure.successors(a))
-        b_successors = set(self.transitive_closure.successors(b))
-        common_successors = a_successors.intersection(b_successors)
+        c, d = self.reachability.component[i], self.reachability.component[j]
+        if self.bounds.join is not None:
+            return self._bound_name(self.bounds.join[c, d])
 
-        if not common_successors:
-            return None
+        return self._bound_name(
+            self.memo.get_or_compute((JOIN, int(c), int(d)), lambda: self._compute_join(c, d))
+        )
+
+    def _compute_join(self, c: int, d: int) -> int:
+        """
+        Compute the join of two incomparable classes from the closure bit-rows.
+
+        Args:
+            c: Class of the first value
+            d: Class of the second value
 
-        # Find the minimal elements among common successors (least upper bounds)
-        minimal_bounds = []
-        for s in common_successors:
-            if all(
-                not self.is_less_than_or_equal(t, s) or t == s
-                for t in common_successors
-            ):
-                minimal_bounds.append(s)
+        Returns:
+            Class of the join, or -1 if it doesn't exist
+        """
+        # Find the minimal elements among common upper bounds (least upper bounds)
+        common_successors = self.reachability.common_upper_bounds(c, d)
+        minimal_bounds = self.reachability.minimal_elements(common_successors)
 
         # A lattice requires a unique join
         if len(minimal_bounds) == 1:
-            return minimal_bounds[0]
+            return int(minimal_bounds[0])
 
         # For non-lattices, we could return all minimal upper bounds
-        return None
+        return -1
 
-    @lru_cache(maxsize=1024)
     def meet(self, a: str, b: str) -> Optional[str]:
         """
         Compute the meet (greatest lower bound) of two values.
@@ -170,37 +608,47 @@ class ValueLattice:
         if a == b:
             return a
 
+        i, j = self.reachability.get(a), self.reachability.get(b)
+        if i is None or j is None:
+            return None
+
         # If a ≤ b, then meet(a, b) = a
-        if self.is_less_than_or_equal(a, b):
+        if self.reachability.leq(i, j):
             return a
 
         # If b ≤ a, then meet(a, b) = b
-        if self.is_less_than_or_equal(b, a):
+        if self.reachability.leq(j, i):
             return b
 
-        # Find common predecessors (lower bounds)
-        a_predecessors = set(self.transitive_closure.predecessors(a))
-        b_predecessors = set(self.transitive_closure.predecessors(b))
-        common_predecessors = a_predecessors.intersection(b_predecessors)
+        c, d = self.reachability.component[i], self.reachability.component[j]
+        if self.bounds.meet is not None:
+            return self._bound_name(self.bounds.meet[c, d])
 
-        if not common_predecessors:
-            return None
+        return self._bound_name(
+            self.memo.get_or_compute((MEET, int(c), int(d)), lambda: self._compute_meet(c, d))
+        )
+
+    def _compute_meet(self, c: int, d: int) -> int:
+        """
+        Compute the meet of two incomparable classes from the closure bit-rows.
 
-        # Find the maximal elements among common predecessors (greatest lower bounds)
-        maximal_bounds = []
-        for p in common_predecessors:
-            if all(
-                not self.is_less_than_or_equal(p, q) or p == q
-                for q in common_predecessors
-            ):
-                maximal_bounds.append(p)
+        Args:
+            c: Class of the first value
+            d: Class of the second value
+
+        Returns:
+            Class of the meet, or -1 if it doesn't exist
+        """
+        # Find the maximal elements among common lower bounds (greatest lower bounds)
+        common_predecessors = self.reachability.common_lower_bounds(c, d)
+        maximal_bounds = self.reachability.maximal_elements(common_predecessors)
 
         # A lattice requires a unique meet
         if len(maximal_bounds) == 1:
-            return maximal_bounds[0]
+            return int(maximal_bounds[0])
 
         # For non-lattices, we could return all maximal lower bounds
-        return None
+        return -1
 
     def is_less_than_or_equal(self, a: str, b: str) -> bool:
         """
@@ -213,11 +661,203 @@ class ValueLattice:
         Returns:
             True if a ≤ b, False otherwise
         """
-        return a == b or self.transitive_closure.has_edge(a, b)
+        if a == b:
+            return True
+
+        i, j = self.reachability.get(a), self.reachability.get(b)
+        if i is None or j is None:
+            return False
+
+        return self.reachability.leq(i, j)
+
+    def are_incomparable(self, a: str, b: str) -> bool:
+        """
+        Check if neither a ≤ b nor b ≤ a holds in the partial order.
+
+        Incomparability is read from the closure bit-rows, so the taxonomy
+        does not need to list incomparable pairs.
+
+        Args:
+            a: First value
+            b: Second value
+
+        Returns:
+            True if a and b are incomparable, False otherwise or if either
+            value is unknown
+        """
+        i, j = self.reachability.get(a), self.reachability.get(b)
+        if i is None or j is None:
+            return False
+
+        return not (self.reachability.leq(i, j) or self.reachability.leq(j, i))
+
+    def indices(self, values: Union[np.ndarray, Iterable[str]]) -> np.ndarray:
+        """
+        Convert values to an array of value indices.
+
+        Args:
+            values: An integer array of value indices, or value names
+
+        Returns:
+            Array of value indices, with -1 for unknown names
+
+        Raises:
+            ValueError: If an integer index is out of range
+        """
+        if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.integer):
+            if values.size and (values.min() < 0 or values.max() >= len(self.reachability)):
+                raise ValueError("Value index out of range")
+            return values.astype(np.int64, copy=False)
+
+        index = self.reachability.index
+        if isinstance(values, str):
+            values = [values]
+        return np.array([index.get(value, -1) for value in values], dtype=np.int64)
+
+    def value_names(self, indices: np.ndarray) -> List[Optional[str]]:
+        """
+        Convert an array of value indices back to value names.
+
+        Args:
+            indices: Value indices, as returned by join_many() or meet_many()
+
+        Returns:
+            Value names, with None for -1 entries
+        """
+        names = self.reachability.names
+        return [names[i] if i >= 0 else None for i in np.asarray(indices).ravel().tolist()]
+
+    def _pair_indices(self, a, b) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return flat index arrays for a batch of pairs and the mask of known pairs."""
+        i, j = np.broadcast_arrays(self.indices(a), self.indices(b))
+        i, j = i.ravel(), j.ravel()
+        return i, j, (i >= 0) & (j >= 0)
+
+    def _leq_indices(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Test i ≤ j for arrays of known value indices."""
+        component = self.reachability.component
+        c, d = component[i], component[j]
+        return ((self.reachability.up[c, d >> 3] >> (d & 7)) & 1).astype(bool)
+
+    def leq_many(self, a, b) -> np.ndarray:
+        """
+        Check a ≤ b for every pair of a batch of values.
+
+        The pairs are tested against the closure bit-rows in a single
+        vectorized operation instead of one is_less_than_or_equal() call each.
+
+        Args:
+            a: First values, as an integer index array or value names
+            b: Second values, in the same form and broadcastable against a
+
+        Returns:
+            Flat boolean array, False where either value is unknown
+        """
+        i, j, known = self._pair_indices(a, b)
+        result = np.zeros(len(i), dtype=bool)
+        result[known] = self._leq_indices(i[known], j[known])
+        return result
+
+    def leq_matrix(self, a, b) -> np.ndarray:
+        """
+        Check a ≤ b for every combination of two batches of values.
+
+        Row slices of the closure are gathered once for the values of a, and
+        the bits of the values of b are read from them as columns.
+
+        Args:
+            a: Row values, as an integer index array or value names
+            b: Column values, in the same form
+
+        Returns:
+            Boolean matrix of shape (len(a), len(b)), False where either value
+            is unknown
+        """
+        i, j = self.indices(a).ravel(), self.indices(b).ravel()
+        result = np.zeros((len(i), len(j)), dtype=bool)
+        rows, cols = np.flatnonzero(i >= 0), np.flatnonzero(j >= 0)
+        if len(rows) and len(cols):
+            component = self.reachability.component
+            c, d = component[i[rows]], component[j[cols]]
+            bits = (self.reachability.up[c][:, d >> 3] >> (d & 7)) & 1
+            result[np.ix_(rows, cols)] = bits.astype(bool)
+        return result
+
+    def join_many(self, a, b) -> np.ndarray:
+        """
+        Compute the join of every pair of a batch of values.
+
+        Results agree with join(): a comparable pair is bounded by one of its
+        own values, and other joins are the representative of their class.
+
+        Args:
+            a: First values, as an integer index array or value names
+            b: Second values, in the same form and broadcastable against a
+
+        Returns:
+            Flat array of value indices of the joins, -1 where no join exists
+            or a value is unknown (see value_names())
+        """
+        return self._bounds_many(a, b, JOIN)
+
+    def meet_many(self, a, b) -> np.ndarray:
+        """
+        Compute the meet of every pair of a batch of values.
+
+        Results agree with meet(): a comparable pair is bounded by one of its
+        own values, and other meets are the representative of their class.
+
+        Args:
+            a: First values, as an integer index array or value names
+            b: Second values, in the same form and broadcastable against a
+
+        Returns:
+            Flat array of value indices of the meets, -1 where no meet exists
+            or a value is unknown (see value_names())
+        """
+        return self._bounds_many(a, b, MEET)
+
+    def _bounds_many(self, a, b, operation: str) -> np.ndarray:
+        """Shared implementation of join_many() and meet_many()."""
+        i, j, known = self._pair_indices(a, b)
+        i, j = i[known], j[known]
+        a_le_b = self._leq_indices(i, j)
+        b_le_a = self._leq_indices(j, i)
+
+        # Comparable pairs are bounded by one of the two values
+        if operation == JOIN:
+            bounds = np.where(a_le_b, j, i)
+        else:
+            bounds = np.where(a_le_b, i, j)
+
+        # Other pairs are looked up in the tables or found in one batch
+        incomparable = ~(a_le_b | b_le_a)
+        component = self.reachability.component
+        c, d = component[i[incomparable]], component[j[incomparable]]
+        table = self.bounds.join if operation == JOIN else self.bounds.meet
+        if table is not None:
+            classes = table[c, d].astype(np.int64)
+        else:
+            if self._extension is None:
+                self._extension = LinearExtension(self.reachability)
+            if operation == JOIN:
+                classes = self._extension.joins(c, d)
+            else:
+                classes = self._extension.meets(c, d)
+
+        representatives = self.reachability.representatives
+        bounds[incomparable] = np.where(classes >= 0, representatives[classes.clip(0)], -1)
+
+        result = np.full(len(known), -1, dtype=np.int64)
+        result[known] = bounds
+        return result
 
     def complementary_pair(self, a: str) -> Optional[str]:
         """
         Find the complementary value (antonym) of a given value.
+
+        The complement is looked up in the antonym pair index (see
+        complements) rather than by scanning the pairs.
         
         Args:
             a: The value to find the complement for
@@ -225,13 +865,7 @@ class ValueLattice:
         Returns:
             The complementary value, or None if it doesn't exist
         """
-        for pair in self.relations["antonym_pairs"]:
-            if pair["value"] == a:
-                return pair["anti_value"]
-            if pair["anti_value"] == a:
-                return pair["value"]
-
-        return None
+        return self.complements.complement_of(a)
 
     def galois_connection(self, a: str, b: str) -> bool:
         """
@@ -262,18 +896,33 @@ class ValueLattice:
         # Check Galois connection property
         return self.is_less_than_or_equal(a_comp, b) == self.is_less_than_or_equal(a, b_comp)
 
-    def save(self, output_path: Union[str, Path]) -> None:
+    def _iter_relations(self, family: str) -> Iterable[Any]:
+        """Iterate the entries of a relation family without building the taxonomy."""
+        if self._taxonomy is None:
+            return self._relation_arrays.iter_family(family)
+        return self.relations.get(family) or []
+
+    def save(self, output_path: Union[str, Path], output_format: str = JSON) -> None:
         """
         Save the updated taxonomy with lattice properties.
         
         Args:
-            output_path: Path to save the updated taxonomy JSON file
+            output_path: Path to save the updated taxonomy file
+            output_format: "json" for a single indented document, "ndjson"
+                for the streaming format (see taxonomy_stream)
         """
         if isinstance(output_path, str):
             output_path = Path(output_path)
 
-        with open(output_path, 'w') as f:
-            json.dump(self.taxonomy, f, indent=2)
+        if self._taxonomy is None and output_format != JSON:
+            # Stream straight from the relation arrays
+            relations = {
+                family: self._iter_relations(family)
+                for family in self._relation_arrays.order
+            }
+            write_taxonomy_stream(output_path, self.values, relations, self.poset_properties)
+        else:
+            save_taxonomy(output_path, self.taxonomy, output_format)
 
     def visualize(self, output_path: Union[str, Path], max_nodes: int = 20) -> None:
         """
@@ -301,6 +950,9 @@ class ValueLattice:
 
             G = G.subgraph(list(nodes)[:max_nodes])
 
+        # Plotting libraries are only loaded when a visualization is requested
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 10))
 
         # Use hierarchical layout if pygraphviz is available, otherwise use spring layout
@@ -343,6 +995,23 @@ class ValueLattice:
         print(f"Lattice visualization saved to {output_path}")
 
 
+def load_lattice(path: Union[str, Path], **kwargs: Any) -> ValueLattice:
+    """
+    Load a lattice from either a formal taxonomy JSON file or a snapshot.
+
+    Args:
+        path: Path to a formal taxonomy JSON file or a binary snapshot
+        **kwargs: Extra arguments passed to the ValueLattice constructor
+
+    Returns:
+        The loaded ValueLattice
+    """
+    if is_snapshot(path):
+        kwargs.pop("store_bound_tables", None)
+        return ValueLattice.open_snapshot(path, **kwargs)
+    return ValueLattice(path, **kwargs)
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -350,9 +1019,13 @@ if __name__ == "__main__":
         description='Build lattice structure from values taxonomy'
     )
     parser.add_argument('--input', default='data/formal_taxonomy.json',
-                        help='Path to formal taxonomy JSON file')
+                        help='Path to formal taxonomy JSON file or lattice snapshot')
     parser.add_argument('--output', default='data/lattice_taxonomy.json',
-                        help='Path to output updated taxonomy JSON file')
+                        help='Path to output updated taxonomy file')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default=JSON,
+                        help='Output format: indented JSON or streaming NDJSON')
+    parser.add_argument('--snapshot', default=None,
+                        help='Optional path to also write a binary lattice snapshot')
     parser.add_argument('--visualize', action='store_true',
                         help='Generate visualization of the lattice')
     parser.add_argument('--viz-output', default='data/lattice_visualization.png',
@@ -361,12 +1034,17 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     # Create lattice from taxonomy
-    lattice = ValueLattice(args.input)
+    lattice = load_lattice(args.input)
 
     # Update and save the taxonomy with lattice properties
-    lattice.save(args.output)
+    lattice.save(args.output, output_format=args.format)
     print(f"Lattice properties computed and saved to {args.output}")
 
+    # Save the binary snapshot if requested
+    if args.snapshot:
+        lattice.save_snapshot(args.snapshot)
+        print(f"Lattice snapshot saved to {args.snapshot}")
+
     # Generate visualization if requested
     if args.visualize:
         lattice.visualize(args.viz_output)
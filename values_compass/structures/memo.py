@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Bounded Memo Tables
+
+This module implements a small per-instance memo table with a configurable
+size and eviction policy. Unlike ``functools.lru_cache`` applied to a method,
+the memo belongs to one object, so it is released together with that object
+and can be sized for the workload at hand.
+
+Hit, miss and eviction counters are kept so callers can check whether the
+memo is sized correctly, and the contents can be saved to disk and used to
+warm a later instance built from the same structure.
+"""
+
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Union
+
+# Supported eviction policies
+LRU = "lru"
+FIFO = "fifo"
+EVICTION_POLICIES = (LRU, FIFO)
+
+_MISSING = object()
+
+
+class BoundedMemo:
+    """
+    Bounded key/value memo with LRU or FIFO eviction.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 4096, policy: str = LRU):
+        """
+        Initialize an empty memo.
+
+        Args:
+            maxsize: Maximum number of entries; None for unbounded, 0 to disable
+            policy: Eviction policy, either "lru" or "fifo"
+
+        Raises:
+            ValueError: If the policy or size is not supported
+        """
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy '{policy}', expected one of {EVICTION_POLICIES}"
+            )
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative or None")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key, updating the hit/miss counters.
+
+        Args:
+            key: Key to look up
+            default: Value returned on a miss
+
+        Returns:
+            The memoized value, or default if the key is not present
+        """
+        value = self._entries.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        if self.policy == LRU:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the oldest entry if the memo is full.
+
+        Args:
+            key: Key to store
+            value: Value to store
+        """
+        if self.maxsize == 0:
+            return
+
+        if key in self._entries:
+            self._entries[key] = value
+            if self.policy == LRU:
+                self._entries.move_to_end(key)
+            return
+
+        self._entries[key] = value
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute) -> Any:
+        """
+        Return the memoized value for key, computing and storing it on a miss.
+
+        Args:
+            key: Key to look up
+            compute: Zero-argument callable producing the value
+
+        Returns:
+            The memoized or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the memo counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions, size, maxsize and policy
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "policy": self.policy
+        }
+
+    def save(self, path: Union[str, Path], fingerprint: Optional[str] = None) -> None:
+        """
+        Save the memo entries to a JSON file.
+
+        Keys must be tuples (or scalars) of JSON-serializable values.
+
+        Args:
+            path: Output path
+            fingerprint: Identifier of the structure the entries belong to
+        """
+        entries = [
+            [list(key) if isinstance(key, tuple) else key, value]
+            for key, value in self._entries.items()
+        ]
+        with open(path, 'w') as f:
+            json.dump({"fingerprint": fingerprint, "entries": entries}, f)
+
+    def load(self, path: Union[str, Path], fingerprint: Optional[str] = None) -> int:
+        """
+        Warm the memo from a file written by save().
+
+        Entries are only loaded if the stored fingerprint matches, so a memo
+        saved for a different structure is ignored. Loading does not count as
+        hits or misses.
+
+        Args:
+            path: Path of the saved memo
+            fingerprint: Identifier of the current structure
+
+        Returns:
+            Number of entries loaded
+        """
+        with open(path, 'r') as f:
+            saved = json.load(f)
+
+        if saved.get("fingerprint") != fingerprint:
+            return 0
+
+        loaded = 0
+        for key, value in saved["entries"]:
+            self.put(tuple(key) if isinstance(key, list) else key, value)
+            loaded += 1
+        return loaded
@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Reachability Index for Partial Orders
+
+This module implements a compact representation of the reflexive-transitive
+closure of a directed graph. Instead of materializing every closure edge as a
+networkx edge, the closure is stored as two bit matrices packed into NumPy
+``uint8`` arrays.
+
+Elements that reach each other (a strongly connected component, e.g. a cycle
+of relations between values that are effectively synonyms) are equivalent
+under the closure, so the matrices are built over the quotient poset: one
+class per component, numbered in the order of their smallest member. For
+classes ``c`` and ``d``:
+
+- ``up[c]`` has bit ``d`` set iff ``c ≤ d`` (the up-set of ``c``)
+- ``down[c]`` has bit ``d`` set iff ``d ≤ c`` (the down-set of ``c``)
+
+Element indices are mapped to classes through ``component``. Order queries
+become single bit tests, and upper/lower bound computations become vectorized
+intersections of bit-rows whose length is the number of classes rather than
+the number of elements.
+"""
+
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+# Number of set bits for every possible byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount_rows(rows: np.ndarray) -> np.ndarray:
+    """
+    Count the set bits in each row of a packed bit matrix.
+
+    Args:
+        rows: Packed bit rows of shape (k, n_bytes) or (n_bytes,)
+
+    Returns:
+        Array with the number of set bits per row
+    """
+    return _POPCOUNT[rows].sum(axis=-1, dtype=np.int64)
+
+
+class ReachabilityIndex:
+    """
+    Bitset index of the reflexive-transitive closure of a directed graph.
+
+    Methods taking ``i``/``j`` expect element indices; methods taking
+    ``c``/``d`` and all bit-rows refer to equivalence classes.
+    """
+
+    def __init__(self, names: Iterable[Hashable], edges: Iterable[Tuple[Hashable, Hashable]]):
+        """
+        Build the reachability index.
+
+        Args:
+            names: Elements of the order, in index order
+            edges: Pairs (a, b) meaning a ≤ b
+        """
+        self.names: List[Hashable] = list(names)
+        self.index: Dict[Hashable, int] = {name: i for i, name in enumerate(self.names)}
+
+        self.set_edges(edges)
+        self._build()
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph) -> "ReachabilityIndex":
+        """
+        Build the reachability index of a networkx graph.
+
+        Args:
+            graph: Directed graph whose edges (a, b) mean a ≤ b
+
+        Returns:
+            ReachabilityIndex over the nodes of the graph
+        """
+        return cls(graph.nodes(), graph.edges())
+
+    @classmethod
+    def from_arrays(
+        cls,
+        names: Iterable[Hashable],
+        component: np.ndarray,
+        up: np.ndarray,
+        down: np.ndarray
+    ) -> "ReachabilityIndex":
+        """
+        Wrap precomputed classes and closure matrices without recomputing them.
+
+        The arrays may be read-only views, e.g. into a memory-mapped file.
+
+        Args:
+            names: Elements of the order, in index order
+            component: Class index of every element
+            up: Packed class up-set matrix of shape (k, n_bytes)
+            down: Packed class down-set matrix of shape (k, n_bytes)
+
+        Returns:
+            ReachabilityIndex backed by the given arrays
+        """
+        reachability = cls.__new__(cls)
+        reachability.names = list(names)
+        reachability.index = {name: i for i, name in enumerate(reachability.names)}
+        reachability.successors = None
+        reachability.predecessors = None
+        reachability._set_classes(component, len(up))
+        reachability.up = up
+        reachability.down = down
+        return reachability
+
+    def set_edges(self, edges: Iterable[Tuple[Hashable, Hashable]]) -> None:
+        """
+        Record the direct edges of the order, used for incremental updates.
+
+        Args:
+            edges: Pairs (a, b) meaning a ≤ b
+        """
+        self.successors: Optional[List[Set[int]]] = [set() for _ in self.names]
+        self.predecessors: Optional[List[Set[int]]] = [set() for _ in self.names]
+        for a, b in edges:
+            i, j = self.index[a], self.index[b]
+            if i != j:
+                self.successors[i].add(j)
+                self.predecessors[j].add(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _set_classes(self, component: np.ndarray, n_classes: int) -> None:
+        """
+        Derive the class membership tables from the element -> class map.
+
+        Args:
+            component: Class index of every element
+            n_classes: Number of classes
+        """
+        self.component = component
+        self.n_classes = n_classes
+        self.n_bytes = (n_classes + 7) // 8
+
+        by_class = np.argsort(component, kind="stable")
+        boundaries = np.searchsorted(component[by_class], np.arange(1, n_classes))
+        self.members: List[np.ndarray] = np.split(by_class, boundaries)
+        self.representatives = by_class[np.r_[0, boundaries]] if n_classes else by_class
+
+    def _build(self) -> None:
+        """
+        Compute the classes and their closure from the recorded direct edges.
+
+        The closure is propagated over the condensation of the graph in
+        topological order, so each class row is computed exactly once.
+        """
+        n = len(self.names)
+        G = nx.DiGraph()
+        G.add_nodes_from(range(n))
+        G.add_edges_from((i, j) for i, succ in enumerate(self.successors) for j in succ)
+        C = nx.condensation(G)
+
+        # Number classes by their smallest member, so they follow element order
+        condensed = sorted(C.nodes, key=lambda c: min(C.nodes[c]["members"]))
+        renumber = {c: k for k, c in enumerate(condensed)}
+        component = np.empty(n, dtype=np.int32)
+        for c, k in renumber.items():
+            component[list(C.nodes[c]["members"])] = k
+        self._set_classes(component, len(condensed))
+
+        k = self.n_classes
+        self.up = np.zeros((k, self.n_bytes), dtype=np.uint8)
+        self.down = np.zeros((k, self.n_bytes), dtype=np.uint8)
+        for c in range(k):
+            self.up[c, c >> 3] |= np.uint8(1 << (c & 7))
+            self.down[c, c >> 3] |= np.uint8(1 << (c & 7))
+
+        order = list(nx.topological_sort(C))
+        for c in reversed(order):
+            for s in C.successors(c):
+                self.up[renumber[c]] |= self.up[renumber[s]]
+        for c in order:
+            for p in C.predecessors(c):
+                self.down[renumber[c]] |= self.down[renumber[p]]
+
+    def _ensure_writeable(self) -> None:
+        """Copy memory-mapped closure matrices before modifying them."""
+        if not self.up.flags.writeable:
+            self.up = self.up.copy()
+        if not self.down.flags.writeable:
+            self.down = self.down.copy()
+
+    def _require_edges(self) -> None:
+        if self.successors is None:
+            raise ValueError("Direct edges are not recorded, call set_edges() first")
+
+    def add_edge(self, i: int, j: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Add the relation i ≤ j and update the closure incrementally.
+
+        Every class below i gains the up-set of j, and every class above j
+        gains the down-set of i; no other row changes. An edge that closes a
+        cycle merges classes, in which case the index is rebuilt.
+
+        Args:
+            i: Index of the lesser element
+            j: Index of the greater element
+
+        Returns:
+            Tuple of (classes whose up-set changed, classes whose down-set
+            changed), or None if the classes themselves changed
+
+        Raises:
+            ValueError: If the edge merges classes and direct edges are not recorded
+        """
+        if self.successors is not None and i != j:
+            self.successors[i].add(j)
+            self.predecessors[j].add(i)
+
+        ci, cj = self.component[i], self.component[j]
+        empty = np.array([], dtype=np.int64)
+        if self.class_leq(ci, cj):
+            return empty, empty
+
+        if self.class_leq(cj, ci):
+            self._require_edges()
+            self._build()
+            return None
+
+        self._ensure_writeable()
+        below = self.lower_set(ci)
+        above = self.upper_set(cj)
+        self.up[below] |= self.up[cj]
+        self.down[above] |= self.down[ci]
+        return below, above
+
+    def remove_edge(self, i: int, j: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Remove the direct relation i ≤ j and update the closure incrementally.
+
+        Only the up-sets of classes below i and the down-sets of classes above
+        j can shrink, so only those rows are recomputed from the direct
+        edges. Removing an edge inside a class may split it, in which case
+        the index is rebuilt. Requires the edges to be recorded (see
+        set_edges()).
+
+        Args:
+            i: Index of the lesser element
+            j: Index of the greater element
+
+        Returns:
+            Tuple of (classes whose up-set may have changed, classes whose
+            down-set may have changed), or None if the classes changed
+
+        Raises:
+            ValueError: If the direct edges are not recorded
+        """
+        self._require_edges()
+        self.successors[i].discard(j)
+        self.predecessors[j].discard(i)
+
+        ci, cj = self.component[i], self.component[j]
+        if ci == cj:
+            self._build()
+            return None
+
+        self._ensure_writeable()
+        below = self.lower_set(ci)
+        above = self.upper_set(cj)
+        self._recompute_rows(self.up, self.successors, below)
+        self._recompute_rows(self.down, self.predecessors, above)
+        return below, above
+
+    def _class_neighbours(self, c: int, adjacency: List[Set[int]]) -> Set[int]:
+        """Return the classes directly adjacent to class c, excluding c itself."""
+        return {int(self.component[s]) for x in self.members[c] for s in adjacency[x]} - {c}
+
+    def _recompute_rows(
+        self,
+        matrix: np.ndarray,
+        adjacency: List[Set[int]],
+        affected: np.ndarray
+    ) -> None:
+        """
+        Recompute closure rows of the affected classes from direct edges.
+
+        Rows of unaffected classes are assumed to be correct. Classes form a
+        DAG, so the affected classes are processed in topological order of
+        the subgraph they induce.
+
+        Args:
+            matrix: Up-set (with successors) or down-set (with predecessors) matrix
+            adjacency: Direct successors or predecessors of each element
+            affected: Indices of the class rows to recompute
+        """
+        neighbours = {c: self._class_neighbours(c, adjacency) for c in affected.tolist()}
+        H = nx.DiGraph()
+        H.add_nodes_from(neighbours)
+        H.add_edges_from(
+            (c, d) for c, adjacent in neighbours.items() for d in adjacent if d in neighbours
+        )
+
+        for c in reversed(list(nx.topological_sort(H))):
+            row = np.zeros(self.n_bytes, dtype=np.uint8)
+            row[c >> 3] |= np.uint8(1 << (c & 7))
+            for d in neighbours[c]:
+                row |= matrix[d]
+            matrix[c] = row
+
+    def get(self, name: Hashable) -> Optional[int]:
+        """Return the index of an element, or None if it is not indexed."""
+        return self.index.get(name)
+
+    def class_of(self, name: Hashable) -> Optional[int]:
+        """Return the class index of an element, or None if it is not indexed."""
+        i = self.index.get(name)
+        return None if i is None else int(self.component[i])
+
+    def class_members(self, c: int) -> List[Hashable]:
+        """Return the elements of class c, in index order."""
+        return [self.names[i] for i in self.members[c]]
+
+    def representative(self, c: int) -> Hashable:
+        """Return the representative (smallest member) of class c."""
+        return self.names[self.representatives[c]]
+
+    def leq(self, i: int, j: int) -> bool:
+        """
+        Check whether element i is less than or equal to element j.
+
+        Args:
+            i: Index of the first element
+            j: Index of the second element
+
+        Returns:
+            True if i ≤ j, False otherwise
+        """
+        return self.class_leq(self.component[i], self.component[j])
+
+    def class_leq(self, c: int, d: int) -> bool:
+        """
+        Check whether class c is less than or equal to class d.
+
+        Args:
+            c: Index of the first class
+            d: Index of the second class
+
+        Returns:
+            True if c ≤ d, False otherwise
+        """
+        return bool((self.up[c, d >> 3] >> (d & 7)) & 1)
+
+    def row_members(self, row: np.ndarray) -> np.ndarray:
+        """
+        Decode a packed bit-row into the sorted indices of its set bits.
+
+        Args:
+            row: Packed bit-row of length n_bytes
+
+        Returns:
+            Array of class indices
+        """
+        bits = np.unpackbits(row, count=self.n_classes, bitorder="little")
+        return np.flatnonzero(bits)
+
+    def upper_set(self, c: int) -> np.ndarray:
+        """Return the indices of all classes d with c ≤ d."""
+        return self.row_members(self.up[c])
+
+    def lower_set(self, c: int) -> np.ndarray:
+        """Return the indices of all classes d with d ≤ c."""
+        return self.row_members(self.down[c])
+
+    def common_upper_bounds(self, c: int, d: int) -> np.ndarray:
+        """Return the packed bit-row of classes above both c and d."""
+        return self.up[c] & self.up[d]
+
+    def common_lower_bounds(self, c: int, d: int) -> np.ndarray:
+        """Return the packed bit-row of classes below both c and d."""
+        return self.down[c] & self.down[d]
+
+    def minimal_elements(self, row: np.ndarray) -> np.ndarray:
+        """
+        Find the minimal classes of a set given as a packed bit-row.
+
+        A class s of the set is minimal if no other class t of the set
+        satisfies t ≤ s, i.e. the down-set of s meets the set only in s.
+
+        Args:
+            row: Packed bit-row describing the set
+
+        Returns:
+            Array of indices of the minimal classes
+        """
+        candidates = self.row_members(row)
+        if len(candidates) == 0:
+            return candidates
+        counts = popcount_rows(self.down[candidates] & row)
+        return candidates[counts == 1]
+
+    def maximal_elements(self, row: np.ndarray) -> np.ndarray:
+        """
+        Find the maximal classes of a set given as a packed bit-row.
+
+        Args:
+            row: Packed bit-row describing the set
+
+        Returns:
+            Array of indices of the maximal classes
+        """
+        candidates = self.row_members(row)
+        if len(candidates) == 0:
+            return candidates
+        counts = popcount_rows(self.up[candidates] & row)
+        return candidates[counts == 1]
+
+    def incomparable_row(self, c: int) -> np.ndarray:
+        """
+        Return the packed bit-row of classes incomparable to class c.
+
+        Incomparability is never stored; it is the complement of the up-set
+        and down-set of c.
+
+        Args:
+            c: Index of the class
+
+        Returns:
+            Packed bit-row of length n_bytes
+        """
+        row = ~(self.up[c] | self.down[c])
+        tail = self.n_classes & 7
+        if tail:
+            row[-1] &= np.uint8((1 << tail) - 1)
+        return row
+
+    def incomparable_elements(self, i: int) -> np.ndarray:
+        """
+        Find the elements incomparable to element i.
+
+        Args:
+            i: Index of the element
+
+        Returns:
+            Sorted array of element indices
+        """
+        row = self.incomparable_row(self.component[i])
+        bits = np.unpackbits(row, count=self.n_classes, bitorder="little")
+        return np.flatnonzero(bits[self.component])
+
+    def count_incomparable(self) -> int:
+        """
+        Count the unordered pairs of incomparable elements.
+
+        Returns:
+            Number of pairs {i, j} with neither i ≤ j nor j ≤ i
+        """
+        sizes = np.array([len(members) for members in self.members], dtype=np.int64)
+        total = 0
+        for c in range(self.n_classes):
+            bits = np.unpackbits(self.incomparable_row(c), count=self.n_classes, bitorder="little")
+            total += int(sizes[c] * sizes[bits.astype(bool)].sum())
+        return total // 2
+
+    def iter_incomparable(self) -> Iterator[Tuple[int, int]]:
+        """
+        Generate the incomparable element pairs one row at a time.
+
+        Pairs (i, j) with i < j are produced in index order, so memory stays
+        linear in the number of elements however many pairs there are.
+
+        Yields:
+            Tuples of element indices (i, j)
+        """
+        for i in range(len(self.names)):
+            others = self.incomparable_elements(i)
+            for j in others[others > i].tolist():
+                yield i, j
+
+    def to_networkx(self) -> nx.DiGraph:
+        """
+        Materialize the closure over elements as a networkx graph.
+
+        This is only intended for callers that need the full closure as a
+        graph; order queries should use the bitset methods directly.
+
+        Returns:
+            nx.DiGraph with an edge (a, b) for every a ≤ b, including self-loops
+        """
+        T = nx.DiGraph()
+        T.add_nodes_from(self.names)
+        for c in range(self.n_classes):
+            above = [self.names[j] for d in self.upper_set(c) for j in self.members[d]]
+            for i in self.members[c]:
+                T.add_edges_from((self.names[i], name) for name in above)
+        return T
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Binary Snapshot Format for Value Lattices
+
+This module reads and writes a versioned binary container holding everything
+a ValueLattice needs at query time: the value-name table, the equivalence
+class of every value, the closure bit matrices, the join/meet tables and the
+relation index arrays.
+
+The file layout is:
+
+- a 16-byte prefix: magic bytes, format version, header length
+- a UTF-8 JSON header describing the values and every array section
+- the array sections, each aligned to 64 bytes
+
+Snapshots are opened with ``mmap``, and every array is a read-only view into
+the mapping. Opening a snapshot therefore does no parsing beyond the header,
+and several processes opening the same file share the same physical pages.
+"""
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+MAGIC = b"VCLATSNP"
+SNAPSHOT_VERSION = 2
+
+_PREFIX = struct.Struct("<8sII")
+_ALIGNMENT = 64
+
+# Relation families stored as index arrays rather than in the JSON header
+PAIR_RELATIONS = {
+    "partial_order": ("less", "greater"),
+    "antonym_pairs": ("value", "anti_value"),
+}
+LIST_RELATIONS = ("incomparable",)
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def is_snapshot(path: Union[str, Path]) -> bool:
+    """
+    Check whether a file is a lattice snapshot.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        True if the file starts with the snapshot magic bytes
+    """
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def encode_relations(
+    relations: Dict[str, Any],
+    index: Dict[str, int]
+) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Split relation families into index arrays and JSON-serializable leftovers.
+
+    Args:
+        relations: The "relations" section of a formal taxonomy
+        index: Mapping from value name to index
+
+    Returns:
+        Tuple of (arrays by section name, remaining relation families)
+
+    Raises:
+        ValueError: If a relation refers to a value that is not indexed
+    """
+    arrays = {}
+    remaining = {}
+    for family, entries in relations.items():
+        try:
+            if family in PAIR_RELATIONS:
+                first, second = PAIR_RELATIONS[family]
+                pairs = [(index[e[first]], index[e[second]]) for e in entries]
+            elif family in LIST_RELATIONS:
+                pairs = [(index[u], index[v]) for u, v in entries]
+            else:
+                remaining[family] = entries
+                continue
+        except KeyError as e:
+            raise ValueError(f"Relation '{family}' refers to unknown value {e}") from None
+        arrays[family] = np.array(pairs, dtype=np.int32).reshape(-1, 2)
+    return arrays, remaining
+
+
+def iter_relation_entries(family: str, pairs: np.ndarray, names: List[str]) -> Iterator[Any]:
+    """
+    Decode a relation index array into entries of the formal taxonomy layout.
+
+    Args:
+        family: Relation family of the array
+        pairs: Index pairs of shape (m, 2)
+        names: Value names by index
+
+    Yields:
+        One relation entry per pair
+    """
+    if family in PAIR_RELATIONS:
+        first, second = PAIR_RELATIONS[family]
+        for u, v in pairs.tolist():
+            yield {first: names[u], second: names[v]}
+    else:
+        for u, v in pairs.tolist():
+            yield [names[u], names[v]]
+
+
+def decode_relations(
+    arrays: Dict[str, np.ndarray],
+    remaining: Dict[str, Any],
+    names: List[str],
+    order: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Rebuild the "relations" section of a formal taxonomy from index arrays.
+
+    Args:
+        arrays: Relation index arrays by family
+        remaining: Relation families kept in JSON layout
+        names: Value names by index
+        order: Original order of the relation families
+
+    Returns:
+        Relations dictionary in the formal taxonomy JSON layout
+    """
+    relations = {family: None for family in order or []}
+    relations.update(remaining)
+    for family, pairs in arrays.items():
+        relations[family] = list(iter_relation_entries(family, pairs, names))
+    return relations
+
+
+class RelationArrays:
+    """
+    Relations of a formal taxonomy held as index arrays.
+
+    Families listed in PAIR_RELATIONS and LIST_RELATIONS are stored as int32
+    index pairs; any other family is kept in its JSON layout. Entries are
+    only decoded back to dictionaries when they are iterated.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        arrays: Dict[str, np.ndarray],
+        remaining: Dict[str, Any],
+        order: Optional[List[str]] = None
+    ):
+        """
+        Wrap encoded relations.
+
+        Args:
+            names: Value names by index
+            arrays: Relation index arrays by family
+            remaining: Relation families kept in JSON layout
+            order: Original order of the relation families
+        """
+        self.names = names
+        self.arrays = arrays
+        self.remaining = remaining
+        self.order = list(order) if order else list(arrays) + list(remaining)
+
+    def name_pairs(self, family: str) -> Iterator[Tuple[str, str]]:
+        """
+        Generate the value-name pairs of an array-encoded family.
+
+        Args:
+            family: Relation family
+
+        Yields:
+            Pairs of value names, e.g. (less, greater) for the partial order
+        """
+        pairs = self.arrays.get(family)
+        if pairs is None:
+            return
+        for u, v in pairs.tolist():
+            yield self.names[u], self.names[v]
+
+    def iter_family(self, family: str) -> Iterator[Any]:
+        """
+        Generate the entries of a family in the formal taxonomy layout.
+
+        Args:
+            family: Relation family
+
+        Yields:
+            Relation entries
+        """
+        if family in self.arrays:
+            yield from iter_relation_entries(family, self.arrays[family], self.names)
+        elif self.remaining.get(family) is not None:
+            yield from self.remaining[family]
+
+    def decode(self) -> Dict[str, Any]:
+        """
+        Rebuild the full relations dictionary.
+
+        Returns:
+            Relations dictionary in the formal taxonomy JSON layout
+        """
+        return decode_relations(self.arrays, self.remaining, self.names, self.order)
+
+
+def write_snapshot(
+    output_path: Union[str, Path],
+    header: Dict[str, Any],
+    arrays: Dict[str, Optional[np.ndarray]]
+) -> None:
+    """
+    Write a snapshot file.
+
+    Args:
+        output_path: Path of the snapshot file
+        header: JSON-serializable metadata
+        arrays: Array sections by name; None entries are skipped
+    """
+    sections = {}
+    offset = 0
+    for name, array in arrays.items():
+        if array is None:
+            continue
+        sections[name] = {
+            "offset": offset,
+            "dtype": array.dtype.str,
+            "shape": list(array.shape)
+        }
+        offset = _align(offset + array.nbytes)
+
+    header = dict(header, sections=sections)
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = _align(_PREFIX.size + len(header_bytes))
+
+    with open(output_path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, SNAPSHOT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, section in sections.items():
+            f.seek(data_start + section["offset"])
+            f.write(np.ascontiguousarray(arrays[name]).tobytes())
+        f.truncate(data_start + offset)
+
+
+class LatticeSnapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file.
+    """
+
+    def __init__(self, snapshot_path: Union[str, Path]):
+        """
+        Open a snapshot file.
+
+        Args:
+            snapshot_path: Path of the snapshot file
+
+        Raises:
+            ValueError: If the file is not a snapshot or has another version
+        """
+        self.path = Path(snapshot_path)
+
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _PREFIX.size:
+            raise ValueError(f"{self.path} is not a lattice snapshot")
+        magic, version, header_length = _PREFIX.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a lattice snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {version} in {self.path}, "
+                f"expected {SNAPSHOT_VERSION}"
+            )
+
+        header_end = _PREFIX.size + header_length
+        self.header = json.loads(self._mmap[_PREFIX.size:header_end].decode("utf-8"))
+
+        data_start = _align(header_end)
+        self.arrays: Dict[str, np.ndarray] = {}
+        for name, section in self.header["sections"].items():
+            dtype = np.dtype(section["dtype"])
+            shape = tuple(section["shape"])
+            count = int(np.prod(shape))
+            self.arrays[name] = np.frombuffer(
+                self._mmap, dtype=dtype, count=count,
+                offset=data_start + section["offset"]
+            ).reshape(shape)
+
+    def get(self, name: str) -> Optional[np.ndarray]:
+        """Return an array section, or None if the snapshot does not have it."""
+        return self.arrays.get(name)
+
+    def relation_arrays(self) -> Dict[str, np.ndarray]:
+        """Return the relation index arrays by family."""
+        families = list(PAIR_RELATIONS) + list(LIST_RELATIONS)
+        return {family: self.arrays[family] for family in families if family in self.arrays}
+
+    def relations(self) -> RelationArrays:
+        """Return the relations stored in the snapshot, without decoding them."""
+        return RelationArrays(
+            self.header["names"],
+            self.relation_arrays(),
+            self.header["relations"],
+            self.header.get("relation_order")
+        )
+
+    def taxonomy(self) -> Dict[str, Any]:
+        """
+        Rebuild the formal taxonomy dictionary stored in the snapshot.
+
+        Returns:
+            Taxonomy in the formal taxonomy JSON layout
+        """
+        return {
+            "values": self.header["values"],
+            "relations": self.relations().decode(),
+            "poset_properties": self.header["poset_properties"]
+        }
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Streaming NDJSON Format for Formal Taxonomies
+
+This module writes and reads formal taxonomies as newline-delimited JSON, one
+record per line, instead of a single pretty-printed document. The layout is:
+
+- a header line identifying the format and version
+- a ``values`` section with one ``[name, attributes]`` line per value
+- one section per relation family, with one line per relation entry
+- a ``poset_properties`` section with a single line
+
+Each section starts with a marker line ``{"@section": ..., "family": ...}``.
+The writer accepts generators for every section, so a taxonomy never has to be
+held in memory as one dictionary, and the reader encodes relations into index
+arrays as it goes (see RelationArrays).
+"""
+
+import json
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from values_compass.structures.snapshot import (
+    LIST_RELATIONS,
+    PAIR_RELATIONS,
+    RelationArrays,
+)
+
+TAXONOMY_FORMAT = "formal-taxonomy"
+TAXONOMY_STREAM_VERSION = 1
+
+# Output formats accepted by the taxonomy writers
+JSON = "json"
+NDJSON = "ndjson"
+OUTPUT_FORMATS = (JSON, NDJSON)
+
+_SECTION = "@section"
+_VALUES = "values"
+_RELATIONS = "relations"
+_POSET_PROPERTIES = "poset_properties"
+
+_DECODER = json.JSONDecoder()
+
+
+def _dump(record: Any) -> str:
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def is_taxonomy_stream(path: Union[str, Path]) -> bool:
+    """
+    Check whether a file is a streaming NDJSON taxonomy.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        True if the first line is a taxonomy stream header
+    """
+    with open(path, 'rb') as f:
+        first_line = f.readline(4096)
+    try:
+        header = json.loads(first_line)
+    except ValueError:
+        return False
+    return isinstance(header, dict) and header.get("format") == TAXONOMY_FORMAT
+
+
+def write_taxonomy_stream(
+    output_path: Union[str, Path],
+    values: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]],
+    relations: Mapping[str, Iterable[Any]],
+    poset_properties: Dict[str, Any]
+) -> None:
+    """
+    Write a formal taxonomy as NDJSON, one record at a time.
+
+    Args:
+        output_path: Path to write the NDJSON file
+        values: Value attributes by name, or an iterable of (name, attributes)
+        relations: Relation entries by family; each family may be a generator
+        poset_properties: Poset properties dictionary
+    """
+    items = values.items() if isinstance(values, Mapping) else values
+
+    with open(output_path, 'w') as f:
+        f.write(_dump({"format": TAXONOMY_FORMAT, "version": TAXONOMY_STREAM_VERSION}))
+
+        f.write(_dump({_SECTION: _VALUES}))
+        for name, attrs in items:
+            f.write(_dump([name, attrs]))
+
+        for family, entries in relations.items():
+            f.write(_dump({_SECTION: _RELATIONS, "family": family}))
+            if entries is None:
+                continue
+            for entry in entries:
+                f.write(_dump(entry))
+
+        f.write(_dump({_SECTION: _POSET_PROPERTIES}))
+        f.write(_dump(poset_properties))
+
+
+def iter_taxonomy_stream(path: Union[str, Path]) -> Iterator[Tuple[str, Optional[str], Any]]:
+    """
+    Read the records of an NDJSON taxonomy one at a time.
+
+    Args:
+        path: Path of the NDJSON file
+
+    Yields:
+        Tuples of (section, relation family or None, record)
+
+    Raises:
+        ValueError: If the file is not a supported taxonomy stream
+    """
+    with open(path, 'r') as f:
+        header = json.loads(f.readline() or "null")
+        if not isinstance(header, dict) or header.get("format") != TAXONOMY_FORMAT:
+            raise ValueError(f"{path} is not a taxonomy stream")
+        if header.get("version") != TAXONOMY_STREAM_VERSION:
+            raise ValueError(
+                f"Unsupported taxonomy stream version {header.get('version')} in {path}, "
+                f"expected {TAXONOMY_STREAM_VERSION}"
+            )
+
+        section = family = None
+        decode = _DECODER.raw_decode
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = decode(line)[0]
+            if isinstance(record, dict) and _SECTION in record:
+                section = record[_SECTION]
+                family = record.get("family")
+                if section == _RELATIONS:
+                    yield section, family, None
+                continue
+            if section is None:
+                raise ValueError(f"Record outside of a section in {path}")
+            yield section, family, record
+
+
+def read_taxonomy_stream(
+    path: Union[str, Path]
+) -> Tuple[Dict[str, Any], RelationArrays, Dict[str, Any]]:
+    """
+    Load an NDJSON taxonomy with relations encoded as index arrays.
+
+    Relations of the families in PAIR_RELATIONS and LIST_RELATIONS are
+    packed into integer arrays while reading, so no dictionary is created
+    per relation entry.
+
+    As when a JSON taxonomy is loaded, relations may name values that are
+    not listed in the values section (such as root values without an entry
+    of their own); those names are indexed after the listed values.
+
+    Args:
+        path: Path of the NDJSON file
+
+    Returns:
+        Tuple of (values by name, relations, poset properties)
+
+    Raises:
+        ValueError: If the file is not a taxonomy stream
+    """
+    values: Dict[str, Any] = {}
+    index: Dict[str, int] = {}
+    encoded: Dict[str, array] = {}
+    remaining: Dict[str, Any] = {}
+    order = []
+    poset_properties: Dict[str, Any] = {}
+
+    for section, family, record in iter_taxonomy_stream(path):
+        if section == _VALUES:
+            name, attrs = record
+            index.setdefault(name, len(index))
+            values[name] = attrs
+        elif section == _RELATIONS:
+            if record is None:
+                order.append(family)
+                if family in PAIR_RELATIONS or family in LIST_RELATIONS:
+                    encoded[family] = array('i')
+                else:
+                    remaining[family] = []
+                continue
+            if family in encoded:
+                if family in PAIR_RELATIONS:
+                    first, second = PAIR_RELATIONS[family]
+                    u, v = record[first], record[second]
+                else:
+                    u, v = record
+                encoded[family].extend((
+                    index.setdefault(u, len(index)), index.setdefault(v, len(index))
+                ))
+            else:
+                remaining[family].append(record)
+        elif section == _POSET_PROPERTIES:
+            poset_properties = record
+
+    arrays = {
+        family: np.frombuffer(pairs, dtype=np.int32).reshape(-1, 2)
+        if len(pairs) else np.empty((0, 2), dtype=np.int32)
+        for family, pairs in encoded.items()
+    }
+    return values, RelationArrays(list(index), arrays, remaining, order), poset_properties
+
+
+def load_taxonomy(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a formal taxonomy dictionary from either a JSON or an NDJSON file.
+
+    Args:
+        path: Path to the taxonomy file
+
+    Returns:
+        Taxonomy in the formal taxonomy JSON layout
+    """
+    if is_taxonomy_stream(path):
+        values, relations, poset_properties = read_taxonomy_stream(path)
+        return {
+            "values": values,
+            "relations": relations.decode(),
+            "poset_properties": poset_properties
+        }
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_taxonomy(
+    output_path: Union[str, Path],
+    taxonomy: Dict[str, Any],
+    output_format: str = JSON
+) -> None:
+    """
+    Save a formal taxonomy dictionary as JSON or NDJSON.
+
+    Args:
+        output_path: Path to write the taxonomy file
+        taxonomy: Taxonomy in the formal taxonomy JSON layout
+        output_format: "json" for a single indented document, "ndjson" for
+            the streaming format
+
+    Raises:
+        ValueError: If the output format is not supported
+    """
+    if output_format == NDJSON:
+        write_taxonomy_stream(
+            output_path, taxonomy["values"], taxonomy["relations"], taxonomy["poset_properties"]
+        )
+    elif output_format == JSON:
+        with open(output_path, 'w') as f:
+            json.dump(taxonomy, f, indent=2)
+    else:
+        raise ValueError(
+            f"Unknown output format '{output_format}', expected one of {OUTPUT_FORMATS}"
+        )
@@ -9,6 +9,14 @@ properties that ensure consistency in the value system.
 
 Usage:
     python -m values_compass.validate_pairs --input=data/expanded_values.csv --output=data/validation_report.json
+
+    # Large pair sets: keep counters only and stream the violations
+    python -m values_compass.validate_pairs --output=data/validation_report.json \
+        --summary-only --violations-output=data/violations.ndjson
+
+    # Nightly runs: validate only the combinations affected by taxonomy changes
+    python -m values_compass.validate_pairs --output=data/validation_report.json \
+        --previous-state=data/validation_state --state-output=data/validation_state
 """
 
 import argparse
@@ -16,10 +24,31 @@ import csv
 import json
 import os
 import sys
+import tempfile
 from collections import defaultdict
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from values_compass.structures.complements import ComplementIndex
+from values_compass.structures.lattice import ValueLattice, load_lattice
+from values_compass.structures.snapshot import is_snapshot
+
+# Number of pair rows evaluated at once; bounds the size of the condition matrices
+TILE_ROWS = 256
 
-from values_compass.structures.lattice import ValueLattice
+# Number of failed combinations kept in a summary-only report
+FAILURE_SAMPLE_SIZE = 100
+
+# Row bands per worker process, so that workers finishing early pick up more work
+TASKS_PER_WORKER = 4
+
+# Files of a validation state directory, see save_validation_state()
+STATE_VERSION = 1
+STATE_SNAPSHOT = "lattice.snap"
+STATE_RESULTS = "validation_state.json"
 
 
 def load_values_data(filepath: str) -> List[Dict[str, Any]]:
@@ -46,33 +75,26 @@ def load_values_data(filepath: str) -> List[Dict[str, Any]]:
     return values_data
 
 
-def extract_antonym_pairs(values_data: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+def extract_antonym_pairs(values_data: List[Dict[str, Any]]) -> ComplementIndex:
     """
     Extract value/anti-value pairs from values data.
+
+    Every value is paired with every anti-value of the same root value. The
+    pairs are not materialized: the result is a ComplementIndex holding the
+    values and anti-values of each root, which generates the pairs lazily.
     
     Args:
         values_data: List of dictionaries with value data
         
     Returns:
-        List of tuples (value, anti_value)
+        Sequence of tuples (value, anti_value)
     """
-    antonym_pairs = []
-
     # Group values by root_value
-    by_root = defaultdict(list)
+    by_root = defaultdict(lambda: ([], []))
     for entry in values_data:
-        by_root[entry['root_value']].append(entry)
-
-    # Find value/anti-value pairs
-    for root, entries in by_root.items():
-        values = [e['value'] for e in entries if not e['is_anti_value']]
-        anti_values = [e['value'] for e in entries if e['is_anti_value']]
+        by_root[entry['root_value']][1 if entry['is_anti_value'] else 0].append(entry['value'])
 
-        for value in values:
-            for anti_value in anti_values:
-                antonym_pairs.append((value, anti_value))
-
-    return antonym_pairs
+    return ComplementIndex.from_groups(by_root.values())
 
 
 def validate_galois_connection(lattice: ValueLattice, pair1: Tuple[str, str], pair2: Tuple[str, str]) -> Dict[str, Any]:
@@ -105,51 +127,365 @@ def validate_galois_connection(lattice: ValueLattice, pair1: Tuple[str, str], pa
     }
 
 
-def validate_all_pairs(lattice: ValueLattice, antonym_pairs: List[Tuple[str, str]]) -> Dict[str, Any]:
+def encode_pairs(lattice: ValueLattice, antonym_pairs: Sequence[Tuple[str, str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode value/anti-value pairs as two index vectors.
+
+    Values of the lattice are encoded by their index. Names missing from the
+    lattice get distinct negative ids, so that equal names still compare equal.
+
+    Args:
+        lattice: The value lattice structure
+        antonym_pairs: List of value/anti-value pairs
+
+    Returns:
+        Tuple of (value ids, anti-value ids)
+    """
+    ids = {}
+    index = lattice.reachability.index
+
+    def encode(name: str) -> int:
+        if name in index:
+            return index[name]
+        return ids.setdefault(name, -1 - len(ids))
+
+    if isinstance(antonym_pairs, ComplementIndex):
+        # Encode each name once and gather the pair space from the index arrays
+        name_ids = np.array([encode(name) for name in antonym_pairs.names], dtype=np.int64)
+        values, anti_values = antonym_pairs.pair_arrays()
+        return name_ids[values], name_ids[anti_values]
+
+    values = np.array([encode(value) for value, _ in antonym_pairs], dtype=np.int64)
+    anti_values = np.array([encode(anti_value) for _, anti_value in antonym_pairs], dtype=np.int64)
+    return values, anti_values
+
+
+def condition_matrix(lattice: ValueLattice, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """
+    Check rows[i] ≤ cols[j] for every combination of encoded values.
+
+    Args:
+        lattice: The value lattice structure
+        rows: Value ids, as returned by encode_pairs()
+        cols: Value ids, as returned by encode_pairs()
+
+    Returns:
+        Boolean matrix of shape (len(rows), len(cols)), agreeing with
+        lattice.is_less_than_or_equal() on the corresponding names
+    """
+    result = rows[:, None] == cols[None, :]
+    known_rows, known_cols = np.flatnonzero(rows >= 0), np.flatnonzero(cols >= 0)
+    result[np.ix_(known_rows, known_cols)] |= lattice.leq_matrix(rows[known_rows], cols[known_cols])
+    return result
+
+
+def evaluate_tile(
+    lattice: ValueLattice,
+    values: np.ndarray,
+    anti_values: np.ndarray,
+    rows: slice,
+    cols: slice
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate the Galois conditions on a tile of the pair-combination space.
+
+    Entry (i, j) of the tile combines pair1 = pairs[rows][i] with
+    pair2 = pairs[cols][j]. Condition 1 is anti_value1 ≤ value2 and
+    condition 2 is value1 ≤ anti_value2; both are slices of the closure.
+
+    Args:
+        lattice: The value lattice structure
+        values: Value ids of all pairs, as returned by encode_pairs()
+        anti_values: Anti-value ids of all pairs
+        rows: Range of pair1 positions
+        cols: Range of pair2 positions
+
+    Returns:
+        Tuple of boolean matrices (condition1, condition2, checked), where
+        checked marks the combinations of the upper triangle (pair2 not
+        before pair1) whose pairs differ
+    """
+    row_values, row_anti = values[rows], anti_values[rows]
+    col_values, col_anti = values[cols], anti_values[cols]
+
+    condition1 = condition_matrix(lattice, row_anti, col_values)
+    condition2 = condition_matrix(lattice, row_values, col_anti)
+
+    row_positions = np.arange(len(values))[rows]
+    col_positions = np.arange(len(values))[cols]
+    same_pair = (row_values[:, None] == col_values[None, :]) & (row_anti[:, None] == col_anti[None, :])
+    checked = (col_positions[None, :] >= row_positions[:, None]) & ~same_pair
+    return condition1, condition2, checked
+
+
+def split_upper_triangle(n_pairs: int, n_bands: int) -> List[slice]:
+    """
+    Split the upper triangle of the pair-combination space into row bands.
+
+    Row i of the triangle holds n_pairs - i combinations, so bands near the
+    top have fewer rows; every band holds about the same number of
+    combinations.
+
+    Args:
+        n_pairs: Number of value/anti-value pairs
+        n_bands: Requested number of bands
+
+    Returns:
+        Non-empty row ranges covering all pairs, in order
+    """
+    if n_pairs == 0:
+        return []
+    combinations = np.cumsum(np.arange(n_pairs, 0, -1))
+    targets = combinations[-1] * np.arange(1, n_bands) / n_bands
+    boundaries = np.unique(np.searchsorted(combinations, targets, side='right'))
+    boundaries = [0] + [int(b) for b in boundaries if 0 < b < n_pairs] + [n_pairs]
+    return [slice(a, b) for a, b in zip(boundaries[:-1], boundaries[1:])]
+
+
+def iter_validation_tiles(
+    lattice: ValueLattice,
+    values: np.ndarray,
+    anti_values: np.ndarray,
+    band: Optional[slice] = None
+) -> Iterator[Tuple[slice, slice, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Evaluate the upper triangle of the pair-combination space tile by tile.
+
+    Tiles are bands of TILE_ROWS pairs, in the order of the original
+    pair-by-pair loop.
+
+    Args:
+        lattice: The value lattice structure
+        values: Value ids of all pairs, as returned by encode_pairs()
+        anti_values: Anti-value ids of all pairs
+        band: Optional range of pair1 positions to evaluate, all pairs by default
+
+    Yields:
+        Tuples of (rows, cols, condition1, condition2, checked), see evaluate_tile()
+    """
+    n_pairs = len(values)
+    band = band if band is not None else slice(0, n_pairs)
+
+    for start in range(band.start, band.stop, TILE_ROWS):
+        rows, cols = slice(start, min(start + TILE_ROWS, band.stop)), slice(start, n_pairs)
+        yield (rows, cols) + evaluate_tile(lattice, values, anti_values, rows, cols)
+
+
+def _validate_band(
+    lattice: ValueLattice,
+    encoded: Tuple[np.ndarray, np.ndarray],
+    band: slice,
+    summary_only: bool,
+    record_limit: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Validate the combinations of one row band.
+
+    Returns the counters of the band and the combinations to record as an
+    array of (pair1 position, pair2 position, condition1, condition2) rows:
+    every checked combination, or only the failed ones with summary_only.
+    """
+    n_pairs = len(encoded[0])
+    partial = {
+        "valid": 0,
+        "invalid": 0,
+        "valid_counts": np.zeros(n_pairs, dtype=np.int64),
+        "invalid_counts": np.zeros(n_pairs, dtype=np.int64)
+    }
+
+    recorded = []
+    n_recorded = 0
+    for rows, cols, condition1, condition2, checked in iter_validation_tiles(lattice, *encoded, band):
+        is_galois = condition1 == condition2
+        valid = is_galois & checked
+        invalid = checked & ~is_galois
+        partial["valid"] += int(np.count_nonzero(valid))
+        partial["invalid"] += int(np.count_nonzero(invalid))
+
+        # Each combination counts for both of its pairs
+        partial["valid_counts"][rows] += valid.sum(axis=1)
+        partial["valid_counts"][cols] += valid.sum(axis=0)
+        partial["invalid_counts"][rows] += invalid.sum(axis=1)
+        partial["invalid_counts"][cols] += invalid.sum(axis=0)
+
+        if record_limit is not None and n_recorded >= record_limit:
+            continue
+        i, j = np.nonzero(invalid if summary_only else checked)
+        if record_limit is not None:
+            i, j = i[:record_limit - n_recorded], j[:record_limit - n_recorded]
+        recorded.append(np.column_stack([i + rows.start, j + cols.start, condition1[i, j], condition2[i, j]]))
+        n_recorded += len(i)
+
+    partial["combinations"] = np.concatenate(recorded) if recorded else np.empty((0, 4), dtype=np.int64)
+    return partial
+
+
+# State of a validation worker process, set up by _init_worker()
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(snapshot_path: str, encoded: Tuple[np.ndarray, np.ndarray], summary_only: bool,
+                 record_limit: Optional[int]) -> None:
+    """Open the shared lattice snapshot in a worker process."""
+    _worker_state["lattice"] = ValueLattice.open_snapshot(snapshot_path)
+    _worker_state["arguments"] = (encoded, summary_only, record_limit)
+
+
+def _validate_band_worker(band: slice) -> Dict[str, Any]:
+    """Validate one row band in a worker process."""
+    encoded, summary_only, record_limit = _worker_state["arguments"]
+    return _validate_band(_worker_state["lattice"], encoded, band, summary_only, record_limit)
+
+
+def _pair_validation(
+    pair1: Tuple[str, str],
+    pair2: Tuple[str, str],
+    condition1: bool,
+    condition2: bool
+) -> Dict[str, Any]:
+    """Build the result dictionary of one pair combination."""
+    value1, anti_value1 = pair1
+    value2, anti_value2 = pair2
+    return {
+        "pair1": {"value": value1, "anti_value": anti_value1},
+        "pair2": {"value": value2, "anti_value": anti_value2},
+        "is_galois_connection": condition1 == condition2,
+        "condition1": condition1,
+        "condition2": condition2
+    }
+
+
+def _pair_statistics(
+    antonym_pairs: Sequence[Tuple[str, str]],
+    valid_counts: np.ndarray,
+    invalid_counts: np.ndarray
+) -> List[Dict[str, Any]]:
+    """Build the per-pair counts of valid and invalid combinations."""
+    return [
+        {"value": value, "anti_value": anti_value, "valid": valid, "invalid": invalid}
+        for (value, anti_value), valid, invalid
+        in zip(antonym_pairs, valid_counts.tolist(), invalid_counts.tolist())
+    ]
+
+
+def validate_all_pairs(
+    lattice: ValueLattice,
+    antonym_pairs: Sequence[Tuple[str, str]],
+    summary_only: bool = False,
+    violations_output: Optional[str] = None,
+    max_failure_samples: int = FAILURE_SAMPLE_SIZE,
+    workers: int = 1,
+    snapshot_path: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Validate Galois connection properties for all pairs of value/anti-value pairs.
+
+    The combinations are evaluated as boolean matrices, one band of
+    TILE_ROWS pairs at a time, instead of two scalar order checks each.
+
+    By default every combination is recorded in "pair_validations". With
+    summary_only, the results keep only the counters and the first failed
+    combinations, so memory does not grow with the number of combinations.
+    Both include the valid and invalid counts of every pair in
+    "pair_statistics".
+
+    With several workers, the upper triangle is split into row bands of
+    equal size that are validated in a process pool. Each worker opens the
+    lattice snapshot memory-mapped instead of receiving a pickled lattice,
+    and band results are merged in row order, so the results do not depend
+    on the number of workers.
     
     Args:
         lattice: The value lattice structure
         antonym_pairs: List of value/anti-value pairs
+        summary_only: Whether to leave out the per-combination results
+        violations_output: Optional path of an NDJSON file receiving every
+            failed combination, one line each, as validation runs
+        max_failure_samples: Number of failed combinations kept with summary_only
+        workers: Number of worker processes
+        snapshot_path: Snapshot of the lattice for the workers; a temporary
+            snapshot is written if not given
         
     Returns:
         Dictionary with validation results
+
+    Raises:
+        ValueError: If workers is less than 1
     """
+    if workers < 1:
+        raise ValueError(f"Number of workers must be at least 1, got {workers}")
+
+    n_pairs = len(antonym_pairs)
     validation_results = {
         "summary": {
-            "total_pairs": len(antonym_pairs),
-            "total_pair_combinations": 0,
+            "total_pairs": n_pairs,
+            # Every combination of the upper triangle, including a pair with itself
+            "total_pair_combinations": n_pairs * (n_pairs + 1) // 2,
             "valid_galois_connections": 0,
             "invalid_galois_connections": 0
-        },
-        "pair_validations": []
+        }
     }
-
-    # Validate all combinations of pairs
-    total_combinations = 0
-    for i, pair1 in enumerate(antonym_pairs):
-        for pair2 in antonym_pairs[i:]:
-            total_combinations += 1
-
-            # Skip the same pair
-            if pair1 == pair2:
-                continue
-
-            result = validate_galois_connection(lattice, pair1, pair2)
-            validation_results["pair_validations"].append(result)
-
-            if result["is_galois_connection"]:
-                validation_results["summary"]["valid_galois_connections"] += 1
-            else:
-                validation_results["summary"]["invalid_galois_connections"] += 1
-
-    validation_results["summary"]["total_pair_combinations"] = total_combinations
+    summary = validation_results["summary"]
+
+    if summary_only:
+        failure_samples = validation_results["failure_samples"] = []
+    else:
+        pair_validations = validation_results["pair_validations"] = []
+    valid_counts = np.zeros(n_pairs, dtype=np.int64)
+    invalid_counts = np.zeros(n_pairs, dtype=np.int64)
+
+    encoded = encode_pairs(lattice, antonym_pairs)
+    # Without a violations file, a summary only needs the first failures
+    record_limit = max_failure_samples if summary_only and not violations_output else None
+    bands = split_upper_triangle(n_pairs, max(workers * TASKS_PER_WORKER, -(-n_pairs // TILE_ROWS)))
+
+    with ExitStack() as stack:
+        if workers > 1 and len(bands) > 1:
+            if snapshot_path is None:
+                snapshot_dir = stack.enter_context(tempfile.TemporaryDirectory())
+                snapshot_path = os.path.join(snapshot_dir, "lattice.snap")
+                lattice.save_snapshot(snapshot_path)
+            pool = stack.enter_context(ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker,
+                initargs=(str(snapshot_path), encoded, summary_only, record_limit)
+            ))
+            partials = pool.map(_validate_band_worker, bands)
+        else:
+            partials = (
+                _validate_band(lattice, encoded, band, summary_only, record_limit) for band in bands
+            )
+
+        violations = stack.enter_context(open(violations_output, 'w')) if violations_output else None
+        for partial in partials:
+            summary["valid_galois_connections"] += partial["valid"]
+            summary["invalid_galois_connections"] += partial["invalid"]
+            valid_counts += partial["valid_counts"]
+            invalid_counts += partial["invalid_counts"]
+
+            for i, j, condition1, condition2 in partial["combinations"].tolist():
+                result = _pair_validation(antonym_pairs[i], antonym_pairs[j], bool(condition1), bool(condition2))
+                if not summary_only:
+                    pair_validations.append(result)
+                elif len(failure_samples) < max_failure_samples:
+                    failure_samples.append(result)
+                if violations and not result["is_galois_connection"]:
+                    violations.write(json.dumps(result, separators=(",", ":")) + "\n")
+
+    validation_results["pair_statistics"] = _pair_statistics(antonym_pairs, valid_counts, invalid_counts)
 
     return validation_results
 
 
-def generate_validation_report(values_data: List[Dict[str, Any]], taxonomy_path: str, output_path: str) -> Dict[str, Any]:
+def generate_validation_report(
+    values_data: List[Dict[str, Any]],
+    taxonomy_path: str,
+    output_path: str,
+    summary_only: bool = False,
+    violations_output: Optional[str] = None,
+    max_failure_samples: int = FAILURE_SAMPLE_SIZE,
+    workers: int = 1,
+    state_output: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Generate a validation report for value/anti-value pairs.
     
@@ -157,18 +493,27 @@ def generate_validation_report(values_data: List[Dict[str, Any]], taxonomy_path:
         values_data: List of dictionaries with value data
         taxonomy_path: Path to taxonomy JSON file
         output_path: Path to output validation report
+        summary_only: Whether to keep only counters and a sample of failures
+        violations_output: Optional path of an NDJSON file for every failed combination
+        max_failure_samples: Number of failed combinations kept with summary_only
+        workers: Number of worker processes
+        state_output: Optional directory to save the validation state to
         
     Returns:
         Dictionary with validation report
     """
     # Load the lattice structure
-    lattice = ValueLattice(taxonomy_path)
+    lattice = load_lattice(taxonomy_path)
 
     # Extract value/anti-value pairs
     antonym_pairs = extract_antonym_pairs(values_data)
 
     # Validate Galois connection properties
-    validation_results = validate_all_pairs(lattice, antonym_pairs)
+    validation_results = validate_all_pairs(
+        lattice, antonym_pairs, summary_only=summary_only,
+        violations_output=violations_output, max_failure_samples=max_failure_samples,
+        workers=workers, snapshot_path=taxonomy_path if is_snapshot(taxonomy_path) else None
+    )
 
     # Add metadata
     validation_report = {
@@ -183,14 +528,329 @@ def generate_validation_report(values_data: List[Dict[str, Any]], taxonomy_path:
         },
         "validation_results": validation_results
     }
+    if violations_output:
+        validation_report["metadata"]["violations_file"] = violations_output
 
     # Save to JSON
     with open(output_path, 'w') as f:
         json.dump(validation_report, f, indent=2)
 
+    if state_output:
+        save_validation_state(state_output, lattice, validation_results, max_failure_samples)
+
     return validation_report
 
 
+def save_validation_state(
+    state_dir: str,
+    lattice: ValueLattice,
+    validation_results: Dict[str, Any],
+    max_failure_samples: int = FAILURE_SAMPLE_SIZE
+) -> None:
+    """
+    Save what an incremental revalidation needs from a validation run.
+
+    The state directory holds a snapshot of the validated lattice and the
+    summary of the results: counters, per-pair counts and failure samples.
+
+    Args:
+        state_dir: Directory to write the state to
+        lattice: The validated lattice
+        validation_results: Results of validate_all_pairs() or revalidate_pairs()
+        max_failure_samples: Number of failed combinations kept in the state
+    """
+    os.makedirs(state_dir, exist_ok=True)
+
+    # Replace the files rather than overwriting them: the previous snapshot
+    # may still be memory-mapped when the state is updated in place
+    snapshot_path = os.path.join(state_dir, STATE_SNAPSHOT)
+    lattice.save_snapshot(snapshot_path + ".tmp")
+    os.replace(snapshot_path + ".tmp", snapshot_path)
+
+    failure_samples = validation_results.get("failure_samples")
+    if failure_samples is None:
+        failure_samples = [
+            result for result in validation_results["pair_validations"]
+            if not result["is_galois_connection"]
+        ][:max_failure_samples]
+
+    results_path = os.path.join(state_dir, STATE_RESULTS)
+    with open(results_path + ".tmp", 'w') as f:
+        json.dump({
+            "version": STATE_VERSION,
+            "summary": validation_results["summary"],
+            "failure_samples": failure_samples,
+            "pair_statistics": validation_results["pair_statistics"]
+        }, f)
+    os.replace(results_path + ".tmp", results_path)
+
+
+def load_validation_state(state_dir: str) -> Tuple[ValueLattice, Dict[str, Any]]:
+    """
+    Load a validation state written by save_validation_state().
+
+    Args:
+        state_dir: Directory of the state
+
+    Returns:
+        Tuple of (previously validated lattice, summary-only validation results)
+
+    Raises:
+        ValueError: If the state was written by an unsupported version
+    """
+    with open(os.path.join(state_dir, STATE_RESULTS), 'r') as f:
+        state = json.load(f)
+    if state.get("version") != STATE_VERSION:
+        raise ValueError(
+            f"Unsupported validation state version {state.get('version')} in {state_dir}, "
+            f"expected {STATE_VERSION}"
+        )
+    lattice = ValueLattice.open_snapshot(os.path.join(state_dir, STATE_SNAPSHOT))
+    del state["version"]
+    return lattice, state
+
+
+def _order_sets(lattice: ValueLattice, value: str) -> Tuple[frozenset, frozenset]:
+    """Return the names of the values above and below a value."""
+    reachability = lattice.reachability
+    c = reachability.class_of(value)
+
+    def names(classes: np.ndarray) -> frozenset:
+        return frozenset(reachability.names[i] for k in classes.tolist() for i in reachability.members[k])
+
+    return names(reachability.upper_set(c)), names(reachability.lower_set(c))
+
+
+def changed_order_values(previous: ValueLattice, current: ValueLattice) -> Tuple[set, set]:
+    """
+    Find the values whose up-set or down-set differs between two lattices.
+
+    Only values related to an endpoint of an added or removed partial order
+    edge can change, so the comparison is limited to the down-sets and
+    up-sets of those endpoints in either lattice. Values present in only one
+    of the lattices count as changed in both directions.
+
+    Args:
+        previous: Lattice of the previous taxonomy
+        current: Lattice of the new taxonomy
+
+    Returns:
+        Tuple of (values whose up-set changed, values whose down-set changed)
+    """
+    previous_values = set(previous.reachability.names)
+    current_values = set(current.reachability.names)
+    added_or_removed = previous_values ^ current_values
+    up_changed, down_changed = set(added_or_removed), set(added_or_removed)
+
+    changed_edges = set(previous.graph.edges()) ^ set(current.graph.edges())
+    endpoints = {value for edge in changed_edges for value in edge} & previous_values & current_values
+    if not endpoints:
+        return up_changed, down_changed
+
+    # Candidates: values below an endpoint may gain or lose upper bounds, and vice versa
+    below, above = set(), set()
+    for lattice in (previous, current):
+        for value in endpoints:
+            upper, lower = _order_sets(lattice, value)
+            below |= lower
+            above |= upper
+
+    common = previous_values & current_values
+    for value in (below | above) & common:
+        previous_up, previous_down = _order_sets(previous, value)
+        current_up, current_down = _order_sets(current, value)
+        if value in below and previous_up != current_up:
+            up_changed.add(value)
+        if value in above and previous_down != current_down:
+            down_changed.add(value)
+
+    return up_changed, down_changed
+
+
+def revalidate_pairs(
+    lattice: ValueLattice,
+    antonym_pairs: Sequence[Tuple[str, str]],
+    previous_lattice: ValueLattice,
+    previous_results: Dict[str, Any],
+    max_failure_samples: int = FAILURE_SAMPLE_SIZE
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Update summary-only validation results after a taxonomy change.
+
+    Condition anti_value1 ≤ value2 can only change if the up-set of
+    anti_value1 and the down-set of value2 both changed, and likewise for
+    value1 ≤ anti_value2. Only the combinations whose first pair has a value
+    with a changed up-set and whose second pair has a value with a changed
+    down-set are evaluated, against both lattices, and the counters of the
+    previous results are adjusted by the differences.
+
+    If the list of pairs changed, all combinations are validated again.
+
+    Args:
+        lattice: Lattice of the new taxonomy
+        antonym_pairs: List of value/anti-value pairs
+        previous_lattice: Lattice of the previously validated taxonomy
+        previous_results: Summary-only results of the previous validation
+        max_failure_samples: Number of failed combinations kept in the results
+
+    Returns:
+        Tuple of (updated summary-only validation results, delta with the
+        changed values and the combinations whose result changed)
+    """
+    previous_pairs = [(stats["value"], stats["anti_value"]) for stats in previous_results["pair_statistics"]]
+    if previous_pairs != list(antonym_pairs):
+        validation_results = validate_all_pairs(
+            lattice, antonym_pairs, summary_only=True, max_failure_samples=max_failure_samples
+        )
+        return validation_results, {"full_revalidation": True, "reason": "the value/anti-value pairs changed"}
+
+    up_changed, down_changed = changed_order_values(previous_lattice, lattice)
+
+    values, anti_values = encode_pairs(lattice, antonym_pairs)
+    previous_values, previous_anti_values = encode_pairs(previous_lattice, antonym_pairs)
+    first = np.flatnonzero([value in up_changed or anti_value in up_changed for value, anti_value in antonym_pairs])
+    second = np.flatnonzero([value in down_changed or anti_value in down_changed for value, anti_value in antonym_pairs])
+
+    valid_counts = np.array([stats["valid"] for stats in previous_results["pair_statistics"]], dtype=np.int64)
+    invalid_counts = np.array([stats["invalid"] for stats in previous_results["pair_statistics"]], dtype=np.int64)
+    reevaluated = 0
+    changes = []
+    # Combinations that still fail, but on the other condition
+    flipped = {}
+
+    def key(result: Dict[str, Any]) -> Tuple[str, ...]:
+        return (result["pair1"]["value"], result["pair1"]["anti_value"],
+                result["pair2"]["value"], result["pair2"]["anti_value"])
+
+    for start in range(0, len(first), TILE_ROWS):
+        rows = first[start:start + TILE_ROWS]
+        condition1, condition2, checked = evaluate_tile(lattice, values, anti_values, rows, second)
+        previous1, previous2, _ = evaluate_tile(previous_lattice, previous_values, previous_anti_values, rows, second)
+        reevaluated += int(np.count_nonzero(checked))
+
+        # Combinations whose result changed, with +1 for newly valid and -1 for newly invalid
+        difference = ((condition1 == condition2).astype(np.int64) - (previous1 == previous2)) * checked
+        np.add.at(valid_counts, rows, difference.sum(axis=1))
+        np.add.at(valid_counts, second, difference.sum(axis=0))
+        np.add.at(invalid_counts, rows, -difference.sum(axis=1))
+        np.add.at(invalid_counts, second, -difference.sum(axis=0))
+
+        for i, j in zip(*np.nonzero(difference)):
+            change = _pair_validation(
+                antonym_pairs[rows[i]], antonym_pairs[second[j]],
+                bool(condition1[i, j]), bool(condition2[i, j])
+            )
+            change["previous"] = {
+                "is_galois_connection": bool(previous1[i, j] == previous2[i, j]),
+                "condition1": bool(previous1[i, j]),
+                "condition2": bool(previous2[i, j])
+            }
+            changes.append(change)
+
+        still_failing = checked & (condition1 != condition2) & (previous1 != previous2)
+        for i, j in zip(*np.nonzero(still_failing & (condition1 != previous1))):
+            result = _pair_validation(
+                antonym_pairs[rows[i]], antonym_pairs[second[j]],
+                bool(condition1[i, j]), bool(condition2[i, j])
+            )
+            flipped[key(result)] = result
+
+    newly_valid = sum(change["is_galois_connection"] for change in changes)
+    newly_invalid = len(changes) - newly_valid
+
+    summary = dict(previous_results["summary"])
+    summary["valid_galois_connections"] += newly_valid - newly_invalid
+    summary["invalid_galois_connections"] += newly_invalid - newly_valid
+
+    # Keep the samples that still fail, with their current conditions, and add the new failures
+    fixed = {key(change) for change in changes if change["is_galois_connection"]}
+    failure_samples = [
+        flipped.get(key(result), result)
+        for result in previous_results["failure_samples"] if key(result) not in fixed
+    ]
+    failure_samples += [
+        {name: change[name] for name in change if name != "previous"}
+        for change in changes if not change["is_galois_connection"]
+    ]
+
+    validation_results = {
+        "summary": summary,
+        "failure_samples": failure_samples[:max_failure_samples],
+        "pair_statistics": _pair_statistics(antonym_pairs, valid_counts, invalid_counts)
+    }
+    delta = {
+        "full_revalidation": False,
+        "up_set_changed": sorted(up_changed),
+        "down_set_changed": sorted(down_changed),
+        "summary": {
+            "reevaluated_combinations": reevaluated,
+            "newly_valid_galois_connections": newly_valid,
+            "newly_invalid_galois_connections": newly_invalid
+        },
+        "changes": changes
+    }
+    return validation_results, delta
+
+
+def generate_incremental_report(
+    values_data: List[Dict[str, Any]],
+    taxonomy_path: str,
+    output_path: str,
+    previous_state: str,
+    delta_output: str,
+    max_failure_samples: int = FAILURE_SAMPLE_SIZE,
+    state_output: Optional[str] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Generate an updated validation report from a previous validation state.
+
+    Args:
+        values_data: List of dictionaries with value data
+        taxonomy_path: Path to the new taxonomy JSON file
+        output_path: Path to output the updated validation report
+        previous_state: Directory written by save_validation_state()
+        delta_output: Path to output the delta report
+        max_failure_samples: Number of failed combinations kept in the report
+        state_output: Optional directory to save the updated validation state to
+
+    Returns:
+        Tuple of (updated validation report, delta report)
+    """
+    lattice = load_lattice(taxonomy_path)
+    previous_lattice, previous_results = load_validation_state(previous_state)
+    antonym_pairs = extract_antonym_pairs(values_data)
+
+    validation_results, delta = revalidate_pairs(
+        lattice, antonym_pairs, previous_lattice, previous_results, max_failure_samples
+    )
+
+    metadata = {
+        "total_values": len(values_data),
+        "taxonomy_file": taxonomy_path,
+        "values_file": output_path,
+        "previous_state": previous_state
+    }
+    validation_report = {
+        "metadata": metadata,
+        "lattice_properties": {
+            "is_lattice": lattice.is_lattice,
+            "is_complete_lattice": lattice.is_complete_lattice
+        },
+        "validation_results": validation_results
+    }
+    delta_report = {"metadata": metadata, "delta": delta}
+
+    with open(output_path, 'w') as f:
+        json.dump(validation_report, f, indent=2)
+    with open(delta_output, 'w') as f:
+        json.dump(delta_report, f, indent=2)
+
+    if state_output:
+        save_validation_state(state_output, lattice, validation_results, max_failure_samples)
+
+    return validation_report, delta_report
+
+
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -199,9 +859,25 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument('--input', default='data/expanded_values.csv',
                         help='Path to input values CSV file')
     parser.add_argument('--taxonomy', default='data/formal_taxonomy.json',
-                        help='Path to formal taxonomy JSON file')
+                        help='Path to formal taxonomy JSON file or lattice snapshot')
     parser.add_argument('--output', required=True,
                         help='Path to output validation report JSON file')
+    parser.add_argument('--summary-only', action='store_true',
+                        help='Keep only counters and a sample of failed combinations in the report')
+    parser.add_argument('--max-failure-samples', type=int, default=FAILURE_SAMPLE_SIZE,
+                        help='Number of failed combinations kept with --summary-only')
+    parser.add_argument('--violations-output',
+                        help='Path to an NDJSON file receiving every failed combination as it is found')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of worker processes validating pair combinations')
+    parser.add_argument('--state-output',
+                        help='Directory to save the validation state to, for later incremental runs')
+    parser.add_argument('--previous-state',
+                        help='Validation state of a previous run; only combinations affected by '
+                             'taxonomy changes are validated again')
+    parser.add_argument('--delta-output',
+                        help='Path to output the delta report with --previous-state '
+                             '(default: the report path with a _delta suffix)')
 
     return parser.parse_args()
 
@@ -228,8 +904,30 @@ def main() -> int:
         # Load values data
         values_data = load_values_data(args.input)
 
-        # Generate validation report
-        report = generate_validation_report(values_data, args.taxonomy, args.output)
+        if args.previous_state:
+            # Revalidate the combinations affected by taxonomy changes
+            delta_output = args.delta_output or "{}_delta{}".format(*os.path.splitext(args.output))
+            report, delta_report = generate_incremental_report(
+                values_data, args.taxonomy, args.output, args.previous_state,
+                delta_output, max_failure_samples=args.max_failure_samples,
+                state_output=args.state_output
+            )
+            delta = delta_report["delta"]
+            if delta["full_revalidation"]:
+                print(f"All combinations validated again: {delta['reason']}")
+            else:
+                print(f"Re-evaluated {delta['summary']['reevaluated_combinations']} combinations, "
+                      f"{len(delta['changes'])} changed; delta report saved to {delta_output}")
+        else:
+            # Generate validation report
+            report = generate_validation_report(
+                values_data, args.taxonomy, args.output,
+                summary_only=args.summary_only,
+                violations_output=args.violations_output,
+                max_failure_samples=args.max_failure_samples,
+                workers=args.workers,
+                state_output=args.state_output
+            )
 
         # Print summary
         print(f"Validation report created successfully and saved to {args.output}")
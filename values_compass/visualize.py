@@ -15,10 +15,10 @@ import os
 import sys
 from collections import defaultdict
 
-import matplotlib.pyplot as plt
 import networkx as nx
 
-from values_compass.structures.lattice import ValueLattice
+from values_compass.structures.lattice import load_lattice
+from values_compass.structures.taxonomy_stream import load_taxonomy
 
 
 def visualize_lattice(lattice_path: str, output_path: str, max_nodes: int = 50) -> None:
@@ -31,7 +31,7 @@ def visualize_lattice(lattice_path: str, output_path: str, max_nodes: int = 50)
         max_nodes: Maximum number of nodes to include in the visualization
     """
     # Load the lattice structure
-    lattice = ValueLattice(lattice_path)
+    lattice = load_lattice(lattice_path)
 
     # Create a simplified visualization of the lattice
     lattice.visualize(output_path, max_nodes=max_nodes)
@@ -50,7 +50,7 @@ def visualize_hasse_diagram(lattice_path: str, output_path: str, max_nodes: int
         max_nodes: Maximum number of nodes to include in the visualization
     """
     # Load the lattice structure
-    lattice = ValueLattice(lattice_path)
+    lattice = load_lattice(lattice_path)
 
     # Make a copy of the graph without self-loops for Hasse diagram
     G_no_loops = nx.DiGraph()
@@ -92,6 +92,8 @@ def visualize_hasse_diagram(lattice_path: str, output_path: str, max_nodes: int
             nodes = list(G_hasse.nodes())[:max_nodes]
             G_hasse = G_hasse.subgraph(nodes)
 
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(15, 12))
 
     # Use hierarchical layout if pygraphviz is available, otherwise use spring layout
@@ -147,11 +149,20 @@ def visualize_galois_connections(validation_path: str, output_path: str) -> None
         validation_report = json.load(f)
 
     # Extract validation results
-    validations = validation_report["validation_results"]["pair_validations"]
+    validation_results = validation_report["validation_results"]
+    validations = validation_results.get("pair_validations", [])
 
     # Count valid and invalid connections for each pair
     pair_stats = defaultdict(lambda: {"valid": 0, "invalid": 0, "total": 0})
 
+    # Summary-only reports carry the per-pair counts instead of every combination
+    statistics = validation_results.get("pair_statistics", []) if not validations else []
+    for stats in statistics:
+        pair_key = f"{stats['value']} / {stats['anti_value']}"
+        pair_stats[pair_key]["valid"] += stats["valid"]
+        pair_stats[pair_key]["invalid"] += stats["invalid"]
+        pair_stats[pair_key]["total"] += stats["valid"] + stats["invalid"]
+
     for validation in validations:
         pair1 = (validation["pair1"]["value"], validation["pair1"]["anti_value"])
         pair2 = (validation["pair2"]["value"], validation["pair2"]["anti_value"])
@@ -175,6 +186,8 @@ def visualize_galois_connections(validation_path: str, output_path: str) -> None
     )
 
     # Create visualization
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(15, 10))
 
     pair_names = [pair[0] for pair in sorted_pairs[:20]]  # Top 20 pairs
@@ -206,8 +219,7 @@ def visualize_value_clusters(taxonomy_path: str, output_path: str) -> None:
         output_path: Path to save the visualization
     """
     # Load taxonomy data
-    with open(taxonomy_path, 'r') as f:
-        taxonomy = json.load(f)
+    taxonomy = load_taxonomy(taxonomy_path)
 
     # Create a graph from relations
     G = nx.Graph()
@@ -241,6 +253,8 @@ def visualize_value_clusters(taxonomy_path: str, output_path: str) -> None:
                     for node in com}
 
     # Get unique communities and assign colors
+    import matplotlib.pyplot as plt
+
     communities = set(partition.values())
     color_map = plt.cm.get_cmap('tab20', len(communities))
 
@@ -323,6 +337,11 @@ def main() -> int:
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir, exist_ok=True)
 
+    # The CLI only writes image files, so never start an interactive backend
+    if "MPLBACKEND" not in os.environ:
+        import matplotlib
+        matplotlib.use("Agg")
+
     try:
         # Choose visualization based on structure type
         if args.structure == 'lattice':
@@ -1,8 +1,20 @@
 """Clustering and taxonomy analysis for the Values-in-the-Wild dataset."""
 
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.feature_extraction.text import TfidfVectorizer
+from joblib import Parallel, delayed
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.metrics import silhouette_score
+from sklearn.metrics.pairwise import euclidean_distances
+from threadpoolctl import threadpool_limits
+
+# Dimension of the hashed feature space of the streaming clusterer
+HASHING_FEATURES = 2 ** 18
+# Label of values whose text has no terms to cluster on
+NO_CLUSTER = -1
 
 
 def vectorize_values(values_data, text_field: str = 'description'):
@@ -43,6 +55,107 @@ def cluster_values(feature_matrix, n_clusters: int = 5):
     return clusters
 
 
+def _fit_candidate(feature_matrix, k: int, sample_size: int, random_state: int) -> Tuple[int, KMeans, Dict[str, float]]:
+    """Fit KMeans for one candidate k and score the clustering."""
+    # Candidates run in parallel, so each fit uses a single thread
+    with threadpool_limits(limits=1):
+        model = KMeans(n_clusters=k, random_state=random_state).fit(feature_matrix)
+
+    labels = model.labels_
+    n_samples = feature_matrix.shape[0]
+    try:
+        silhouette = silhouette_score(
+            feature_matrix, labels, sample_size=min(sample_size, n_samples), random_state=random_state
+        )
+    except ValueError:
+        # The sample holds a single cluster
+        silhouette = np.nan
+
+    return k, model, {
+        'inertia': float(model.inertia_),
+        'silhouette': float(silhouette),
+        'davies_bouldin': _davies_bouldin(model, feature_matrix),
+    }
+
+
+def _davies_bouldin(model: KMeans, feature_matrix) -> float:
+    """
+    Compute the Davies-Bouldin index of a fitted model from its centroids.
+    
+    Unlike sklearn.metrics.davies_bouldin_score, this also works on sparse
+    matrices without densifying them.
+    """
+    labels = model.labels_
+    centers = model.cluster_centers_
+    k = len(centers)
+
+    # Mean distance of the members of each cluster to its centroid
+    distances = model.transform(feature_matrix)[np.arange(len(labels)), labels]
+    spread = np.bincount(labels, weights=distances, minlength=k) / np.maximum(np.bincount(labels, minlength=k), 1)
+
+    # Only k x k distances, never a k x k x n_features difference array
+    separation = euclidean_distances(centers)
+    np.fill_diagonal(separation, np.inf)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = (spread[:, None] + spread[None, :]) / separation
+    return float(np.mean(np.max(np.nan_to_num(ratios, nan=0.0), axis=1)))
+
+
+def select_n_clusters(
+    feature_matrix,
+    k_values: Iterable[int] = range(2, 21),
+    criterion: str = 'silhouette',
+    workers: Optional[int] = None,
+    sample_size: int = 2000,
+    random_state: int = 42
+) -> Tuple[int, KMeans, Dict[int, Dict[str, float]]]:
+    """
+    Choose the number of clusters by fitting candidate values of k in parallel.
+    
+    Each candidate is fitted in its own worker process with a single thread;
+    the feature matrix is shared with the workers as a read-only memory map
+    instead of being copied. Every clustering is scored by its inertia, a
+    silhouette score on a random sample of the rows and its Davies-Bouldin
+    index (computed from the centroids, so sparse matrices stay sparse).
+    
+    Args:
+        feature_matrix: Matrix of vectorized values (e.g. embeddings)
+        k_values: Candidate numbers of clusters
+        criterion: 'silhouette' to pick the highest sampled silhouette, or
+            'davies_bouldin' to pick the lowest Davies-Bouldin index
+        workers: Number of worker processes (None for all CPUs)
+        sample_size: Number of rows used for the silhouette score
+        random_state: Seed of the fits and of the silhouette sample
+        
+    Returns:
+        Tuple of (chosen k, KMeans model fitted with it, scores per k)
+        
+    Raises:
+        ValueError: If the criterion is unknown or no candidate k is valid
+    """
+    if criterion not in ('silhouette', 'davies_bouldin'):
+        raise ValueError(f"Unknown criterion '{criterion}', expected 'silhouette' or 'davies_bouldin'")
+
+    # Both scores need at least two clusters and fewer clusters than rows
+    n_samples = feature_matrix.shape[0]
+    candidates = sorted({k for k in k_values if 2 <= k < n_samples})
+    if not candidates:
+        raise ValueError(f"No valid number of clusters for {n_samples} rows")
+
+    results = Parallel(n_jobs=-1 if workers is None else workers)(
+        delayed(_fit_candidate)(feature_matrix, k, sample_size, random_state) for k in candidates
+    )
+
+    models = {k: model for k, model, _ in results}
+    scores = {k: score for k, _, score in results}
+    if criterion == 'silhouette':
+        best_k = max(candidates, key=lambda k: np.nan_to_num(scores[k]['silhouette'], nan=-np.inf))
+    else:
+        best_k = min(candidates, key=lambda k: scores[k]['davies_bouldin'])
+
+    return best_k, models[best_k], scores
+
+
 def analyze_value_clusters(values_data, clusters, text_field: str = 'description'):
     """
     Analyze clusters to identify common themes.
@@ -70,3 +183,197 @@ def analyze_value_clusters(values_data, clusters, text_field: str = 'description
         }
 
     return cluster_analysis
+
+
+def iter_text_batches(values_data, text_field: str = 'description', batch_size: int = 1024) -> Iterator[List[str]]:
+    """
+    Read the texts of a dataset in batches, without materializing them all.
+    
+    Missing texts are returned as empty strings, so that positions in the
+    batches match the rows of the dataset.
+    
+    Args:
+        values_data: Dataset containing values (Hugging Face dataset or iterable of dicts)
+        text_field: Field containing text to read
+        batch_size: Number of texts per batch
+        
+    Returns:
+        Iterator of lists of texts
+    """
+    if hasattr(values_data, 'iter') and hasattr(values_data, 'column_names'):
+        # Hugging Face datasets read batches straight from their Arrow columns
+        for batch in values_data.select_columns([text_field]).iter(batch_size=batch_size):
+            yield [text or '' for text in batch[text_field]]
+        return
+
+    items = iter(values_data)
+    while True:
+        batch = [item.get(text_field) or '' for item in islice(items, batch_size)]
+        if not batch:
+            return
+        yield batch
+
+
+class StreamingValueClusterer:
+    """
+    Cluster value texts in batches with bounded memory.
+    
+    Texts are vectorized with a stateless HashingVectorizer, so no vocabulary
+    has to be fitted over the whole corpus first, and the L2-normalized
+    sparse rows are clustered with MiniBatchKMeans. On unit vectors the
+    Euclidean k-means objective ranks clusters like cosine similarity.
+    Every call to partial_fit updates the centroids with one more batch, so
+    new values can be added without refitting.
+    
+    Texts without any hashed term (empty descriptions, or only stop words)
+    would all be the zero vector; they are left out of the fit and get the
+    label NO_CLUSTER.
+    """
+
+    def __init__(self, n_clusters: int = 5, n_features: int = HASHING_FEATURES, random_state: int = 42):
+        """
+        Initialize the clusterer.
+        
+        Args:
+            n_clusters: Number of clusters to create
+            n_features: Dimension of the hashed feature space
+            random_state: Seed of the centroid initialization
+        """
+        self.n_clusters = n_clusters
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features, stop_words='english', alternate_sign=False, norm='l2'
+        )
+        self.model = MiniBatchKMeans(n_clusters=n_clusters, random_state=random_state, n_init=3)
+        self.n_seen = 0
+        # Texts held back until there are enough to initialize the centroids
+        self._pending: List[str] = []
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether the centroids have been initialized."""
+        return hasattr(self.model, 'cluster_centers_')
+
+    def transform(self, texts: List[str]):
+        """
+        Vectorize texts.
+        
+        Args:
+            texts: Texts to vectorize
+            
+        Returns:
+            Sparse matrix of L2-normalized hashed term counts
+        """
+        return self.vectorizer.transform(texts)
+
+    def _with_terms(self, texts: List[str]):
+        """Vectorize texts and flag those with at least one hashed term."""
+        matrix = self.transform(texts)
+        return matrix, np.diff(matrix.indptr) > 0
+
+    def partial_fit(self, texts: List[str]) -> "StreamingValueClusterer":
+        """
+        Update the centroids with a batch of texts.
+        
+        Args:
+            texts: Batch of texts; texts without terms are skipped
+            
+        Returns:
+            The clusterer
+        """
+        matrix, has_terms = self._with_terms(texts)
+
+        if not self.is_fitted:
+            # The first update needs at least one text per cluster
+            self._pending.extend(text for text, keep in zip(texts, has_terms) if keep)
+            if len(self._pending) < self.n_clusters:
+                return self
+            matrix, self._pending = self.transform(self._pending), []
+        else:
+            matrix = matrix[has_terms]
+
+        if matrix.shape[0]:
+            self.model.partial_fit(matrix)
+            self.n_seen += matrix.shape[0]
+        return self
+
+    def fit(self, text_batches: Iterable[List[str]]) -> "StreamingValueClusterer":
+        """
+        Fit the centroids on a stream of text batches.
+        
+        Args:
+            text_batches: Iterable of lists of texts, e.g. from iter_text_batches
+            
+        Returns:
+            The clusterer
+            
+        Raises:
+            ValueError: If the stream has fewer texts with terms than clusters
+        """
+        for texts in text_batches:
+            self.partial_fit(texts)
+
+        if not self.is_fitted:
+            raise ValueError(
+                f"Need at least {self.n_clusters} texts with terms to fit {self.n_clusters} clusters, got {len(self._pending)}"
+            )
+        return self
+
+    def predict(self, texts: List[str]) -> np.ndarray:
+        """
+        Assign texts to their nearest centroid.
+        
+        Args:
+            texts: Texts to assign
+            
+        Returns:
+            Cluster assignment for each text, NO_CLUSTER for texts without terms
+        """
+        matrix, has_terms = self._with_terms(texts)
+        labels = np.full(len(texts), NO_CLUSTER, dtype=np.int32)
+        if has_terms.any():
+            labels[has_terms] = self.model.predict(matrix[has_terms])
+        return labels
+
+    def predict_batches(self, text_batches: Iterable[List[str]]) -> np.ndarray:
+        """
+        Assign a stream of text batches to their nearest centroid.
+        
+        Args:
+            text_batches: Iterable of lists of texts
+            
+        Returns:
+            Cluster assignment for each text, in stream order, NO_CLUSTER
+            for texts without terms
+        """
+        assignments = [self.predict(texts) for texts in text_batches if texts]
+        if not assignments:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate(assignments)
+
+
+def cluster_values_streaming(
+    values_data,
+    n_clusters: int = 5,
+    text_field: str = 'description',
+    batch_size: int = 1024
+):
+    """
+    Cluster values in batches, without vectorizing the whole dataset at once.
+    
+    The dataset is read twice: once to fit the centroids, once to assign
+    every value to a cluster.
+    
+    Args:
+        values_data: Dataset containing values
+        n_clusters: Number of clusters to create
+        text_field: Field containing text to cluster
+        batch_size: Number of values per batch
+        
+    Returns:
+        Tuple of (clusterer, cluster assignments for each value, NO_CLUSTER
+        for values without text)
+    """
+    clusterer = StreamingValueClusterer(n_clusters=n_clusters)
+    clusterer.fit(iter_text_batches(values_data, text_field, batch_size))
+    clusters = clusterer.predict_batches(iter_text_batches(values_data, text_field, batch_size))
+    return clusterer, clusters
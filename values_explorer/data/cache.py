@@ -0,0 +1,346 @@
+"""
+Columnar cache for the Values-in-the-Wild CSV files.
+
+Parsing values_tree.csv or values_frequencies.csv with pandas on every run
+infers object dtypes for every text column. load_values_csv parses a CSV
+once and stores every column as a .npy file in a cache directory keyed by
+the content hash of the CSV: numeric columns as parsed, text columns
+dictionary-encoded. Later loads memory-map the columns instead of parsing
+the CSV again.
+
+By default loads apply a typed schema:
+
+- cluster_id and parent_cluster_id are categorical
+- level is int8 (when it has no missing values)
+- percentage columns (pct_*) are float32
+- other text columns are loaded as strings
+- other numeric columns keep the dtype inferred by pandas
+
+Percentages are float32 in typed loads; as_float64 widens them back
+without float32 rounding noise. Untyped loads (typed=False) return the
+same dtypes and values as pd.read_csv, for code that writes reports from
+the data.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache layout or schema changes, to ignore older caches
+CACHE_VERSION = 2
+
+# Cache directory created next to the CSV file when none is given
+CACHE_DIR_NAME = ".cache"
+
+CATEGORICAL_COLUMNS = ("cluster_id", "parent_cluster_id")
+INT8_COLUMNS = ("level",)
+PERCENTAGE_PREFIX = "pct_"
+
+_SCHEMA_FILE = "schema.json"
+# Record of the digest of a CSV file, next to its caches
+_DIGEST_SUFFIX = ".digest.json"
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    Compute the SHA-256 digest of a file's content.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_digest(csv_path: Union[str, Path], cache_dir: Union[str, Path]) -> str:
+    """
+    Get the SHA-256 digest of a CSV file, hashing it only when it changed.
+
+    The digest is recorded in the cache directory with the path, size and
+    modification time of the file. While those match, the recorded digest
+    is returned without reading the file.
+
+    Args:
+        csv_path: Path to the CSV file
+        cache_dir: Directory holding the caches of the file
+
+    Returns:
+        Hex digest
+    """
+    csv_path = Path(csv_path)
+    stat = csv_path.stat()
+    key = {'path': str(csv_path.resolve()), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    record_path = Path(cache_dir) / f"{csv_path.stem}{_DIGEST_SUFFIX}"
+
+    try:
+        with open(record_path) as f:
+            record = json.load(f)
+        if all(record.get(name) == value for name, value in key.items()):
+            return record['digest']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    digest = file_digest(csv_path)
+    tmp = None
+    try:
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{record_path.name}-", dir=record_path.parent)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({**key, 'digest': digest}, f)
+        os.replace(tmp, record_path)
+    except OSError as e:
+        # Without a record the file is hashed again on the next load
+        logger.debug(f"Could not record digest in {record_path}: {e}")
+        if tmp is not None and os.path.exists(tmp):
+            os.unlink(tmp)
+    return digest
+
+
+def cache_path(
+    csv_path: Union[str, Path],
+    cache_dir: Optional[Union[str, Path]] = None,
+    suffix: str = ""
+) -> Path:
+    """
+    Get the cache of the current content of a CSV file.
+
+    The file is only hashed when its size or modification time changed,
+    see content_digest.
+
+    Args:
+        csv_path: Path to the CSV file
+        cache_dir: Directory holding the caches (default: .cache next to the CSV)
+        suffix: Extension of single-file caches (default: a cache directory)
+
+    Returns:
+        Path of the cache, which may not exist yet
+    """
+    csv_path = Path(csv_path)
+    root = Path(cache_dir) if cache_dir is not None else csv_path.parent / CACHE_DIR_NAME
+    return root / f"{csv_path.stem}-v{CACHE_VERSION}-{content_digest(csv_path, root)[:16]}{suffix}"
+
+
+def apply_schema(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the columns of a parsed values CSV to the typed schema.
+
+    Args:
+        data: DataFrame as parsed by pd.read_csv
+
+    Returns:
+        DataFrame with typed columns
+    """
+    typed = {}
+    for column in data.columns:
+        series = data[column]
+        if column in CATEGORICAL_COLUMNS:
+            series = series.astype('category')
+        elif column in INT8_COLUMNS and pd.api.types.is_integer_dtype(series):
+            if series.empty or (series.min() >= np.iinfo(np.int8).min and series.max() <= np.iinfo(np.int8).max):
+                series = series.astype(np.int8)
+        elif str(column).startswith(PERCENTAGE_PREFIX) and pd.api.types.is_numeric_dtype(series):
+            series = series.astype(np.float32)
+        typed[column] = series
+    return pd.DataFrame(typed, index=data.index)
+
+
+def as_float64(values) -> np.ndarray:
+    """
+    Widen percentages to float64 without float32 rounding noise.
+
+    Float32 values are converted through their shortest decimal form, so
+    0.233 stays 0.233 instead of becoming 0.2329999953508377.
+
+    Args:
+        values: Percentages, float32 from a typed load or already float64
+
+    Returns:
+        Float64 array
+    """
+    values = np.asarray(values)
+    if values.dtype == np.float32:
+        return values.astype(str).astype(np.float64)
+    return values.astype(np.float64, copy=False)
+
+
+def _decode_strings(codes: np.ndarray, categories: List[str]):
+    """Decode dictionary codes to the string array pd.read_csv would return."""
+    dtype = pd.Series(np.array(categories[:1], dtype=object)).dtype
+    if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+        import pyarrow as pa
+
+        # Gather into an Arrow string buffer, without a Python object per row
+        strings = pa.array(categories, pa.large_string()).take(pa.array(codes, mask=codes < 0))
+        return pd.array(strings, dtype=dtype)
+
+    # Missing values have code -1, which picks the trailing NaN
+    values = np.array(categories + [np.nan], dtype=object)
+    return values[codes]
+
+
+def write_cache(data: pd.DataFrame, path: Union[str, Path]) -> None:
+    """
+    Write a parsed DataFrame as a columnar cache directory.
+
+    The cache is written to a temporary directory and renamed into place, so
+    readers never see a partial cache.
+
+    Args:
+        data: DataFrame as parsed by pd.read_csv
+        path: Cache directory to create
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=f".{path.name}-", dir=path.parent))
+
+    try:
+        columns: List[Dict] = []
+        for i, column in enumerate(data.columns):
+            series = data[column]
+            entry = {'name': column, 'file': f"{i}.npy"}
+            if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+                entry['kind'] = 'numeric'
+                array = series.to_numpy()
+            else:
+                # Sorted values, so that the codes double as categorical codes
+                array, uniques = pd.factorize(series, sort=True)
+                entry['kind'] = 'string'
+                entry['categories'] = [str(value) for value in uniques]
+            np.save(tmp / entry['file'], array)
+            columns.append(entry)
+
+        with open(tmp / _SCHEMA_FILE, 'w') as f:
+            json.dump({'version': CACHE_VERSION, 'rows': len(data), 'columns': columns}, f)
+
+        os.replace(tmp, path)
+    except OSError:
+        # Another process may have written the same cache first
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not (path / _SCHEMA_FILE).exists():
+            raise
+
+
+def read_cache(path: Union[str, Path], typed: bool = True) -> pd.DataFrame:
+    """
+    Load a columnar cache directory, memory-mapping its columns.
+
+    Numeric columns and categorical codes stay memory-mapped (copy-on-write),
+    so the data is read from the page cache and shared between processes.
+    Columns narrowed by the typed schema are copies.
+
+    Args:
+        path: Cache directory written by write_cache
+        typed: Whether to apply the typed schema, see apply_schema
+
+    Returns:
+        DataFrame with typed columns, or with the dtypes of pd.read_csv
+
+    Raises:
+        ValueError: If the cache was written by another cache version
+    """
+    path = Path(path)
+    with open(path / _SCHEMA_FILE) as f:
+        schema = json.load(f)
+    if schema.get('version') != CACHE_VERSION:
+        raise ValueError(f"Unsupported cache version in {path}: {schema.get('version')}")
+
+    columns = {}
+    for entry in schema['columns']:
+        array = np.load(path / entry['file'], mmap_mode='c')
+        if entry['kind'] == 'string' and typed and entry['name'] in CATEGORICAL_COLUMNS:
+            columns[entry['name']] = pd.Categorical.from_codes(array, categories=entry['categories'])
+        elif entry['kind'] == 'string':
+            columns[entry['name']] = _decode_strings(array, entry['categories'])
+        else:
+            columns[entry['name']] = array
+
+    data = pd.DataFrame(columns, index=pd.RangeIndex(schema['rows']), copy=False)
+    return apply_schema(data) if typed else data
+
+
+def prune_caches(path: Union[str, Path]) -> None:
+    """
+    Remove the caches of older contents of the same CSV file.
+
+    Args:
+        path: Current cache, as returned by cache_path
+    """
+    path = Path(path)
+    stem = path.name.rsplit('-', 2)[0]
+    for other in path.parent.iterdir():
+        if other == path or other.suffix != path.suffix or other.name.rsplit('-', 2)[0] != stem:
+            continue
+        if other.is_dir():
+            shutil.rmtree(other, ignore_errors=True)
+        else:
+            other.unlink(missing_ok=True)
+
+
+def load_values_csv(
+    csv_path: Union[str, Path],
+    cache_dir: Optional[Union[str, Path]] = None,
+    use_cache: bool = True,
+    typed: bool = True
+) -> pd.DataFrame:
+    """
+    Load a values CSV file through the columnar cache.
+
+    The first load of a given CSV content parses it and writes the cache;
+    later loads memory-map the cache. If the cache cannot be written (for
+    example in a read-only directory), the parsed data is returned anyway.
+
+    Args:
+        csv_path: Path to the CSV file
+        cache_dir: Directory holding the caches (default: .cache next to the CSV)
+        use_cache: If False, parse the CSV without reading or writing the cache
+        typed: If True, apply the typed schema (see apply_schema); if False,
+            return the same dtypes and values as pd.read_csv
+
+    Returns:
+        DataFrame with the loaded data
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+    """
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"Data file not found: {csv_path}")
+
+    if not use_cache:
+        data = pd.read_csv(csv_path)
+        return apply_schema(data) if typed else data
+
+    path = cache_path(csv_path, cache_dir)
+    if (path / _SCHEMA_FILE).exists():
+        try:
+            return read_cache(path, typed)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cache {path}: {e}")
+            shutil.rmtree(path, ignore_errors=True)
+
+    data = pd.read_csv(csv_path)
+    try:
+        write_cache(data, path)
+        prune_caches(path)
+        logger.info(f"Cached {csv_path} in {path}")
+    except OSError as e:
+        logger.warning(f"Could not write cache {path}: {e}")
+        return apply_schema(data) if typed else data
+
+    return read_cache(path, typed)
@@ -0,0 +1,157 @@
+"""Streaming export of the Values-in-the-Wild dataset to NDJSON, CSV or Parquet."""
+import json
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+DEFAULT_BATCH_SIZE = 10_000
+
+# COLUMN OP VALUE, e.g. "level<=1" or "parent_cluster_id == ai_values:l2:3"
+_FILTER_PATTERN = re.compile(r"^\s*(\w+)\s*(==|!=|<=|>=|=|<|>)\s*(.*?)\s*$")
+
+_OPERATORS = {
+    "=": lambda field, value: field == value,
+    "==": lambda field, value: field == value,
+    "!=": lambda field, value: field != value,
+    "<": lambda field, value: field < value,
+    "<=": lambda field, value: field <= value,
+    ">": lambda field, value: field > value,
+    ">=": lambda field, value: field >= value,
+}
+
+
+def parse_filter(expression: str, schema: pa.Schema) -> pc.Expression:
+    """
+    Parse a row filter into an Arrow expression.
+
+    Args:
+        expression: Filter of the form COLUMN OP VALUE, with OP one of
+            =, ==, !=, <, <=, >, >=; the value is converted to the column type
+        schema: Schema of the data to filter
+
+    Returns:
+        Arrow expression, evaluated by the scanner while reading the data
+
+    Raises:
+        ValueError: If the filter is malformed or names an unknown column
+    """
+    match = _FILTER_PATTERN.match(expression)
+    if not match:
+        raise ValueError(f"Invalid filter '{expression}', expected COLUMN OP VALUE")
+
+    column, operator, value = match.groups()
+    if column not in schema.names:
+        raise ValueError(f"Unknown filter column '{column}', expected one of {schema.names}")
+
+    try:
+        scalar = pa.scalar(value).cast(schema.field(column).type)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        raise ValueError(f"Invalid value '{value}' for column '{column}': {e}") from e
+
+    return _OPERATORS[operator](ds.field(column), scalar)
+
+
+def iter_batches(
+    table: pa.Table,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+    """
+    Scan a table in record batches, with projection and filters pushed down.
+
+    Args:
+        table: Arrow table, typically memory-mapped
+        columns: Columns to keep (default: all)
+        filters: Row filters, see parse_filter; all must hold
+        batch_size: Maximum number of rows per batch
+
+    Returns:
+        Tuple of (schema of the batches, iterator of record batches)
+
+    Raises:
+        ValueError: If a column or filter is invalid
+    """
+    if columns:
+        unknown = [column for column in columns if column not in table.schema.names]
+        if unknown:
+            raise ValueError(f"Unknown columns {unknown}, expected some of {table.schema.names}")
+
+    expression = None
+    for text in filters or []:
+        condition = parse_filter(text, table.schema)
+        expression = condition if expression is None else expression & condition
+
+    scanner = ds.Scanner.from_dataset(
+        ds.dataset(table), columns=columns or None, filter=expression, batch_size=batch_size
+    )
+    return scanner.projected_schema, scanner.to_batches()
+
+
+def export_dataset(
+    dataset,
+    output_path: Union[str, Path],
+    output_format: str = "ndjson",
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    Stream a dataset to a file, one record batch at a time.
+
+    Only one batch is held in memory at a time, so memory use does not grow
+    with the size of the dataset.
+
+    Args:
+        dataset: Loaded dataset or Arrow table
+        output_path: File to write
+        output_format: One of "ndjson", "csv" or "parquet"
+        columns: Columns to export (default: all)
+        filters: Row filters, see parse_filter; all must hold
+        batch_size: Maximum number of rows per batch
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If the format, a column or a filter is invalid
+    """
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown format '{output_format}', expected one of {EXPORT_FORMATS}")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    # Formatting as Arrow applies any indices mapping, without copying otherwise
+    table = dataset if isinstance(dataset, pa.Table) else dataset.with_format("arrow")[:]
+    schema, batches = iter_batches(table, columns, filters, batch_size)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    rows = 0
+    if output_format == "ndjson":
+        with open(output_path, "w") as f:
+            for batch in batches:
+                for record in batch.to_pylist():
+                    f.write(json.dumps(record) + "\n")
+                rows += batch.num_rows
+    elif output_format == "csv":
+        with pa_csv.CSVWriter(str(output_path), schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    else:
+        import pyarrow.parquet as pq
+
+        with pq.ParquetWriter(str(output_path), schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+
+    return rows
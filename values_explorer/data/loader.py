@@ -1,51 +1,292 @@
 """Data loading utilities for the Values-in-the-Wild dataset."""
-from typing import Dict, Optional
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
-from datasets import load_dataset
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from datasets import Dataset, load_dataset
 
+from values_explorer.data.cache import cache_path, prune_caches
 
-def load_values_dataset(config: str = "values_tree", split: str = "train") -> Dict:
+logger = logging.getLogger(__name__)
+
+DATASET_NAME = "Anthropic/values-in-the-wild"
+CONFIGS = ("values_tree", "values_frequencies")
+
+# Directory holding <config>.csv files, such as data/ filled by Makefile.data
+# or a snapshot of the dataset repository
+DATA_DIR_ENV = "VALUES_EXPLORER_DATA_DIR"
+# data/ of the repository, whatever the working directory
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+
+# Columns identifying a value and its category in the values_tree configuration
+ID_COLUMN = "cluster_id"
+CATEGORY_COLUMN = "parent_cluster_id"
+
+
+def load_values_dataset(
+    config: str = "values_tree",
+    split: str = "train",
+    data_dir: Optional[Union[str, Path]] = None
+) -> Dict:
     """
     Load the Values-in-the-Wild dataset.
     
+    If the data directory holds a <config>.csv file, the dataset is loaded
+    from it without contacting the Hugging Face Hub: the CSV is converted
+    once to an Arrow file cached next to it (keyed by the CSV content), which
+    is memory-mapped. Otherwise the dataset is downloaded from the Hub,
+    unless HF_DATASETS_OFFLINE is set.
+    
     Args:
         config: Dataset configuration - either "values_frequencies" or "values_tree"
         split: Dataset split to load (default: "train")
+        data_dir: Directory with the CSV files (default: $VALUES_EXPLORER_DATA_DIR,
+            or the data/ directory of the repository)
         
     Returns:
         Dataset object
+        
+    Raises:
+        ValueError: If the configuration is unknown, or a local split other than train is requested
+        FileNotFoundError: If data_dir is given, or the Hub is disabled, and the CSV file doesn't exist
+    """
+    if config not in CONFIGS:
+        raise ValueError(f"Unknown configuration '{config}', expected one of {CONFIGS}")
+
+    explicit = data_dir is not None
+    if explicit:
+        source = "data_dir argument"
+    elif os.environ.get(DATA_DIR_ENV):
+        data_dir, source = os.environ[DATA_DIR_ENV], f"${DATA_DIR_ENV}"
+    else:
+        data_dir, source = DEFAULT_DATA_DIR, "default data directory"
+    csv_path = Path(data_dir) / f"{config}.csv"
+
+    if csv_path.exists():
+        # The CSV files only hold the train split
+        if split != "train":
+            raise ValueError(f"Local data only has a train split, got '{split}'")
+        logger.info(f"Loading {config} from {csv_path} ({source})")
+        return Dataset.from_file(str(arrow_cache(csv_path)))
+
+    if explicit or os.environ.get("HF_DATASETS_OFFLINE", "0").upper() in ("1", "ON", "YES", "TRUE"):
+        raise FileNotFoundError(f"Data file not found: {csv_path} ({source})")
+
+    logger.info(f"Loading {config} from the Hugging Face Hub, no {csv_path} ({source})")
+    return load_dataset(DATASET_NAME, config, split=split)
+
+
+def arrow_cache(csv_path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Convert a CSV file to an Arrow file that datasets can memory-map.
+    
+    The Arrow file is only written once per CSV content, see
+    values_explorer.data.cache.cache_path.
+    
+    Args:
+        csv_path: Path to the CSV file
+        cache_dir: Directory holding the caches (default: .cache next to the CSV)
+        
+    Returns:
+        Path of the Arrow file
+    """
+    path = cache_path(csv_path, cache_dir, suffix=".arrow")
+    if path.exists():
+        return path
+
+    # Empty fields are missing values, as when datasets parses the CSV
+    table = pa_csv.read_csv(csv_path, convert_options=pa_csv.ConvertOptions(strings_can_be_null=True))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    try:
+        # datasets memory-maps Arrow files in the IPC streaming format
+        with os.fdopen(fd, "wb") as f, pa.ipc.new_stream(f, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    prune_caches(path)
+    logger.info(f"Cached {csv_path} in {path}")
+    return path
+
+
+class IndexedValuesDataset:
+    """
+    Indexed access to a loaded dataset through its Arrow columns.
+    
+    The id and category indexes are built once, from the Arrow columns,
+    so lookups do not iterate over the dataset:
+    
+    - id lookups are a dictionary access
+    - the rows of a category are a zero-copy slice of a copy of the table
+      sorted by category
     """
-    return load_dataset("Anthropic/values-in-the-wild", config, split=split)
 
+    def __init__(
+        self,
+        dataset: Union[Dataset, pa.Table],
+        id_column: str = ID_COLUMN,
+        category_column: Optional[str] = CATEGORY_COLUMN
+    ):
+        """
+        Build the indexes.
+        
+        Args:
+            dataset: Loaded dataset or Arrow table
+            id_column: Column holding the value ids
+            category_column: Column to group values by (None for no category index)
+            
+        Raises:
+            ValueError: If a column is not in the dataset
+        """
+        # Formatting as Arrow applies any indices mapping, without copying otherwise
+        self.table = dataset if isinstance(dataset, pa.Table) else dataset.with_format("arrow")[:]
+        for column in (id_column, category_column):
+            if column is not None and column not in self.table.column_names:
+                raise ValueError(f"Column '{column}' not in dataset: {self.table.column_names}")
+
+        self.id_column = id_column
+        self.category_column = category_column
+
+        # id -> row; building from the reversed column keeps the first row of duplicate ids
+        ids = self.table.column(id_column).to_pylist()
+        self._rows: Dict[str, int] = dict(zip(reversed(ids), range(len(ids) - 1, -1, -1)))
+
+        self._sorted = None
+        self._ranges: Dict[Optional[str], Tuple[int, int]] = {}
+        if category_column is not None:
+            self._build_category_ranges()
+
+    def _build_category_ranges(self) -> None:
+        """Sort the table by category and record the row range of each category."""
+        order = pc.sort_indices(self.table, sort_keys=[(self.category_column, "ascending")])
+        self._sorted = self.table.take(order)
+
+        # Nulls sort last, in a range of their own
+        column = self._sorted.column(self.category_column)
+        n_valid = len(column) - column.null_count
+        encoded = column.slice(0, n_valid).combine_chunks().dictionary_encode()
+        codes = encoded.indices.to_numpy()
+
+        # Codes are non-decreasing in sorted order, so each category is one run
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if n_valid else np.empty(0, dtype=np.int64)
+        stops = np.r_[starts[1:], n_valid]
+        categories = encoded.dictionary.take(pa.array(codes[starts])).to_pylist()
+        self._ranges = {
+            category: (int(start), int(stop))
+            for category, start, stop in zip(categories, starts.tolist(), stops.tolist())
+        }
+        if n_valid < len(column):
+            self._ranges[None] = (n_valid, len(column))
 
-def get_value_by_id(dataset, value_id: str) -> Optional[Dict]:
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    @property
+    def categories(self) -> List[str]:
+        """Distinct non-null categories, in sorted order."""
+        return [category for category in self._ranges if category is not None]
+
+    def row_of(self, value_id: str) -> Optional[int]:
+        """
+        Get the row position of a value.
+        
+        Args:
+            value_id: ID of the value
+            
+        Returns:
+            Row position, or None if not found
+        """
+        return self._rows.get(value_id)
+
+    def get(self, value_id: str) -> Optional[Dict]:
+        """
+        Retrieve a specific value by its ID.
+        
+        Args:
+            value_id: ID of the value to retrieve
+            
+        Returns:
+            Dictionary containing the value data or None if not found
+        """
+        row = self._rows.get(value_id)
+        if row is None:
+            return None
+        return self.table.slice(row, 1).to_pylist()[0]
+
+    def by_category(self, category: Optional[str]) -> pa.Table:
+        """
+        Get the values of a category.
+        
+        Args:
+            category: Category to filter by (None for the rows without one)
+            
+        Returns:
+            Arrow table sharing the memory of the index, in the original row
+            order within the category (empty if the category is unknown)
+            
+        Raises:
+            ValueError: If the index was built without a category column
+        """
+        if self._sorted is None:
+            raise ValueError("Dataset was indexed without a category column")
+
+        start, stop = self._ranges.get(category, (0, 0))
+        return self._sorted.slice(start, stop - start)
+
+
+def get_value_by_id(dataset, value_id: str, id_column: str = "id") -> Optional[Dict]:
     """
     Retrieve a specific value by its ID.
     
     Args:
-        dataset: The loaded dataset
+        dataset: The loaded dataset, or an IndexedValuesDataset for an O(1)
+            lookup when it is indexed on id_column
         value_id: ID of the value to retrieve
+        id_column: Column holding the value ids (ID_COLUMN in the
+            values_tree configuration)
         
     Returns:
-        Dictionary containing the value data or None if not found
+        Dictionary containing the value data or None if not found (the
+        first row if the id is repeated)
     """
-    # This implementation will need to be adjusted based on actual dataset structure
+    if isinstance(dataset, IndexedValuesDataset):
+        if dataset.id_column == id_column:
+            return dataset.get(value_id)
+        dataset = dataset.table.to_pylist()
+
     for item in dataset:
-        if item.get('id') == value_id:
+        if item.get(id_column) == value_id:
             return item
     return None
 
 
-def get_values_by_category(dataset, category: str) -> list:
+def get_values_by_category(dataset, category: Optional[str], category_column: str = "category") -> list:
     """
     Get all values belonging to a specific category.
     
     Args:
-        dataset: The loaded dataset
-        category: Category name to filter by
+        dataset: The loaded dataset, or an IndexedValuesDataset to read only
+            the rows of the category when it is indexed on category_column
+        category: Category to filter by (None for the rows without one)
+        category_column: Column to group values by (CATEGORY_COLUMN in the
+            values_tree configuration)
         
     Returns:
-        List of values in the specified category
+        List of values in the specified category, in row order
     """
-    # This implementation will need to be adjusted based on actual dataset structure
-    return [item for item in dataset if item.get('category') == category]
+    if isinstance(dataset, IndexedValuesDataset):
+        if dataset.category_column == category_column:
+            return dataset.by_category(category).to_pylist()
+        dataset = dataset.table.to_pylist()
+
+    return [item for item in dataset if item.get(category_column) == category]
@@ -2,10 +2,27 @@
 import argparse
 import os
 
+from values_explorer.data.export import DEFAULT_BATCH_SIZE, EXPORT_FORMATS, export_dataset
 from values_explorer.data.loader import load_values_dataset
 from values_explorer.utils.helpers import save_json
 
 
+def export(args, parser):
+    """Stream the selected configuration to a file."""
+    columns = args.columns.split(',') if args.columns else None
+
+    print(f"Loading {args.config} dataset...")
+    dataset = load_values_dataset(args.config, data_dir=args.data_dir)
+
+    print(f"Exporting to {args.destination} as {args.format}...")
+    try:
+        rows = export_dataset(dataset, args.destination, args.format, columns, args.filter, args.batch_size)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"Exported {rows} rows")
+
+
 def main():
     """Run the main program."""
     parser = argparse.ArgumentParser(description='Values Compass - Explore the Values-in-the-Wild dataset')
@@ -14,8 +31,33 @@ def main():
                         help='Dataset configuration to load')
     parser.add_argument('--output', type=str, default='output',
                         help='Directory to save output files')
+
+    subparsers = parser.add_subparsers(dest='command')
+    export_parser = subparsers.add_parser(
+        'export', help='Stream a dataset configuration to NDJSON, CSV or Parquet in record batches'
+    )
+    export_parser.add_argument('destination', type=str,
+                               help='File to write')
+    # Without a default, --config given before the subcommand still applies
+    export_parser.add_argument('--config', type=str, default=argparse.SUPPRESS,
+                               choices=['values_tree', 'values_frequencies'],
+                               help='Dataset configuration to export (default: values_tree)')
+    export_parser.add_argument('--format', type=str, default='ndjson', choices=EXPORT_FORMATS,
+                               help='Output format (default: ndjson)')
+    export_parser.add_argument('--columns', type=str,
+                               help='Comma-separated columns to export (default: all)')
+    export_parser.add_argument('--filter', type=str, action='append', default=[],
+                               help='Row filter COLUMN OP VALUE, e.g. "level<=1" (repeatable, all must hold)')
+    export_parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                               help=f'Rows per record batch (default: {DEFAULT_BATCH_SIZE})')
+    export_parser.add_argument('--data-dir', type=str,
+                               help='Directory with local <config>.csv files (default: the repository data/ when present)')
     args = parser.parse_args()
 
+    if args.command == 'export':
+        export(args, parser)
+        return
+
     # Create output directory
     os.makedirs(args.output, exist_ok=True)
 
@@ -0,0 +1,291 @@
+"""
+Hierarchy Index Module for Values Explorer.
+
+This module indexes the rows of a values tree DataFrame so that hierarchy
+queries do not have to filter the whole DataFrame. Rows are referred to by
+their position in the DataFrame, and the tree is stored as arrays:
+
+- a cluster_id to row position lookup
+- a parent pointer per row
+- children lists in compressed sparse row (CSR) form, grouped by parent id
+- a lower-cased exact name lookup
+- nested-set intervals: rows in pre-order, where the subtree of a row is the
+  contiguous slice order[enter[row]:exit[row]], with the depth of every row
+  and a prefix sum of pct_total_occurrences over that order
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from values_explorer.data.cache import as_float64
+
+# Parent pointer of a row whose parent_cluster_id is empty
+NO_PARENT = -1
+# Parent pointer of a row whose parent_cluster_id is not a cluster_id of the data
+MISSING_PARENT = -2
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+class HierarchyIndex:
+    """
+    Array indexes over the rows of a values tree DataFrame.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Build the indexes.
+
+        Args:
+            data: Values tree with cluster_id, parent_cluster_id and name columns
+        """
+        self.size = len(data)
+
+        # cluster_id -> row position (cluster ids are unique; the first row wins)
+        self.position: Dict[str, int] = {}
+        for i, cluster_id in enumerate(data['cluster_id'].tolist()):
+            self.position.setdefault(cluster_id, i)
+
+        # Children grouped by parent id, in row order within each group
+        parent_codes, parent_ids = pd.factorize(data['parent_cluster_id'])
+        self._child_group: Dict[str, int] = {parent_id: k for k, parent_id in enumerate(parent_ids)}
+        # Per row: its cluster id code, the group of its siblings and the group of its children
+        self.cluster_codes = pd.factorize(data['cluster_id'])[0].astype(np.int64)
+        self.sibling_group = parent_codes.astype(np.int64)
+        self.child_group = np.array(
+            [self._child_group.get(cluster_id, -1) for cluster_id in data['cluster_id'].tolist()],
+            dtype=np.int64
+        )
+        order = np.argsort(parent_codes, kind='stable')
+        self.children = order[np.count_nonzero(parent_codes < 0):].astype(np.int64)
+        counts = np.bincount(parent_codes[parent_codes >= 0], minlength=len(parent_ids))
+        self.child_offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+        # Parent pointer of every row
+        group_parent = np.array(
+            [self.position.get(parent_id, MISSING_PARENT) for parent_id in parent_ids],
+            dtype=np.int64
+        )
+        self.parent = np.full(self.size, NO_PARENT, dtype=np.int64)
+        has_parent = parent_codes >= 0
+        self.parent[has_parent] = group_parent[parent_codes[has_parent]]
+
+        self.roots = np.flatnonzero(~has_parent)
+
+        # Lower-cased name -> row positions, in row order
+        names: Dict[str, List[int]] = {}
+        for i, name in enumerate(data['name'].tolist()):
+            if isinstance(name, str):
+                names.setdefault(name.lower(), []).append(i)
+        self._names = {name: np.array(rows, dtype=np.int64) for name, rows in names.items()}
+
+        self._build_intervals(data['cluster_id'].tolist())
+
+        # Subtree sums are differences of the prefix sum over the pre-order
+        if 'pct_total_occurrences' in data:
+            pct = np.nan_to_num(as_float64(data['pct_total_occurrences'].to_numpy()))
+            self.pct_prefix = np.concatenate([[0.0], np.cumsum(pct[self.order])])
+        else:
+            self.pct_prefix = None
+
+    def _build_intervals(self, cluster_ids: List[str]) -> None:
+        """
+        Number the rows in pre-order with an iterative depth-first walk.
+
+        Roots, and rows whose parent is missing from the data, start a tree
+        of their own. Rows on a parent cycle are not reachable and get an
+        empty interval.
+        """
+        self.enter = np.full(self.size, -1, dtype=np.int64)
+        self.exit = np.full(self.size, -1, dtype=np.int64)
+        self.depth = np.full(self.size, -1, dtype=np.int64)
+        order = []
+
+        tops = np.flatnonzero(self.parent < 0)
+        for top in tops.tolist():
+            # Stack of (row, depth, exiting)
+            stack = [(top, 0, False)]
+            while stack:
+                row, depth, exiting = stack.pop()
+                if exiting:
+                    self.exit[row] = len(order)
+                    continue
+                if self.enter[row] >= 0:
+                    continue
+                self.enter[row] = len(order)
+                self.depth[row] = depth
+                order.append(row)
+                stack.append((row, depth, True))
+                if self.position.get(cluster_ids[row]) == row:
+                    children = self.children_of(cluster_ids[row]).tolist()
+                    stack.extend((child, depth + 1, False) for child in reversed(children))
+
+        self.order = np.array(order, dtype=np.int64)
+        unreachable = self.enter < 0
+        self.enter[unreachable] = len(order)
+        self.exit[unreachable] = len(order)
+
+    def children_of(self, cluster_id: str) -> np.ndarray:
+        """
+        Get the rows whose parent_cluster_id is the given id.
+
+        Args:
+            cluster_id: Parent cluster id
+
+        Returns:
+            Row positions of the children, in row order
+        """
+        k = self._child_group.get(cluster_id)
+        if k is None:
+            return _EMPTY
+        return self.children[self.child_offsets[k]:self.child_offsets[k + 1]]
+
+    def _groups(self, items: np.ndarray, groups: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Concatenate the children of several groups, labelled with their item."""
+        valid = groups >= 0
+        items, groups = items[valid], groups[valid]
+        starts = self.child_offsets[groups]
+        lengths = self.child_offsets[groups + 1] - starts
+        # Position of every output entry inside its group
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return np.repeat(items, lengths), self.children[np.repeat(starts, lengths) + offsets]
+
+    def related(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the siblings and children of several rows, all at once.
+
+        Siblings are the rows with the same parent_cluster_id, other than
+        the rows with the same cluster_id as the row itself.
+
+        Args:
+            rows: Row positions
+
+        Returns:
+            Tuple of (indexes into rows, row positions of the related rows),
+            ordered by index, then siblings before children, in row order
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        items = np.arange(len(rows))
+        sibling_items, siblings = self._groups(items, self.sibling_group[rows])
+        keep = self.cluster_codes[siblings] != self.cluster_codes[rows[sibling_items]]
+        sibling_items, siblings = sibling_items[keep], siblings[keep]
+        child_items, children = self._groups(items, self.child_group[rows])
+
+        related_items = np.concatenate([sibling_items, child_items])
+        related_rows = np.concatenate([siblings, children])
+        order = np.argsort(related_items, kind='stable')
+        return related_items[order], related_rows[order]
+
+    def subtree(self, row: int) -> np.ndarray:
+        """
+        Get a row and all its descendants.
+
+        Args:
+            row: Row position
+
+        Returns:
+            Row positions of the subtree, in pre-order
+        """
+        return self.order[self.enter[row]:self.exit[row]]
+
+    def subtree_sum(self, row: int) -> float:
+        """
+        Sum pct_total_occurrences over a row and all its descendants.
+
+        Args:
+            row: Row position
+
+        Returns:
+            Subtree total, with missing percentages counted as zero
+        """
+        return float(self.pct_prefix[self.exit[row]] - self.pct_prefix[self.enter[row]])
+
+    def subtree_sums(self) -> np.ndarray:
+        """
+        Sum pct_total_occurrences over the subtree of every row.
+
+        Returns:
+            Array of subtree totals, one per row
+        """
+        return self.pct_prefix[self.exit] - self.pct_prefix[self.enter]
+
+    def is_descendant(self, row: int, ancestor: int) -> bool:
+        """
+        Check whether a row is in the subtree of another row.
+
+        Args:
+            row: Row position
+            ancestor: Row position of the possible ancestor
+
+        Returns:
+            True if row is ancestor or one of its descendants
+        """
+        return bool(self.enter[ancestor] <= self.enter[row] < self.exit[ancestor])
+
+    def descendants(self, rows: np.ndarray, max_depth: Optional[int] = None, base_depth: int = 0) -> np.ndarray:
+        """
+        Get the subtrees of some rows, level by level.
+
+        Args:
+            rows: Row positions of the subtree roots, at the same depth
+            max_depth: Maximum depth below the roots to include
+            base_depth: Depth reported for the roots
+
+        Returns:
+            Row positions ordered by depth below the roots, then by position
+        """
+        if not len(rows):
+            return _EMPTY
+        subtrees = np.concatenate([self.subtree(row) for row in rows.tolist()])
+        relative = self.depth[subtrees] - self.depth[rows[0]] + base_depth
+        if max_depth is not None:
+            keep = relative <= max_depth
+            subtrees, relative = subtrees[keep], relative[keep]
+        return subtrees[np.lexsort((subtrees, relative))]
+
+    def ancestors(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the paths from the top of the tree to some rows, all at once.
+
+        The parent pointers are followed one level at a time for all rows
+        together. A path starts at a root, or at the highest ancestor whose
+        parent is missing from the data. Rows on a parent cycle have no path.
+
+        Args:
+            rows: Row positions
+
+        Returns:
+            Tuple of (indexes into rows, row positions of the path nodes),
+            ordered by index, then from the top of the path down to the row
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        items = np.flatnonzero(self.depth[rows] >= 0)
+        current = rows[items]
+        path_items, path_rows = [], []
+        while len(current):
+            path_items.append(items)
+            path_rows.append(current)
+            current = self.parent[current]
+            keep = current >= 0
+            items, current = items[keep], current[keep]
+
+        if not path_items:
+            return _EMPTY, _EMPTY
+        path_items = np.concatenate(path_items)
+        path_rows = np.concatenate(path_rows)
+        order = np.lexsort((self.depth[path_rows], path_items))
+        return path_items[order], path_rows[order]
+
+    def find_name(self, name: str) -> np.ndarray:
+        """
+        Get the rows whose name matches case-insensitively.
+
+        Args:
+            name: Value name
+
+        Returns:
+            Row positions of the matches, in row order
+        """
+        return self._names.get(name.lower(), _EMPTY)
@@ -0,0 +1,181 @@
+"""
+Search Index Module for Values Explorer.
+
+This module implements an inverted trigram index over a column of strings,
+such as the value names or descriptions. Every string is lower-cased and
+padded ("  text "), and each of its three-character substrings (trigrams)
+points to the strings that contain it. The index supports:
+
+- substring search: candidates share all trigrams of the query and are
+  checked with a literal (non-regex) substring test
+- prefix search: a binary search over the sorted strings
+- fuzzy search: strings ranked by trigram similarity to the query
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def trigrams(text: str, padded: bool = True) -> List[str]:
+    """
+    Get the distinct trigrams of a lower-cased string.
+
+    Args:
+        text: Lower-cased string
+        padded: Whether to pad the string so that its start and end form
+            trigrams of their own
+
+    Returns:
+        Distinct trigrams, in order of first occurrence
+    """
+    if padded:
+        text = f"  {text} "
+    return list(dict.fromkeys(text[i:i + 3] for i in range(len(text) - 2)))
+
+
+class TrigramIndex:
+    """
+    Inverted trigram index for substring, prefix and fuzzy search.
+    """
+
+    def __init__(self, texts: Iterable[Optional[str]]):
+        """
+        Build the index.
+
+        Args:
+            texts: Strings to index; missing values (None, NaN) never match
+        """
+        self.texts: List[Optional[str]] = [
+            text.lower() if isinstance(text, str) else None for text in texts
+        ]
+
+        # Postings in CSR form: trigram id -> sorted string positions
+        postings: Dict[str, List[int]] = {}
+        self.trigram_counts = np.zeros(len(self.texts), dtype=np.int64)
+        for i, text in enumerate(self.texts):
+            if text is None:
+                continue
+            grams = trigrams(text)
+            self.trigram_counts[i] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+
+        self._trigram_ids = {gram: k for k, gram in enumerate(postings)}
+        lengths = np.array([len(rows) for rows in postings.values()], dtype=np.int64)
+        self._offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        self._postings = (
+            np.fromiter((i for rows in postings.values() for i in rows), dtype=np.int64, count=int(lengths.sum()))
+        )
+
+        # Strings in sorted order, for prefix search
+        present = [i for i, text in enumerate(self.texts) if text is not None]
+        self._sorted_positions = np.array(
+            sorted(present, key=lambda i: self.texts[i]), dtype=np.int64
+        )
+        self._sorted_texts = [self.texts[i] for i in self._sorted_positions.tolist()]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _posting(self, gram: str) -> np.ndarray:
+        """Return the positions of the strings containing a trigram."""
+        k = self._trigram_ids.get(gram)
+        if k is None:
+            return _EMPTY
+        return self._postings[self._offsets[k]:self._offsets[k + 1]]
+
+    def substring(self, query: str) -> np.ndarray:
+        """
+        Find the strings containing a query, case-insensitively.
+
+        The query is matched literally, not as a regular expression.
+
+        Args:
+            query: Substring to search for
+
+        Returns:
+            Sorted positions of the matching strings
+        """
+        query = query.lower()
+        grams = trigrams(query, padded=False)
+        if not grams:
+            # Queries shorter than a trigram are checked against every string
+            return np.array(
+                [i for i, text in enumerate(self.texts) if text is not None and query in text],
+                dtype=np.int64
+            )
+
+        # Intersect the postings, shortest first
+        lists = sorted((self._posting(gram) for gram in grams), key=len)
+        candidates = lists[0]
+        for posting in lists[1:]:
+            if not len(candidates):
+                break
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+
+        texts = self.texts
+        return np.array([i for i in candidates.tolist() if query in texts[i]], dtype=np.int64)
+
+    def prefix(self, query: str, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Find the strings starting with a query, case-insensitively.
+
+        Args:
+            query: Prefix to search for
+            limit: Maximum number of results
+
+        Returns:
+            Positions of the matching strings, in alphabetical order
+        """
+        query = query.lower()
+        start = bisect_left(self._sorted_texts, query)
+        # Every string with the prefix sorts before the prefix followed by the largest character
+        stop = bisect_left(self._sorted_texts, query + "\U0010ffff", lo=start)
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return self._sorted_positions[start:stop]
+
+    def similar(self, query: str, top_k: int = 10, min_similarity: float = 0.3) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank strings by trigram similarity to a query.
+
+        The similarity of two strings is the number of trigrams they share
+        divided by the number of distinct trigrams of both, so misspelled
+        or partial queries still find close matches.
+
+        Args:
+            query: Text to match
+            top_k: Maximum number of results
+            min_similarity: Minimum similarity, between 0 and 1
+
+        Returns:
+            Tuple of (positions, similarities), best matches first; ties are
+            ordered by position
+        """
+        grams = trigrams(query.lower())
+        if not grams or top_k <= 0:
+            return _EMPTY, np.empty(0, dtype=np.float64)
+
+        shared = np.bincount(
+            np.concatenate([self._posting(gram) for gram in grams]), minlength=len(self.texts)
+        )
+        candidates = np.flatnonzero(shared)
+        shared = shared[candidates]
+        similarity = shared / (len(grams) + self.trigram_counts[candidates] - shared)
+
+        keep = similarity >= min_similarity
+        candidates, similarity = candidates[keep], similarity[keep]
+        if len(candidates) > top_k:
+            # Keep everything above the k-th best similarity, and the first of the ties
+            kth = np.partition(similarity, len(similarity) - top_k)[len(similarity) - top_k]
+            best = similarity > kth
+            ties = np.flatnonzero(similarity == kth)
+            best[ties[:top_k - np.count_nonzero(best)]] = True
+            candidates, similarity = candidates[best], similarity[best]
+
+        ranked = np.lexsort((candidates, -similarity))
+        return candidates[ranked], similarity[ranked]
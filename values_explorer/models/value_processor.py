@@ -10,8 +10,13 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from values_explorer.data.cache import as_float64, load_values_csv
+from values_explorer.models.hierarchy_index import MISSING_PARENT, NO_PARENT, HierarchyIndex
+from values_explorer.models.search_index import TrigramIndex
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -21,7 +26,8 @@ class ValueProcessor:
     Process and analyze values from the Values-in-the-Wild dataset.
     
     This class provides methods for loading, filtering, and analyzing value
-    hierarchies from the dataset.
+    hierarchies from the dataset. Queries go through a HierarchyIndex built
+    when the data is loaded, instead of filtering the whole DataFrame.
     """
 
     def __init__(self, data_path: Optional[str] = None):
@@ -34,13 +40,22 @@ class ValueProcessor:
         self.data_path = data_path
         self.data = None
         self.top_level_categories = None
+        self._index = None
+        self._indexed_data = None
+        self._search_indexes: Dict[str, TrigramIndex] = {}
 
-    def load_data(self, data_path: Optional[str] = None) -> pd.DataFrame:
+    def load_data(self, data_path: Optional[str] = None, use_cache: bool = True) -> pd.DataFrame:
         """
         Load the values tree data.
         
+        The CSV file is parsed once into a columnar cache next to it, which
+        later loads memory-map (see values_explorer.data.cache). The data
+        has the typed schema: categorical cluster ids, int8 level and float32
+        percentages.
+        
         Args:
             data_path: Path to the CSV file (overrides instance path)
+            use_cache: If False, parse the CSV without the columnar cache
             
         Returns:
             DataFrame with the loaded data
@@ -59,25 +74,66 @@ class ValueProcessor:
         if not path.exists():
             raise FileNotFoundError(f"Data file not found: {path}")
 
-        self.data = pd.read_csv(path)
+        self.data = load_values_csv(path, use_cache=use_cache)
         logger.info(f"Loaded {len(self.data)} value entries from {path}")
 
-        # Cache top-level categories
+        # Index the hierarchy and names, and cache top-level categories
         self._cache_top_categories()
+        self.search_index('name')
 
         return self.data
 
+    @property
+    def index(self) -> HierarchyIndex:
+        """
+        Hierarchy index of the loaded data, rebuilt if the data was replaced.
+
+        Raises:
+            ValueError: If data not loaded
+        """
+        if self.data is None:
+            raise ValueError("Data not loaded, call load_data() first")
+
+        if self._index is None or self._indexed_data is not self.data:
+            self._index = HierarchyIndex(self.data)
+            self._indexed_data = self.data
+            self._search_indexes = {}
+        return self._index
+
+    def search_index(self, column: str = 'name') -> TrigramIndex:
+        """
+        Get the trigram search index of a text column, building it on first use.
+        
+        Args:
+            column: Column to search, 'name' or 'description'
+            
+        Returns:
+            TrigramIndex over the column, by row position
+            
+        Raises:
+            ValueError: If data not loaded
+        """
+        # Accessing the hierarchy index drops search indexes of replaced data
+        self.index
+        if column not in self._search_indexes:
+            self._search_indexes[column] = TrigramIndex(self.data[column].tolist())
+        return self._search_indexes[column]
+
+    def _search_columns(self, include_descriptions: bool) -> List[str]:
+        """Return the columns searched by the text search methods."""
+        return ['name', 'description'] if include_descriptions else ['name']
+
     def _cache_top_categories(self) -> None:
         """Cache top-level value categories for faster access."""
         if self.data is None:
             return
 
         # Get root nodes - these are usually the top-level value domains
-        roots = self.data[self.data['parent_cluster_id'].isna()]
-        self.top_level_categories = {
-            row['cluster_id']: row['name']
-            for _, row in roots.iterrows()
-        }
+        roots = self.index.roots
+        self.top_level_categories = dict(zip(
+            self.data['cluster_id'].to_numpy()[roots].tolist(),
+            self.data['name'].to_numpy()[roots].tolist()
+        ))
 
     def get_top_categories(self) -> Dict[str, str]:
         """
@@ -118,29 +174,23 @@ class ValueProcessor:
         if self.data is None:
             raise ValueError("Data not loaded, call load_data() first")
 
+        index = self.index
         if root_id is None:
             # Get all root nodes
-            roots = self.data[self.data['parent_cluster_id'].isna()]
             if max_depth is not None:
                 return self.data[self.data['level'] <= max_depth]
-            return roots
+            return self.data.iloc[index.roots]
 
-        # Starting with the root, recursively get all descendants
-        result = [self.data[self.data['cluster_id'] == root_id]]
-        current_parents = [root_id]
-        current_depth = 1
-
-        while current_parents and (max_depth is None or current_depth <= max_depth):
-            # Get children of current parents
-            children = self.data[self.data['parent_cluster_id'].isin(current_parents)]
-            if children.empty:
-                break
-
-            result.append(children)
-            current_parents = children['cluster_id'].tolist()
-            current_depth += 1
+        # The subtree of the root is a contiguous slice of the pre-order,
+        # returned level by level
+        root = index.position.get(root_id)
+        if root is not None:
+            rows = index.descendants(np.array([root]), max_depth)
+        else:
+            # Without a row of its own, the root id only has children
+            rows = index.descendants(index.children_of(root_id), max_depth, base_depth=1)
 
-        return pd.concat(result)
+        return self.data.iloc[rows]
 
     def get_top_values(self, n: int = 10) -> pd.DataFrame:
         """
@@ -163,17 +213,23 @@ class ValueProcessor:
     def find_value_by_name(
         self,
         value_name: str,
-        exact_match: bool = False
+        exact_match: bool = False,
+        include_descriptions: bool = False
     ) -> pd.DataFrame:
         """
         Find a value by name.
         
+        Substring matches are looked up in the trigram search index and the
+        name is matched literally, not as a regular expression.
+        
         Args:
             value_name: Name of the value to find
             exact_match: If True, only return exact matches
+            include_descriptions: If True, also return substring matches in
+                the descriptions (ignored for exact matches)
             
         Returns:
-            DataFrame with matching values
+            DataFrame with matching values, in data order
             
         Raises:
             ValueError: If data not loaded
@@ -182,9 +238,69 @@ class ValueProcessor:
             raise ValueError("Data not loaded, call load_data() first")
 
         if exact_match:
-            return self.data[self.data['name'].str.lower() == value_name.lower()]
-        else:
-            return self.data[self.data['name'].str.lower().str.contains(value_name.lower())]
+            return self.data.iloc[self.index.find_name(value_name)]
+
+        matches = [
+            self.search_index(column).substring(value_name)
+            for column in self._search_columns(include_descriptions)
+        ]
+        return self.data.iloc[np.unique(np.concatenate(matches))]
+
+    def find_values_by_prefix(self, prefix: str, max_results: Optional[int] = None) -> pd.DataFrame:
+        """
+        Find values whose name starts with a prefix, for autocompletion.
+        
+        Args:
+            prefix: Start of the value name (case insensitive)
+            max_results: Maximum number of results to return
+            
+        Returns:
+            DataFrame with matching values, in alphabetical order of name
+            
+        Raises:
+            ValueError: If data not loaded
+        """
+        if self.data is None:
+            raise ValueError("Data not loaded, call load_data() first")
+
+        return self.data.iloc[self.search_index('name').prefix(prefix, max_results)]
+
+    def suggest_values(
+        self,
+        query: str,
+        max_results: int = 10,
+        min_similarity: float = 0.3,
+        include_descriptions: bool = False
+    ) -> pd.DataFrame:
+        """
+        Find the values closest to a possibly misspelled name.
+        
+        Values are ranked by trigram similarity between the query and their
+        name (or description, whichever is closer).
+        
+        Args:
+            query: Text to match
+            max_results: Maximum number of results to return
+            min_similarity: Minimum similarity, between 0 and 1
+            include_descriptions: If True, also match against the descriptions
+            
+        Returns:
+            DataFrame with the best matches first and a 'similarity' column
+            
+        Raises:
+            ValueError: If data not loaded
+        """
+        if self.data is None:
+            raise ValueError("Data not loaded, call load_data() first")
+
+        best = np.zeros(len(self.data))
+        for column in self._search_columns(include_descriptions):
+            rows, similarity = self.search_index(column).similar(query, max_results, min_similarity)
+            best[rows] = np.maximum(best[rows], similarity)
+
+        rows = np.flatnonzero(best)
+        rows = rows[np.lexsort((rows, -best[rows]))][:max_results]
+        return self.data.iloc[rows].assign(similarity=best[rows])
 
     def find_related_values(
         self,
@@ -201,7 +317,8 @@ class ValueProcessor:
             max_results: Maximum number of results to return
             
         Returns:
-            DataFrame with related values
+            DataFrame with related values, sorted by decreasing percentage;
+            ties keep siblings before children, in row order
             
         Raises:
             ValueError: If data not loaded
@@ -210,33 +327,85 @@ class ValueProcessor:
             raise ValueError("Data not loaded, call load_data() first")
 
         # Find the value (case insensitive)
-        target = self.data[self.data['name'].str.lower() == value_name.lower()]
+        index = self.index
+        target = index.find_name(value_name)
 
-        if target.empty:
+        if not len(target):
             logger.warning(f"Value '{value_name}' not found")
             return pd.DataFrame()
 
-        target_row = target.iloc[0]
-        target_id = target_row['cluster_id']
+        return self._related_rows(target[0]).head(max_results)
 
-        # Find siblings (values with the same parent)
-        parent_id = target_row['parent_cluster_id']
-        if pd.notna(parent_id):
-            siblings = self.data[
-                (self.data['parent_cluster_id'] == parent_id) &
-                (self.data['cluster_id'] != target_id)
-            ]
-        else:
-            siblings = pd.DataFrame()
+    def find_related_values_many(
+        self,
+        value_names: List[str],
+        max_results: int = 5
+    ) -> pd.DataFrame:
+        """
+        Find values related to each of several values by name.
+        
+        This is the batch form of find_related_values: the siblings and
+        children of all values are gathered first, then sorted and cut to
+        max_results per value in a single pass.
+        
+        Args:
+            value_names: Names of the values to find relations for
+            max_results: Maximum number of results per value
+            
+        Returns:
+            DataFrame with a 'query' column holding the value name, followed
+            by the columns of the related values; rows are grouped by query,
+            in the order of value_names, and sorted as by find_related_values
+            
+        Raises:
+            ValueError: If data not loaded
+        """
+        if self.data is None:
+            raise ValueError("Data not loaded, call load_data() first")
+
+        targets = self._resolve_names(value_names)
+        found = np.flatnonzero(targets >= 0)
+        items, rows = self.index.related(targets[found])
+        items = found[items]
+
+        # Sort by query, then by decreasing percentage, and keep the first results of each query
+        pct = self.data['pct_total_occurrences'].to_numpy(dtype=np.float64)[rows]
+        order = np.lexsort((-pct, items))
+        items, rows = items[order], rows[order]
+        starts = np.searchsorted(items, items)
+        keep = np.arange(len(items)) - starts < max_results
 
-        # Find children
-        children = self.data[self.data['parent_cluster_id'] == target_id]
+        return self._query_frame(value_names, items[keep], rows[keep])
 
-        # Combine and sort by percentage
-        related = pd.concat([siblings, children])
-        related = related.sort_values('pct_total_occurrences', ascending=False)
+    def _related_rows(self, target: int) -> pd.DataFrame:
+        """Get the siblings and children of a row, sorted by percentage."""
+        _, rows = self.index.related(np.array([target]))
+        related = self.data.iloc[rows]
+        # Stable, so that ties are ordered as in find_related_values_many
+        return related.sort_values('pct_total_occurrences', ascending=False, kind='stable')
 
-        return related.head(max_results)
+    def _resolve_names(self, value_names: List[str]) -> np.ndarray:
+        """
+        Look up the first row matching each name, case-insensitively.
+        
+        Returns:
+            Row position per name, -1 for names that are not found
+        """
+        index = self.index
+        targets = np.full(len(value_names), -1, dtype=np.int64)
+        for i, value_name in enumerate(value_names):
+            matches = index.find_name(value_name)
+            if len(matches):
+                targets[i] = matches[0]
+            else:
+                logger.warning(f"Value '{value_name}' not found")
+        return targets
+
+    def _query_frame(self, value_names: List[str], items: np.ndarray, rows: np.ndarray) -> pd.DataFrame:
+        """Select rows of the data and label each with the name it answers."""
+        frame = self.data.iloc[rows].reset_index(drop=True)
+        frame.insert(0, 'query', np.asarray(value_names, dtype=object)[items])
+        return frame
 
     def get_value_path(self, value_name: str) -> List[Dict[str, str]]:
         """
@@ -255,32 +424,85 @@ class ValueProcessor:
             raise ValueError("Data not loaded, call load_data() first")
 
         # Find the value
-        target = self.data[self.data['name'].str.lower() == value_name.lower()]
+        index = self.index
+        target = index.find_name(value_name)
 
-        if target.empty:
+        if not len(target):
             raise ValueError(f"Value '{value_name}' not found")
 
-        target_row = target.iloc[0]
-        path = [self._row_to_dict(target_row)]
+        # Walk up the parent pointers to the root
+        path = []
+        current = int(target[0])
+        while current != NO_PARENT:
+            if current == MISSING_PARENT:
+                raise ValueError(
+                    f"Parent '{self.data['parent_cluster_id'].iat[path[-1]]}' of value "
+                    f"'{self.data['name'].iat[path[-1]]}' not found"
+                )
+            path.append(current)
+            current = int(index.parent[current])
+
+        return [self._row_to_dict(self.data.iloc[i]) for i in reversed(path)]
+
+    def get_value_paths(self, value_names: List[str]) -> pd.DataFrame:
+        """
+        Get the full paths to several values in the hierarchy.
+        
+        This is the batch form of get_value_path: the parent pointers of all
+        values are followed together, one level at a time. Unlike
+        get_value_path, names that are not found are skipped, and the path of
+        a value whose ancestor is missing from the data starts at its highest
+        known ancestor. Values on a parent cycle have no path. All of these are
+        logged as warnings.
+        
+        Args:
+            value_names: Names of the values
+            
+        Returns:
+            DataFrame with one row per node of each path: a 'query' column
+            holding the value name and a 'depth' column (0 for the top of the
+            path), followed by the columns of the node; rows are grouped by
+            query, in the order of value_names, from the top of the path down
+            
+        Raises:
+            ValueError: If data not loaded
+        """
+        if self.data is None:
+            raise ValueError("Data not loaded, call load_data() first")
+
+        index = self.index
+        targets = self._resolve_names(value_names)
+        found = np.flatnonzero(targets >= 0)
+
+        items, rows = index.ancestors(targets[found])
+        items = found[items]
+
+        # Report paths that do not end at a root
+        starts = np.flatnonzero(np.r_[True, items[1:] != items[:-1]]) if len(items) else items
+        for item, top in zip(items[starts].tolist(), rows[starts].tolist()):
+            if index.parent[top] == MISSING_PARENT:
+                logger.warning(
+                    f"Path to value '{value_names[item]}' starts below missing parent "
+                    f"'{self.data['parent_cluster_id'].iat[top]}'"
+                )
 
-        # Walk up the tree to the root
-        current_parent = target_row['parent_cluster_id']
-        while pd.notna(current_parent):
-            parent_row = self.data[self.data['cluster_id'] == current_parent].iloc[0]
-            path.insert(0, self._row_to_dict(parent_row))
-            current_parent = parent_row['parent_cluster_id']
+        for item in np.setdiff1d(found, items).tolist():
+            logger.warning(f"Value '{value_names[item]}' is on a parent cycle")
 
-        return path
+        frame = self._query_frame(value_names, items, rows)
+        frame.insert(1, 'depth', np.arange(len(items)) - np.repeat(starts, np.diff(np.r_[starts, len(items)])))
+        return frame
 
     def _row_to_dict(self, row: pd.Series) -> Dict[str, str]:
-        """Convert a DataFrame row to a dictionary with selected fields."""
-        return {
+        """Convert a DataFrame row to a dictionary with selected fields, as Python scalars."""
+        fields = {
             'id': row['cluster_id'],
             'name': row['name'],
             'description': row['description'],
             'level': row['level'],
-            'percentage': row['pct_total_occurrences']
+            'percentage': as_float64(row['pct_total_occurrences']).item()
         }
+        return {key: value.item() if isinstance(value, np.generic) else value for key, value in fields.items()}
 
     def get_category_distribution(self) -> Dict[str, float]:
         """
@@ -298,13 +520,46 @@ class ValueProcessor:
         if self.top_level_categories is None:
             self._cache_top_categories()
 
+        index = self.index
         distribution = {}
         for cat_id, cat_name in self.top_level_categories.items():
-            # Find all descendants of this category
-            hierarchy = self.get_value_hierarchy(cat_id)
-
-            # Sum the percentages
-            total_pct = hierarchy['pct_total_occurrences'].sum()
-            distribution[cat_name] = total_pct
+            # Sum the percentages over the subtree interval of the category
+            distribution[cat_name] = index.subtree_sum(index.position[cat_id])
 
         return distribution
+
+    def get_subtree_totals(self) -> pd.Series:
+        """
+        Get the total percentage of every value together with its descendants.
+        
+        Returns:
+            Series of subtree totals indexed by cluster ID
+            
+        Raises:
+            ValueError: If data not loaded
+        """
+        if self.data is None:
+            raise ValueError("Data not loaded, call load_data() first")
+
+        return pd.Series(self.index.subtree_sums(), index=self.data['cluster_id'], name='subtree_pct')
+
+    def is_descendant(self, value_id: str, ancestor_id: str) -> bool:
+        """
+        Check whether a value is in the hierarchy below another value.
+        
+        Args:
+            value_id: ID of the value
+            ancestor_id: ID of the possible ancestor
+            
+        Returns:
+            True if the value is the ancestor itself or one of its descendants
+            
+        Raises:
+            ValueError: If data not loaded or either ID is not found
+        """
+        index = self.index
+        for cluster_id in (value_id, ancestor_id):
+            if cluster_id not in index.position:
+                raise ValueError(f"Value ID '{cluster_id}' not found")
+
+        return index.is_descendant(index.position[value_id], index.position[ancestor_id])